@@ -3,11 +3,13 @@
 Build script for TCPD - Tester's Comprehensive PC Diagnostics
 
 Usage:
-    python build/build.py
+    python build/build.py           # Incremental build, reuses PyInstaller's cache
+    python build/build.py --clean   # Full rebuild from scratch
 
 This creates a portable executable in the dist/ folder.
 """
 
+import argparse
 import subprocess
 import shutil
 from pathlib import Path
@@ -15,10 +17,18 @@ import sys
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Build the TCPD portable executable")
+    parser.add_argument(
+        "--clean", action="store_true",
+        help="Discard PyInstaller's cache and previous build files before building"
+    )
+    args = parser.parse_args()
+
     # Get paths
     project_root = Path(__file__).parent.parent
     spec_file = project_root / "build" / "pyinstaller.spec"
     dist_dir = project_root / "dist"
+    build_dir = project_root / "build" / "tcpd"
 
     print("=" * 60)
     print("TCPD - Build Script")
@@ -32,32 +42,47 @@ def main():
         print("[ERROR] PyInstaller not found. Install with: pip install pyinstaller")
         sys.exit(1)
 
-    # Clean previous builds
-    print("\n[1/3] Cleaning previous builds...")
+    # Check the scanner registry. The executable only bundles the scanner
+    # modules it lists, and reports use its metadata before scanners load.
+    print("\n[1/4] Checking scanner registry...")
+    sys.path.insert(0, str(project_root))
+    from src.scanners.registry import SCANNERS, check_registry
+    problems = check_registry()
+    if problems:
+        print("[ERROR] src/scanners/registry.py is out of date:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print(f"[OK] {len(SCANNERS)} scanners registered")
+
+    # Clean previous builds. Keeping the work directory and PyInstaller's
+    # cache lets unchanged modules and binaries skip re-analysis.
+    print("\n[2/4] Cleaning previous builds...")
     if dist_dir.exists():
         shutil.rmtree(dist_dir)
-    build_dir = project_root / "build" / "tcpd"
-    if build_dir.exists():
+    if args.clean and build_dir.exists():
         shutil.rmtree(build_dir)
 
     # Run PyInstaller
-    print("\n[2/3] Building executable...")
-    result = subprocess.run(
-        [
-            sys.executable, "-m", "PyInstaller",
-            "--clean",
-            "--noconfirm",
-            str(spec_file)
-        ],
-        cwd=str(project_root)
-    )
+    print("\n[3/4] Building executable...")
+    command = [
+        sys.executable, "-m", "PyInstaller",
+        "--noconfirm",
+        "--workpath", str(build_dir),
+        "--distpath", str(dist_dir),
+    ]
+    if args.clean:
+        command.append("--clean")
+    command.append(str(spec_file))
+
+    result = subprocess.run(command, cwd=str(project_root))
 
     if result.returncode != 0:
         print("\n[ERROR] Build failed!")
         sys.exit(1)
 
     # Verify output
-    print("\n[3/3] Verifying build...")
+    print("\n[4/4] Verifying build...")
     exe_path = dist_dir / "tcpd.exe"
     if exe_path.exists():
         size_mb = exe_path.stat().st_size / (1024 * 1024)
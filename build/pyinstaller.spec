@@ -13,6 +13,14 @@ from pathlib import Path
 
 # Project root
 project_root = Path(SPECPATH).parent
+sys.path.insert(0, str(project_root))
+
+
+def scanner_modules():
+    """Module names of all registered scanners."""
+    from src.scanners.registry import module_names
+    return module_names()
+
 
 block_cipher = None
 
@@ -39,11 +47,10 @@ a = Analysis(
         'GPUtil',
         'numpy',
         # CLI
-        'typer',
         'rich',
-        'click',
         'yaml',
         'pydantic',
+        'orjson',
         'questionary',
         # Our modules
         'src',
@@ -57,41 +64,20 @@ a = Analysis(
         'src.core.engine',
         'src.core.scanner',
         'src.core.result',
+        'src.core.cache',
         'src.scanners',
+        'src.scanners.registry',
         'src.scanners.hardware',
-        'src.scanners.hardware.cpu',
-        'src.scanners.hardware.gpu',
-        'src.scanners.hardware.memory',
-        'src.scanners.hardware.storage',
-        'src.scanners.hardware.battery',
-        'src.scanners.hardware.motherboard',
-        'src.scanners.hardware.network_adapters',
-        'src.scanners.hardware.peripherals',
         'src.scanners.security',
-        'src.scanners.security.antivirus',
-        'src.scanners.security.firewall',
-        'src.scanners.security.windows_update',
-        'src.scanners.security.ports',
-        'src.scanners.security.processes',
-        'src.scanners.security.startup',
-        'src.scanners.security.services',
-        'src.scanners.security.users',
-        'src.scanners.security.bitlocker',
-        'src.scanners.security.secure_boot',
-        'src.scanners.security.uac',
-        'src.scanners.security.password_policy',
-        'src.scanners.security.event_log',
         'src.scanners.network',
-        'src.scanners.network.connectivity',
-        'src.scanners.network.wifi',
-        'src.scanners.network.dns',
-        'src.scanners.network.speed_test',
         'src.scanners.system',
-        'src.scanners.system.os_info',
+        # Scanner modules are only imported dynamically, so list them from the registry
+        *scanner_modules(),
         'src.stress',
         'src.stress.cpu_stress',
         'src.stress.gpu_stress',
         'src.stress.memory_stress',
+        'src.stress.pool',
         'src.monitor',
         'src.info',
         'src.reports',
@@ -100,6 +86,7 @@ a = Analysis(
         'src.utils.wmi_helper',
         'src.utils.registry',
         'src.utils.dependency_installer',
+        'src.utils.subprocess_pool',
     ],
     hookspath=[],
     hooksconfig={},
@@ -14,22 +14,25 @@ Usage:
 
 import sys
 import os
+import multiprocessing
 
 # Ensure we can import from src
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 
 if __name__ == "__main__":
+    # Required for stress-test worker processes in frozen builds
+    multiprocessing.freeze_support()
+
     try:
         # Fix sys.argv for PyInstaller - when double-clicked, only keep the exe name
-        # Filter out any arguments that look like the exe path itself
-        if len(sys.argv) > 1:
-            filtered_args = [sys.argv[0]]
-            for arg in sys.argv[1:]:
-                # Skip if arg is the exe path (happens with some PyInstaller builds)
-                if not (arg.endswith('.exe') and os.path.isfile(arg)):
-                    filtered_args.append(arg)
-            sys.argv = filtered_args
+        # Filter out any arguments that are the exe path itself (happens with some
+        # PyInstaller builds). Script runs never need this, so skip it entirely.
+        if getattr(sys, 'frozen', False) and len(sys.argv) > 1:
+            sys.argv[1:] = [
+                arg for arg in sys.argv[1:]
+                if not (arg.endswith('.exe') and os.path.isfile(arg))
+            ]
 
         from src.cli.app import main
         main()
@@ -1,123 +1,31 @@
 """Main CLI application."""
-import typer
-from typing import Optional
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from pathlib import Path
 import sys
 
 from ..core.engine import ScanEngine
+from ..core.cache import ResultCache
 from ..core.result import DiagnosticsReport
 from ..utils.admin import is_admin, request_elevation
 from .ui.console import (
     console, print_banner, print_admin_status,
-    print_report, print_error, print_success, print_info, print_warning,
-    create_progress
+    print_scan_result, print_summary, print_dependency_status,
+    print_error, print_success, print_info, print_warning,
+    create_progress, scan_progress_callback, stress_progress_updater
 )
-
-# Import all scanners
-from ..scanners.hardware.cpu import CPUScanner
-from ..scanners.hardware.gpu import GPUScanner
-from ..scanners.hardware.memory import MemoryScanner
-from ..scanners.hardware.storage import StorageScanner
-from ..scanners.hardware.battery import BatteryScanner
-from ..scanners.hardware.motherboard import MotherboardScanner
-from ..scanners.hardware.network_adapters import NetworkAdaptersScanner
-from ..scanners.hardware.peripherals import PeripheralsScanner
-from ..scanners.security.antivirus import AntivirusScanner
-from ..scanners.security.firewall import FirewallScanner
-from ..scanners.security.windows_update import WindowsUpdateScanner
-from ..scanners.security.ports import PortsScanner
-from ..scanners.security.processes import ProcessesScanner
-from ..scanners.security.startup import StartupScanner
-from ..scanners.security.services import ServicesScanner
-from ..scanners.security.users import UsersScanner
-from ..scanners.security.bitlocker import BitLockerScanner
-from ..scanners.security.secure_boot import SecureBootScanner
-from ..scanners.security.uac import UACScanner
-from ..scanners.security.password_policy import PasswordPolicyScanner
-from ..scanners.security.event_log import EventLogScanner
-from ..scanners.system.os_info import OSInfoScanner
-# Network scanners
-from ..scanners.network.connectivity import ConnectivityScanner
-from ..scanners.network.wifi import WiFiScanner
-from ..scanners.network.dns import DNSScanner
-from ..scanners.network.speed_test import SpeedTestScanner
-
-
-app = typer.Typer(
-    name="tcpd",
-    help="TCPD - Tester's Comprehensive PC Diagnostics",
-    add_completion=False,
-    invoke_without_command=True
-)
-
-
-@app.callback()
-def main_callback(ctx: typer.Context):
-    """PC Diagnostics Tool - Run without arguments for interactive mode."""
-    if ctx.invoked_subcommand is None:
-        # No command specified, launch interactive mode
-        from .interactive import run_interactive_mode
-        run_interactive_mode()
+from ..scanners.registry import SCANNERS, load_scanners
 
 
-def get_all_scanners():
-    """Get instances of all available scanners."""
-    return [
-        # Hardware
-        CPUScanner(),
-        GPUScanner(),
-        MemoryScanner(),
-        StorageScanner(),
-        BatteryScanner(),
-        MotherboardScanner(),
-        NetworkAdaptersScanner(),
-        PeripheralsScanner(),
-        # Security
-        AntivirusScanner(),
-        FirewallScanner(),
-        WindowsUpdateScanner(),
-        PortsScanner(),
-        ProcessesScanner(),
-        StartupScanner(),
-        ServicesScanner(),
-        UsersScanner(),
-        BitLockerScanner(),
-        SecureBootScanner(),
-        UACScanner(),
-        PasswordPolicyScanner(),
-        EventLogScanner(),
-        # Network
-        ConnectivityScanner(),
-        WiFiScanner(),
-        DNSScanner(),
-        SpeedTestScanner(),
-        # System
-        OSInfoScanner(),
-    ]
-
-
-@app.command()
 def scan(
-    mode: str = typer.Option(
-        "quick",
-        "--mode", "-m",
-        help="Scan mode: quick, full, hardware, security, network"
-    ),
-    output: Optional[Path] = typer.Option(
-        None,
-        "--output", "-o",
-        help="Output file path for JSON export"
-    ),
-    no_elevate: bool = typer.Option(
-        False,
-        "--no-elevate",
-        help="Don't request admin elevation"
-    ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose", "-v",
-        help="Show detailed output"
-    )
+    mode: str = "quick",
+    output: Optional[Path] = None,
+    no_elevate: bool = False,
+    verbose: bool = False,
+    jobs: int = ScanEngine.DEFAULT_MAX_WORKERS,
+    no_cache: bool = False,
+    clear_cache: bool = False
 ):
     """Run PC diagnostics scan."""
 
@@ -129,77 +37,79 @@ def scan(
             return  # Will restart with admin
         print_warning("Running without admin - some checks will be limited")
 
-    admin_status = is_admin()
-
     # Print header
     print_banner()
     print_admin_status(admin_status)
 
     # Initialize engine
-    engine = ScanEngine(is_admin=admin_status)
-    engine.register_scanners(get_all_scanners())
+    if clear_cache:
+        ResultCache().clear()
+    cache = None if no_cache else ResultCache()
+    engine = ScanEngine(is_admin=admin_status, max_workers=jobs, cache=cache)
+    engine.register_scanners(load_scanners(mode))
 
     print_info(f"Starting {mode} scan with {engine.scanner_count} scanners...")
     console.print()
 
-    # Run scan with progress
-    with create_progress() as progress:
+    # Run scan with progress, printing each result above the bar as it finishes
+    with create_progress(transient=True) as progress:
         task = progress.add_task(f"Running {mode} scan...", total=100)
 
-        def update_progress(current: int, total: int, name: str):
-            if total > 0:
-                pct = (current / total) * 100
-                progress.update(task, completed=pct, description=f"Scanning: {name}")
+        update_progress = scan_progress_callback(progress, task, "Scanning")
+        for result in engine.iter_scan(mode=mode, progress_callback=update_progress):
+            print_scan_result(result)
+
+    report = engine.report
+
+    # Export to JSON in the background while the report renders
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        saved = writer.submit(report.save_json, str(output)) if output else None
 
-        report = engine.run_scan(mode=mode, progress_callback=update_progress)
+        # Display results
+        print_summary(report)
 
-    # Display results
-    print_report(report)
+        if cache and cache.hits:
+            print_info(f"Result cache: {cache.hits} hit(s), {cache.misses} miss(es) (use --no-cache to force a rescan)")
 
-    # Export to JSON if requested
-    if output:
-        report.save_json(str(output))
-        print_success(f"Report saved to {output}")
+    if saved:
+        try:
+            saved.result()
+            print_success(f"Report saved to {output}")
+        except Exception as e:
+            print_error(f"Could not save report to {output}: {e}")
 
 
-@app.command()
 def quick():
     """Run quick scan (shortcut for --mode quick)."""
     scan(mode="quick")
 
 
-@app.command()
 def full():
     """Run full scan (shortcut for --mode full)."""
     scan(mode="full")
 
 
-@app.command()
 def hardware():
     """Run hardware-only scan."""
     scan(mode="hardware")
 
 
-@app.command()
 def security():
     """Run security-only scan."""
     scan(mode="security")
 
 
-@app.command()
 def network():
     """Run network-only scan."""
     scan(mode="network")
 
 
-@app.command()
 def interactive():
     """Launch interactive TUI mode with arrow-key navigation."""
     from .interactive import run_interactive_mode
     run_interactive_mode()
 
 
-@app.command()
 def version():
     """Show version information."""
     from .. import __version__
@@ -207,54 +117,36 @@ def version():
     console.print("Windows 10/11 compatible")
 
 
-@app.command()
 def list_scanners():
     """List all available scanners."""
+    from rich.table import Table
+
     print_banner()
-    scanners = get_all_scanners()
 
-    from rich.table import Table
     table = Table(title="Available Scanners")
     table.add_column("Name", style="cyan")
     table.add_column("Category", style="green")
     table.add_column("Admin Required", style="yellow")
 
-    for scanner in scanners:
-        admin_req = "Yes" if scanner.requires_admin else "No"
-        table.add_row(scanner.name, scanner.category, admin_req)
+    for spec in SCANNERS:
+        admin_req = "Yes" if spec.requires_admin else "No"
+        table.add_row(spec.name, spec.category, admin_req)
 
     console.print(table)
 
 
-@app.command()
 def install_deps():
     """Install required Python dependencies."""
     from ..utils.dependency_installer import (
         get_dependency_status, install_all_requirements, upgrade_pip
     )
-    from rich.table import Table
 
     print_banner()
     console.print("\n[bold cyan]Dependency Manager[/bold cyan]\n")
 
     # Get current status
     status = get_dependency_status()
-
-    table = Table(title="Dependency Status", show_header=True)
-    table.add_column("Package", style="cyan")
-    table.add_column("Status", style="white")
-
-    for import_name, pip_name in status['installed_list']:
-        table.add_row(pip_name, "[green][Installed][/green]")
-
-    for import_name, pip_name in status['missing_list']:
-        table.add_row(pip_name, "[red][Missing][/red]")
-
-    console.print(table)
-    console.print()
-    console.print(f"Installed: [green]{status['installed']}[/green] / {status['total']}")
-    console.print(f"Missing: [red]{status['missing']}[/red]")
-    console.print()
+    print_dependency_status(status)
 
     if status['missing'] == 0:
         print_success("All dependencies are installed!")
@@ -270,10 +162,7 @@ def install_deps():
         print_error(msg)
 
 
-@app.command()
-def stress_cpu(
-    duration: int = typer.Option(60, "--duration", "-d", help="Test duration in seconds")
-):
+def stress_cpu(duration: int = 60, workers: Optional[int] = None):
     """Run CPU stress test."""
     from ..stress import CPUStressTest
 
@@ -281,17 +170,17 @@ def stress_cpu(
     console.print("\n[bold cyan]CPU Stress Test[/bold cyan]\n")
 
     stress = CPUStressTest()
-    console.print(f"Stressing {stress.cpu_count} CPU cores for {duration} seconds...\n")
+    console.print(f"Stressing CPU with {stress.describe_workers(workers)} for {duration} seconds...\n")
 
     with create_progress() as progress:
         task = progress.add_task("CPU Stress Test", total=duration)
+        update_bar = stress_progress_updater(progress, task)
 
         def cpu_progress(elapsed, stats):
-            progress.update(task, completed=elapsed)
             temp_str = f"{stats['temperature']:.1f}C" if stats.get('temperature') else "N/A"
-            progress.update(task, description=f"CPU: {stats['utilization']:.0f}% | Temp: {temp_str}")
+            update_bar(elapsed, f"CPU: {stats['utilization']:.0f}% | Temp: {temp_str}")
 
-        result = stress.run(duration=duration, progress_callback=cpu_progress)
+        result = stress.run(duration=duration, cores=workers, progress_callback=cpu_progress)
 
     console.print()
     if result.passed:
@@ -306,10 +195,7 @@ def stress_cpu(
         console.print(f"  Max Temperature: {result.max_temperature:.1f}C")
 
 
-@app.command()
-def stress_gpu(
-    duration: int = typer.Option(60, "--duration", "-d", help="Test duration in seconds")
-):
+def stress_gpu(duration: int = 60):
     """Run GPU stress test."""
     from ..stress import GPUStressTest
 
@@ -321,12 +207,12 @@ def stress_gpu(
 
     with create_progress() as progress:
         task = progress.add_task("GPU Stress Test", total=duration)
+        update_bar = stress_progress_updater(progress, task)
 
         def gpu_progress(elapsed, stats):
-            progress.update(task, completed=elapsed)
             temp_str = f"{stats['temperature']}C" if stats.get('temperature') else "N/A"
             util_str = f"{stats['utilization']}%" if stats.get('utilization') else "N/A"
-            progress.update(task, description=f"GPU: {util_str} | Temp: {temp_str}")
+            update_bar(elapsed, f"GPU: {util_str} | Temp: {temp_str}")
 
         result = stress.run(duration=duration, progress_callback=gpu_progress)
 
@@ -342,10 +228,7 @@ def stress_gpu(
         console.print(f"  Max Temperature: {result.max_temperature:.1f}C")
 
 
-@app.command()
-def stress_memory(
-    percentage: int = typer.Option(70, "--percent", "-p", help="Percentage of RAM to test")
-):
+def stress_memory(percentage: int = 70):
     """Run memory stress test."""
     from ..stress import MemoryStressTest
 
@@ -357,10 +240,10 @@ def stress_memory(
 
     with create_progress() as progress:
         task = progress.add_task("Memory Stress Test", total=30)
+        update_bar = stress_progress_updater(progress, task)
 
         def mem_progress(elapsed, stats):
-            progress.update(task, completed=elapsed)
-            progress.update(task, description=f"RAM: {stats['memory_percent']:.0f}% | Errors: {stats['errors']}")
+            update_bar(elapsed, f"RAM: {stats['memory_percent']:.0f}% | Errors: {stats['errors']}")
 
         result = stress.run(duration=30, percentage=percentage, progress_callback=mem_progress)
 
@@ -375,7 +258,6 @@ def stress_memory(
     console.print(f"  Errors Found: {result.errors_found}")
 
 
-@app.command()
 def monitor():
     """Launch live system monitor."""
     from ..monitor import LiveMonitor
@@ -384,7 +266,6 @@ def monitor():
     mon.run()
 
 
-@app.command()
 def hwinfo():
     """Display detailed hardware information."""
     from ..info import HardwareInfo
@@ -396,9 +277,80 @@ def hwinfo():
     hw.display_all()
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        prog="tcpd",
+        description="TCPD - Tester's Comprehensive PC Diagnostics. "
+                    "Run without arguments for interactive mode."
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    cmd = commands.add_parser("scan", help="Run PC diagnostics scan")
+    cmd.add_argument("--mode", "-m", default="quick",
+                     help="Scan mode: quick, full, hardware, security, network")
+    cmd.add_argument("--output", "-o", type=Path, default=None,
+                     help="Output file path for JSON export")
+    cmd.add_argument("--no-elevate", action="store_true",
+                     help="Don't request admin elevation")
+    cmd.add_argument("--verbose", "-v", action="store_true",
+                     help="Show detailed output")
+    cmd.add_argument("--jobs", "-j", type=int, default=ScanEngine.DEFAULT_MAX_WORKERS,
+                     help="Maximum scanners to run concurrently (1 = sequential)")
+    cmd.add_argument("--no-cache", action="store_true",
+                     help="Re-run every scanner instead of reusing cached results")
+    cmd.add_argument("--clear-cache", action="store_true",
+                     help="Delete all cached scan results before scanning")
+    cmd.set_defaults(func=scan)
+
+    for name, func in (
+        ("quick", quick),
+        ("full", full),
+        ("hardware", hardware),
+        ("security", security),
+        ("network", network),
+        ("interactive", interactive),
+        ("version", version),
+        ("list-scanners", list_scanners),
+        ("install-deps", install_deps),
+        ("monitor", monitor),
+        ("hwinfo", hwinfo),
+    ):
+        commands.add_parser(name, help=func.__doc__.rstrip(".")).set_defaults(func=func)
+
+    cmd = commands.add_parser("stress-cpu", help="Run CPU stress test")
+    cmd.add_argument("--duration", "-d", type=int, default=60, help="Test duration in seconds")
+    cmd.add_argument(
+        "--workers", "-w", type=int, default=None,
+        help="Worker processes (default: one per physical core)"
+    )
+    cmd.set_defaults(func=stress_cpu)
+
+    cmd = commands.add_parser("stress-gpu", help="Run GPU stress test")
+    cmd.add_argument("--duration", "-d", type=int, default=60, help="Test duration in seconds")
+    cmd.set_defaults(func=stress_gpu)
+
+    cmd = commands.add_parser("stress-memory", help="Run memory stress test")
+    cmd.add_argument("--percent", "-p", dest="percentage", type=int, default=70,
+                     help="Percentage of RAM to test")
+    cmd.set_defaults(func=stress_memory)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point."""
-    app()
+    args = vars(build_parser().parse_args(argv))
+    args.pop("command")
+    func = args.pop("func", None)
+
+    if func is None:
+        # No command specified, launch interactive mode
+        from .interactive import run_interactive_mode
+        run_interactive_mode()
+        return
+
+    func(**args)
 
 
 if __name__ == "__main__":
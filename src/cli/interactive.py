@@ -1,4 +1,5 @@
 """Interactive TUI mode with arrow-key navigation."""
+import functools
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -12,44 +13,23 @@ except ImportError:
     QStyle = None
     QUESTIONARY_AVAILABLE = False
 
+from rich.table import Table
+
 from ..core.engine import ScanEngine
 from ..utils.admin import is_admin, request_elevation
 from .ui.console import (
     console, print_banner, print_admin_status, print_report,
     print_error, print_success, print_info, print_warning,
-    create_progress, clear_screen, wait_for_key, prompt_yes_no,
-    prompt_filename, print_menu_header
+    create_progress, scan_progress_callback, stress_progress_updater,
+    clear_screen, wait_for_key, prompt_yes_no,
+    prompt_filename, print_menu_header, print_dependency_status
 )
 
-# Import all scanners
-from ..scanners.hardware.cpu import CPUScanner
-from ..scanners.hardware.gpu import GPUScanner
-from ..scanners.hardware.memory import MemoryScanner
-from ..scanners.hardware.storage import StorageScanner
-from ..scanners.hardware.battery import BatteryScanner
-from ..scanners.hardware.motherboard import MotherboardScanner
-from ..scanners.hardware.network_adapters import NetworkAdaptersScanner
-from ..scanners.hardware.peripherals import PeripheralsScanner
-from ..scanners.security.antivirus import AntivirusScanner
-from ..scanners.security.firewall import FirewallScanner
-from ..scanners.security.windows_update import WindowsUpdateScanner
-from ..scanners.security.ports import PortsScanner
-from ..scanners.security.processes import ProcessesScanner
-from ..scanners.security.startup import StartupScanner
-from ..scanners.security.services import ServicesScanner
-from ..scanners.security.users import UsersScanner
-from ..scanners.security.bitlocker import BitLockerScanner
-from ..scanners.security.secure_boot import SecureBootScanner
-from ..scanners.security.uac import UACScanner
-from ..scanners.security.password_policy import PasswordPolicyScanner
-from ..scanners.security.event_log import EventLogScanner
-from ..scanners.system.os_info import OSInfoScanner
-# Network scanners
-from ..scanners.network.connectivity import ConnectivityScanner
-from ..scanners.network.wifi import WiFiScanner
-from ..scanners.network.dns import DNSScanner
-from ..scanners.network.speed_test import SpeedTestScanner
+from ..scanners.registry import get_scanner, load_scanners
+
 
+# Divider shared by all menus (separators hold no per-menu state)
+MENU_SEPARATOR = questionary.Separator("-" * 50) if QUESTIONARY_AVAILABLE else None
 
 # Custom style for questionary (only create if available)
 CUSTOM_STYLE = None
@@ -65,79 +45,109 @@ if QUESTIONARY_AVAILABLE and QStyle:
         ('instruction', 'fg:gray'),
     ])
 
-def get_menu_choices():
-    """Get menu choices (with separator if questionary available)."""
-    choices = [
-        {"name": "Quick Scan              (~30 seconds)", "value": "quick"},
-        {"name": "Full System Scan        (~2-5 minutes)", "value": "full"},
-        {"name": "Hardware Only           (CPU, GPU, RAM, Storage)", "value": "hardware"},
-        {"name": "Security Audit          (AV, Firewall, Ports, Startup)", "value": "security"},
-        {"name": "Network Tests           (Connectivity, WiFi, DNS, Speed)", "value": "network_menu"},
-    ]
-    if QUESTIONARY_AVAILABLE:
-        choices.append(questionary.Separator("-" * 50))
-    choices.extend([
-        {"name": "Stress Tests & Monitoring (CPU/GPU/RAM stress, live monitor)", "value": "stress_menu"},
-        {"name": "Export Report            (JSON, CSV, HTML)", "value": "export_menu"},
-        {"name": "Install Dependencies     (pip packages)", "value": "install_deps"},
-    ])
-    if QUESTIONARY_AVAILABLE:
-        choices.append(questionary.Separator("-" * 50))
-    choices.extend([
-        {"name": "View System Info", "value": "info"},
-        {"name": "Exit", "value": "exit"},
-    ])
+# Static help text for the export menu
+EXPORT_HELP = """\
+  1. Run any scan (Quick, Full, Hardware, Security, Network)
+  2. When prompted after scan, choose to save the report
+  3. The report is saved as JSON by default
+
+[cyan]Export formats available:[/cyan]
+  - JSON: Default format, full data
+  - CSV:  Spreadsheet compatible, findings only
+  - HTML: Visual report for browsers
+"""
+
+
+def _build_choices(*groups):
+    """
+    Build questionary Choice objects from groups of (title, value) pairs.
+
+    Groups are separated by a divider line.
+    """
+    choices = []
+    for group in groups:
+        if choices:
+            choices.append(MENU_SEPARATOR)
+        choices.extend(questionary.Choice(title=title, value=value) for title, value in group)
     return choices
 
 
-def get_all_scanners():
-    """Get instances of all available scanners."""
-    return [
-        # Hardware
-        CPUScanner(),
-        GPUScanner(),
-        MemoryScanner(),
-        StorageScanner(),
-        BatteryScanner(),
-        MotherboardScanner(),
-        NetworkAdaptersScanner(),
-        PeripheralsScanner(),
-        # Security
-        AntivirusScanner(),
-        FirewallScanner(),
-        WindowsUpdateScanner(),
-        PortsScanner(),
-        ProcessesScanner(),
-        StartupScanner(),
-        ServicesScanner(),
-        UsersScanner(),
-        BitLockerScanner(),
-        SecureBootScanner(),
-        UACScanner(),
-        PasswordPolicyScanner(),
-        EventLogScanner(),
-        # Network
-        ConnectivityScanner(),
-        WiFiScanner(),
-        DNSScanner(),
-        SpeedTestScanner(),
-        # System
-        OSInfoScanner(),
-    ]
+@functools.lru_cache(maxsize=1)
+def get_menu_choices():
+    """Get main menu choices (built once; requires questionary)."""
+    return _build_choices(
+        [
+            ("Quick Scan              (~30 seconds)", "quick"),
+            ("Full System Scan        (~2-5 minutes)", "full"),
+            ("Hardware Only           (CPU, GPU, RAM, Storage)", "hardware"),
+            ("Security Audit          (AV, Firewall, Ports, Startup)", "security"),
+            ("Network Tests           (Connectivity, WiFi, DNS, Speed)", "network_menu"),
+        ],
+        [
+            ("Stress Tests & Monitoring (CPU/GPU/RAM stress, live monitor)", "stress_menu"),
+            ("Export Report            (JSON, CSV, HTML)", "export_menu"),
+            ("Install Dependencies     (pip packages)", "install_deps"),
+        ],
+        [
+            ("View System Info", "info"),
+            ("Exit", "exit"),
+        ],
+    )
 
 
-def show_system_info(admin_status: bool):
-    """Display basic system information."""
-    clear_screen()
-    print_banner()
-    print_admin_status(admin_status)
+@functools.lru_cache(maxsize=1)
+def get_stress_menu_choices():
+    """Get stress test menu choices (built once; requires questionary)."""
+    return _build_choices(
+        [
+            ("View Hardware Info       (Detailed CPU/GPU/RAM specs)", "hw_info"),
+            ("Live System Monitor      (Real-time stats dashboard)", "live_monitor"),
+        ],
+        [
+            ("CPU Stress Test          (30 seconds)", "cpu_30"),
+            ("CPU Stress Test          (60 seconds)", "cpu_60"),
+            ("CPU Stress Test          (120 seconds)", "cpu_120"),
+        ],
+        [
+            ("GPU Stress Test          (30 seconds)", "gpu_30"),
+            ("GPU Stress Test          (60 seconds)", "gpu_60"),
+            ("GPU Stress Test          (120 seconds)", "gpu_120"),
+        ],
+        [
+            ("Memory Stress Test       (Test 70% of RAM)", "mem_test"),
+        ],
+        [
+            ("Back to Main Menu", "back"),
+        ],
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_network_menu_choices():
+    """Get network test menu choices (built once; requires questionary)."""
+    return _build_choices(
+        [
+            ("Full Network Scan       (All network tests)", "full_network"),
+        ],
+        [
+            ("Internet Connectivity   (Ping, DNS, HTTP checks)", "connectivity"),
+            ("WiFi Analysis           (Signal strength, security)", "wifi"),
+            ("DNS Performance         (DNS server benchmarks)", "dns"),
+            ("Speed Test              (Download speed estimate)", "speed"),
+        ],
+        [
+            ("Back to Main Menu", "back"),
+        ],
+    )
 
-    console.print("\n[bold cyan]System Information[/bold cyan]\n")
 
+@functools.lru_cache(maxsize=1)
+def _collect_system_info() -> dict:
+    """Collect basic system information (static for the life of the process)."""
     import platform
     import psutil
 
-    info = {
+    return {
         "Computer Name": platform.node(),
         "OS": f"{platform.system()} {platform.release()}",
         "OS Version": platform.version(),
@@ -148,7 +158,24 @@ def show_system_info(admin_status: bool):
         "Boot Time": datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S"),
     }
 
-    from rich.table import Table
+
+@functools.lru_cache(maxsize=1)
+def _get_hardware_info():
+    """Get the HardwareInfo instance, collecting its WMI/NVML data on first use."""
+    from ..info import HardwareInfo
+    return HardwareInfo()
+
+
+def show_system_info(admin_status: bool):
+    """Display basic system information."""
+    clear_screen()
+    print_banner()
+    print_admin_status(admin_status)
+
+    console.print("\n[bold cyan]System Information[/bold cyan]\n")
+
+    info = _collect_system_info()
+
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="white")
@@ -168,7 +195,7 @@ def run_scan(mode: str, admin_status: bool):
 
     # Initialize engine
     engine = ScanEngine(is_admin=admin_status)
-    engine.register_scanners(get_all_scanners())
+    engine.register_scanners(load_scanners(mode))
 
     print_info(f"Starting {mode} scan with {engine.scanner_count} scanners...")
     console.print()
@@ -177,11 +204,7 @@ def run_scan(mode: str, admin_status: bool):
     with create_progress() as progress:
         task = progress.add_task(f"Running {mode} scan...", total=100)
 
-        def update_progress(current: int, total: int, name: str):
-            if total > 0:
-                pct = (current / total) * 100
-                progress.update(task, completed=pct, description=f"Scanning: {name}")
-
+        update_progress = scan_progress_callback(progress, task, "Scanning")
         report = engine.run_scan(mode=mode, progress_callback=update_progress)
 
     # Display results
@@ -206,239 +229,239 @@ def run_scan(mode: str, admin_status: bool):
     wait_for_key()
 
 
-def show_stress_menu():
-    """Show sub-menu for stress testing and monitoring."""
-    from ..stress import CPUStressTest, GPUStressTest, MemoryStressTest
-    from ..monitor import LiveMonitor
-    from ..info import HardwareInfo
+def _show_hardware_info():
+    """Show detailed hardware information."""
+    clear_screen()
+    print_banner()
+    console.print("\n[bold cyan]Hardware Information[/bold cyan]\n")
+    try:
+        hw = _get_hardware_info()
+        hw.display_all()
+    except Exception as e:
+        print_error(f"Error getting hardware info: {e}")
+    wait_for_key()
 
-    while True:
-        clear_screen()
-        print_banner()
-        console.print("\n[bold cyan]Stress Tests & Monitoring[/bold cyan]\n")
 
-        choices = [
-            {"name": "View Hardware Info       (Detailed CPU/GPU/RAM specs)", "value": "hw_info"},
-            {"name": "Live System Monitor      (Real-time stats dashboard)", "value": "live_monitor"},
-        ]
-        if QUESTIONARY_AVAILABLE:
-            choices.append(questionary.Separator("-" * 50))
-        choices.extend([
-            {"name": "CPU Stress Test          (30 seconds)", "value": "cpu_30"},
-            {"name": "CPU Stress Test          (60 seconds)", "value": "cpu_60"},
-            {"name": "CPU Stress Test          (120 seconds)", "value": "cpu_120"},
-        ])
-        if QUESTIONARY_AVAILABLE:
-            choices.append(questionary.Separator("-" * 50))
-        choices.extend([
-            {"name": "GPU Stress Test          (30 seconds)", "value": "gpu_30"},
-            {"name": "GPU Stress Test          (60 seconds)", "value": "gpu_60"},
-            {"name": "GPU Stress Test          (120 seconds)", "value": "gpu_120"},
-        ])
-        if QUESTIONARY_AVAILABLE:
-            choices.append(questionary.Separator("-" * 50))
-        choices.extend([
-            {"name": "Memory Stress Test       (Test 70% of RAM)", "value": "mem_test"},
-        ])
-        if QUESTIONARY_AVAILABLE:
-            choices.append(questionary.Separator("-" * 50))
-        choices.append({"name": "Back to Main Menu", "value": "back"})
+def _run_live_monitor():
+    """Run the live system monitor."""
+    clear_screen()
+    try:
+        from ..monitor import LiveMonitor
+        monitor = LiveMonitor()
+        monitor.run()
+    except Exception as e:
+        print_error(f"Error running monitor: {e}")
+    wait_for_key()
 
-        choice = questionary.select(
-            "Select an option:",
-            choices=choices,
-            style=CUSTOM_STYLE,
-            use_shortcuts=False,
-            use_arrow_keys=True,
-        ).ask()
 
-        if choice is None or choice == "back":
-            return
+def _run_cpu_stress(duration: int):
+    """Confirm and run a CPU stress test."""
+    clear_screen()
+    print_banner()
+    console.print(f"\n[bold cyan]CPU Stress Test ({duration}s)[/bold cyan]\n")
+    print_warning("This will stress all CPU cores. Monitor your temperatures!")
+    console.print()
 
-        if choice == "hw_info":
-            clear_screen()
-            print_banner()
-            console.print("\n[bold cyan]Hardware Information[/bold cyan]\n")
-            try:
-                hw = HardwareInfo()
-                hw.display_all()
-            except Exception as e:
-                print_error(f"Error getting hardware info: {e}")
-            wait_for_key()
+    from ..stress import CPUStressTest, pool
 
-        elif choice == "live_monitor":
-            clear_screen()
-            try:
-                monitor = LiveMonitor()
-                monitor.run()
-            except Exception as e:
-                print_error(f"Error running monitor: {e}")
-            wait_for_key()
+    # Start one worker per physical core while the user confirms
+    try:
+        pool.prewarm(CPUStressTest().worker_count())
+    except Exception as e:
+        print_warning(f"Could not start stress workers early: {e}")
+
+    if prompt_yes_no("Start CPU stress test?", default=True):
+        try:
+            stress = CPUStressTest()
+            console.print(f"[cyan]Stressing CPU with {stress.describe_workers()} for {duration} seconds...[/cyan]\n")
+
+            with create_progress() as progress:
+                task = progress.add_task("CPU Stress Test", total=duration)
+                update_bar = stress_progress_updater(progress, task)
+
+                def cpu_progress(elapsed, stats):
+                    temp_str = f"{stats['temperature']:.1f}C" if stats.get('temperature') else "N/A"
+                    update_bar(elapsed, f"CPU: {stats['utilization']:.0f}% | Temp: {temp_str}")
+
+                result = stress.run(duration=duration, progress_callback=cpu_progress)
 
-        elif choice.startswith("cpu_"):
-            duration = int(choice.split("_")[1])
-            clear_screen()
-            print_banner()
-            console.print(f"\n[bold cyan]CPU Stress Test ({duration}s)[/bold cyan]\n")
-            print_warning("This will stress all CPU cores. Monitor your temperatures!")
             console.print()
+            if result.passed:
+                print_success("CPU Stress Test PASSED")
+            else:
+                print_error(f"CPU Stress Test FAILED: {result.error}")
 
-            if prompt_yes_no("Start CPU stress test?", default=True):
-                try:
-                    stress = CPUStressTest()
-                    console.print(f"[cyan]Stressing {stress.cpu_count} CPU cores for {duration} seconds...[/cyan]\n")
+            lines = [
+                "\n[cyan]Results:[/cyan]",
+                f"  Cores Tested: {result.cores_tested}",
+                f"  Avg Utilization: {result.avg_utilization:.1f}%",
+                f"  Max Utilization: {result.max_utilization:.1f}%",
+            ]
+            if result.max_temperature:
+                lines.append(f"  Max Temperature: {result.max_temperature:.1f}C")
+                lines.append(f"  Avg Temperature: {result.avg_temperature:.1f}C")
+            lines.append(f"  Throttling Detected: {'Yes' if result.throttling_detected else 'No'}")
+            console.print("\n".join(lines))
 
-                    with create_progress() as progress:
-                        task = progress.add_task("CPU Stress Test", total=duration)
+        except Exception as e:
+            print_error(f"Error during stress test: {e}")
 
-                        def cpu_progress(elapsed, stats):
-                            progress.update(task, completed=elapsed)
-                            temp_str = f"{stats['temperature']:.1f}C" if stats.get('temperature') else "N/A"
-                            progress.update(task, description=f"CPU: {stats['utilization']:.0f}% | Temp: {temp_str}")
+    wait_for_key()
 
-                        result = stress.run(duration=duration, progress_callback=cpu_progress)
 
-                    console.print()
-                    if result.passed:
-                        print_success("CPU Stress Test PASSED")
-                    else:
-                        print_error(f"CPU Stress Test FAILED: {result.error}")
+def _run_gpu_stress(duration: int):
+    """Confirm and run a GPU stress test."""
+    clear_screen()
+    print_banner()
+    console.print(f"\n[bold cyan]GPU Stress Test ({duration}s)[/bold cyan]\n")
+    print_warning("This will stress your GPU. Monitor your temperatures!")
+    console.print()
 
-                    console.print(f"\n[cyan]Results:[/cyan]")
-                    console.print(f"  Cores Tested: {result.cores_tested}")
-                    console.print(f"  Avg Utilization: {result.avg_utilization:.1f}%")
-                    console.print(f"  Max Utilization: {result.max_utilization:.1f}%")
-                    if result.max_temperature:
-                        console.print(f"  Max Temperature: {result.max_temperature:.1f}C")
-                        console.print(f"  Avg Temperature: {result.avg_temperature:.1f}C")
-                    console.print(f"  Throttling Detected: {'Yes' if result.throttling_detected else 'No'}")
+    if prompt_yes_no("Start GPU stress test?", default=True):
+        try:
+            from ..stress import GPUStressTest
+            stress = GPUStressTest()
 
-                except Exception as e:
-                    print_error(f"Error during stress test: {e}")
+            # Show compute mode
+            if stress.opencl_available:
+                print_success("OpenCL GPU compute available - REAL GPU stress!")
+            else:
+                print_warning("OpenCL not available - using CPU fallback (install pyopencl for real GPU stress)")
 
-            wait_for_key()
+            console.print(f"[cyan]Running GPU stress test for {duration} seconds...[/cyan]\n")
 
-        elif choice.startswith("gpu_"):
-            duration = int(choice.split("_")[1])
-            clear_screen()
-            print_banner()
-            console.print(f"\n[bold cyan]GPU Stress Test ({duration}s)[/bold cyan]\n")
-            print_warning("This will stress your GPU. Monitor your temperatures!")
-            console.print()
+            with create_progress() as progress:
+                task = progress.add_task("GPU Stress Test", total=duration)
+                update_bar = stress_progress_updater(progress, task)
+
+                def gpu_progress(elapsed, stats):
+                    temp_str = f"{stats['temperature']}C" if stats.get('temperature') else "N/A"
+                    util_str = f"{stats['utilization']}%" if stats.get('utilization') else "N/A"
+                    update_bar(elapsed, f"GPU: {util_str} | Temp: {temp_str}")
 
-            if prompt_yes_no("Start GPU stress test?", default=True):
-                try:
-                    stress = GPUStressTest()
+                result = stress.run(duration=duration, progress_callback=gpu_progress)
+
+            console.print()
+            if result.passed:
+                print_success("GPU Stress Test PASSED")
+            else:
+                print_error(f"GPU Stress Test FAILED: {result.error}")
 
-                    # Show compute mode
-                    if stress.opencl_available:
-                        print_success("OpenCL GPU compute available - REAL GPU stress!")
-                    else:
-                        print_warning("OpenCL not available - using CPU fallback (install pyopencl for real GPU stress)")
+            lines = [
+                "\n[cyan]Results:[/cyan]",
+                f"  GPU: {result.gpu_name}",
+                f"  Compute Mode: {'[green]OpenCL GPU[/green]' if result.opencl_used else '[yellow]CPU Fallback[/yellow]'}",
+            ]
+            if result.max_temperature:
+                lines.append(f"  Max Temperature: {result.max_temperature:.1f}C")
+                lines.append(f"  Avg Temperature: {result.avg_temperature:.1f}C")
+            if result.max_utilization:
+                lines.append(f"  Max Utilization: {result.max_utilization:.1f}%")
+            lines.append(f"  VRAM Total: {result.total_memory_mb:.0f} MB")
+            console.print("\n".join(lines))
 
-                    console.print(f"[cyan]Running GPU stress test for {duration} seconds...[/cyan]\n")
+        except Exception as e:
+            print_error(f"Error during stress test: {e}")
 
-                    with create_progress() as progress:
-                        task = progress.add_task("GPU Stress Test", total=duration)
+    wait_for_key()
 
-                        def gpu_progress(elapsed, stats):
-                            progress.update(task, completed=elapsed)
-                            temp_str = f"{stats['temperature']}C" if stats.get('temperature') else "N/A"
-                            util_str = f"{stats['utilization']}%" if stats.get('utilization') else "N/A"
-                            progress.update(task, description=f"GPU: {util_str} | Temp: {temp_str}")
 
-                        result = stress.run(duration=duration, progress_callback=gpu_progress)
+def _run_memory_stress():
+    """Confirm and run a memory stress test."""
+    clear_screen()
+    print_banner()
+    console.print("\n[bold cyan]Memory Stress Test[/bold cyan]\n")
+    print_warning("This will allocate 70% of available RAM for testing!")
+    console.print()
 
-                    console.print()
-                    if result.passed:
-                        print_success("GPU Stress Test PASSED")
-                    else:
-                        print_error(f"GPU Stress Test FAILED: {result.error}")
+    if prompt_yes_no("Start memory stress test?", default=True):
+        try:
+            from ..stress import MemoryStressTest
+            stress = MemoryStressTest()
+            console.print(f"[cyan]Testing {stress.available_ram / (1024**3):.1f} GB available RAM...[/cyan]\n")
 
-                    console.print(f"\n[cyan]Results:[/cyan]")
-                    console.print(f"  GPU: {result.gpu_name}")
-                    console.print(f"  Compute Mode: {'[green]OpenCL GPU[/green]' if result.opencl_used else '[yellow]CPU Fallback[/yellow]'}")
-                    if result.max_temperature:
-                        console.print(f"  Max Temperature: {result.max_temperature:.1f}C")
-                        console.print(f"  Avg Temperature: {result.avg_temperature:.1f}C")
-                    if result.max_utilization:
-                        console.print(f"  Max Utilization: {result.max_utilization:.1f}%")
-                    console.print(f"  VRAM Total: {result.total_memory_mb:.0f} MB")
+            with create_progress() as progress:
+                task = progress.add_task("Memory Stress Test", total=30)
+                update_bar = stress_progress_updater(progress, task)
 
-                except Exception as e:
-                    print_error(f"Error during stress test: {e}")
+                def mem_progress(elapsed, stats):
+                    update_bar(elapsed, f"RAM: {stats['memory_percent']:.0f}% | Errors: {stats['errors']}")
 
-            wait_for_key()
+                result = stress.run(duration=30, percentage=70, progress_callback=mem_progress)
 
-        elif choice == "mem_test":
-            clear_screen()
-            print_banner()
-            console.print("\n[bold cyan]Memory Stress Test[/bold cyan]\n")
-            print_warning("This will allocate 70% of available RAM for testing!")
             console.print()
+            if result.passed:
+                print_success("Memory Stress Test PASSED")
+            else:
+                print_error(f"Memory Stress Test FAILED: {result.error}")
+
+            lines = [
+                "\n[cyan]Results:[/cyan]",
+                f"  Total RAM: {result.total_ram_gb:.1f} GB",
+                f"  Tested: {result.tested_ram_gb:.1f} GB ({result.test_percentage}%)",
+                f"  Errors Found: {result.errors_found}",
+                f"  Max Usage: {result.max_usage_percent:.1f}%",
+            ]
+            if result.write_speed_mbps:
+                lines.append(f"  Write Speed: {result.write_speed_mbps:.0f} MB/s")
+            if result.read_speed_mbps:
+                lines.append(f"  Read Speed: {result.read_speed_mbps:.0f} MB/s")
+            console.print("\n".join(lines))
 
-            if prompt_yes_no("Start memory stress test?", default=True):
-                try:
-                    stress = MemoryStressTest()
-                    console.print(f"[cyan]Testing {stress.available_ram / (1024**3):.1f} GB available RAM...[/cyan]\n")
+        except Exception as e:
+            print_error(f"Error during stress test: {e}")
 
-                    with create_progress() as progress:
-                        task = progress.add_task("Memory Stress Test", total=30)
+    wait_for_key()
 
-                        def mem_progress(elapsed, stats):
-                            progress.update(task, completed=elapsed)
-                            progress.update(task, description=f"RAM: {stats['memory_percent']:.0f}% | Errors: {stats['errors']}")
 
-                        result = stress.run(duration=30, percentage=70, progress_callback=mem_progress)
+# Stress menu choice -> (handler, args)
+_STRESS_DISPATCH = {
+    "hw_info": (_show_hardware_info, ()),
+    "live_monitor": (_run_live_monitor, ()),
+    **{f"cpu_{d}": (_run_cpu_stress, (d,)) for d in (30, 60, 120)},
+    **{f"gpu_{d}": (_run_gpu_stress, (d,)) for d in (30, 60, 120)},
+    "mem_test": (_run_memory_stress, ()),
+}
 
-                    console.print()
-                    if result.passed:
-                        print_success("Memory Stress Test PASSED")
-                    else:
-                        print_error(f"Memory Stress Test FAILED: {result.error}")
 
-                    console.print(f"\n[cyan]Results:[/cyan]")
-                    console.print(f"  Total RAM: {result.total_ram_gb:.1f} GB")
-                    console.print(f"  Tested: {result.tested_ram_gb:.1f} GB ({result.test_percentage}%)")
-                    console.print(f"  Errors Found: {result.errors_found}")
-                    console.print(f"  Max Usage: {result.max_usage_percent:.1f}%")
-                    if result.write_speed_mbps:
-                        console.print(f"  Write Speed: {result.write_speed_mbps:.0f} MB/s")
-                    if result.read_speed_mbps:
-                        console.print(f"  Read Speed: {result.read_speed_mbps:.0f} MB/s")
+def show_stress_menu():
+    """Show sub-menu for stress testing and monitoring."""
+    # Test, monitor and info modules are imported by their handlers so
+    # entering the menu doesn't load e.g. numpy for an unused GPU test
+    while True:
+        clear_screen()
+        print_banner()
+        console.print("\n[bold cyan]Stress Tests & Monitoring[/bold cyan]\n")
 
-                except Exception as e:
-                    print_error(f"Error during stress test: {e}")
+        choice = questionary.select(
+            "Select an option:",
+            choices=get_stress_menu_choices(),
+            style=CUSTOM_STYLE,
+            use_shortcuts=False,
+            use_arrow_keys=True,
+        ).ask()
 
-            wait_for_key()
+        if choice is None or choice == "back":
+            return
+
+        handler, args = _STRESS_DISPATCH[choice]
+        handler(*args)
 
 
 def show_network_menu(admin_status: bool):
     """Show sub-menu for network tests."""
+    # One engine for the whole menu; each test swaps in its scanners
+    engine = ScanEngine(is_admin=admin_status)
+
     while True:
         clear_screen()
         print_banner()
         print_admin_status(admin_status)
         console.print("\n[bold cyan]Network Tests[/bold cyan]\n")
 
-        choices = [
-            {"name": "Full Network Scan       (All network tests)", "value": "full_network"},
-        ]
-        if QUESTIONARY_AVAILABLE:
-            choices.append(questionary.Separator("-" * 50))
-        choices.extend([
-            {"name": "Internet Connectivity   (Ping, DNS, HTTP checks)", "value": "connectivity"},
-            {"name": "WiFi Analysis           (Signal strength, security)", "value": "wifi"},
-            {"name": "DNS Performance         (DNS server benchmarks)", "value": "dns"},
-            {"name": "Speed Test              (Download speed estimate)", "value": "speed"},
-        ])
-        if QUESTIONARY_AVAILABLE:
-            choices.append(questionary.Separator("-" * 50))
-        choices.append({"name": "Back to Main Menu", "value": "back"})
-
         choice = questionary.select(
             "Select a network test:",
-            choices=choices,
+            choices=get_network_menu_choices(),
             style=CUSTOM_STYLE,
             use_shortcuts=False,
             use_arrow_keys=True,
@@ -452,45 +475,38 @@ def show_network_menu(admin_status: bool):
         print_banner()
         print_admin_status(admin_status)
 
-        from ..core.engine import ScanEngine
-
-        engine = ScanEngine(is_admin=admin_status)
-
         if choice == "full_network":
             console.print("\n[bold cyan]Running Full Network Scan...[/bold cyan]\n")
             scanners = [
-                ConnectivityScanner(),
-                WiFiScanner(),
-                DNSScanner(),
-                SpeedTestScanner(),
+                get_scanner("connectivity"),
+                get_scanner("wifi"),
+                get_scanner("dns"),
+                get_scanner("speed_test"),
             ]
         elif choice == "connectivity":
             console.print("\n[bold cyan]Running Connectivity Test...[/bold cyan]\n")
-            scanners = [ConnectivityScanner()]
+            scanners = [get_scanner("connectivity")]
         elif choice == "wifi":
             console.print("\n[bold cyan]Running WiFi Analysis...[/bold cyan]\n")
-            scanners = [WiFiScanner()]
+            scanners = [get_scanner("wifi")]
         elif choice == "dns":
             console.print("\n[bold cyan]Running DNS Performance Test...[/bold cyan]\n")
-            scanners = [DNSScanner()]
+            scanners = [get_scanner("dns")]
         elif choice == "speed":
             console.print("\n[bold cyan]Running Speed Test...[/bold cyan]\n")
             print_info("Note: Speed test uses small files for quick estimation")
             console.print()
-            scanners = [SpeedTestScanner()]
+            scanners = [get_scanner("speed_test")]
         else:
             continue
 
+        engine.clear_scanners()
         engine.register_scanners(scanners)
 
         with create_progress() as progress:
             task = progress.add_task("Running network tests...", total=100)
 
-            def update_progress(current: int, total: int, name: str):
-                if total > 0:
-                    pct = (current / total) * 100
-                    progress.update(task, completed=pct, description=f"Testing: {name}")
-
+            update_progress = scan_progress_callback(progress, task, "Testing")
             report = engine.run_scan(mode="full", progress_callback=update_progress)
 
         print_report(report)
@@ -499,24 +515,15 @@ def show_network_menu(admin_status: bool):
 
 def show_export_menu():
     """Show export options menu."""
-    from .ui.export import export_to_csv, export_to_html, get_default_export_path
+    from .ui.export import EXPORTERS, export_report
 
     clear_screen()
     print_banner()
     console.print("\n[bold cyan]Export Report[/bold cyan]\n")
-    console.print("[yellow]Note: Run a scan first to generate a report to export.[/yellow]")
-    console.print()
+    console.print("[yellow]Note: Run a scan first to generate a report to export.[/yellow]\n")
 
     print_info("To export a report:")
-    console.print("  1. Run any scan (Quick, Full, Hardware, Security, Network)")
-    console.print("  2. When prompted after scan, choose to save the report")
-    console.print("  3. The report is saved as JSON by default")
-    console.print()
-    console.print("[cyan]Export formats available:[/cyan]")
-    console.print("  - JSON: Default format, full data")
-    console.print("  - CSV:  Spreadsheet compatible, findings only")
-    console.print("  - HTML: Visual report for browsers")
-    console.print()
+    console.print(EXPORT_HELP)
 
     # Offer to run a scan now
     choices = [
@@ -524,7 +531,7 @@ def show_export_menu():
         {"name": "Run Full Scan & Export", "value": "full"},
     ]
     if QUESTIONARY_AVAILABLE:
-        choices.append(questionary.Separator("-" * 50))
+        choices.append(MENU_SEPARATOR)
     choices.append({"name": "Back to Main Menu", "value": "back"})
 
     choice = questionary.select(
@@ -537,11 +544,9 @@ def show_export_menu():
         return
 
     # Run scan and offer export
-    from ..core.engine import ScanEngine
-
     admin_status = is_admin()
     engine = ScanEngine(is_admin=admin_status)
-    engine.register_scanners(get_all_scanners())
+    engine.register_scanners(load_scanners(choice))
 
     clear_screen()
     print_banner()
@@ -550,11 +555,7 @@ def show_export_menu():
     with create_progress() as progress:
         task = progress.add_task(f"Running {choice} scan...", total=100)
 
-        def update_progress(current: int, total: int, name: str):
-            if total > 0:
-                pct = (current / total) * 100
-                progress.update(task, completed=pct, description=f"Scanning: {name}")
-
+        update_progress = scan_progress_callback(progress, task, "Scanning")
         report = engine.run_scan(mode=choice, progress_callback=update_progress)
 
     print_report(report)
@@ -568,7 +569,7 @@ def show_export_menu():
         {"name": "Export All Formats", "value": "all"},
     ]
     if QUESTIONARY_AVAILABLE:
-        export_choices.append(questionary.Separator("-" * 50))
+        export_choices.append(MENU_SEPARATOR)
     export_choices.append({"name": "Skip Export", "value": "skip"})
 
     export_choice = questionary.select(
@@ -584,25 +585,14 @@ def show_export_menu():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     base_name = f"tcpd_{timestamp}"
 
-    try:
-        if export_choice in ("json", "all"):
-            json_path = f"{base_name}.json"
-            report.save_json(json_path)
-            print_success(f"Saved: {json_path}")
-
-        if export_choice in ("csv", "all"):
-            csv_path = f"{base_name}.csv"
-            if export_to_csv(report, csv_path):
-                print_success(f"Saved: {csv_path}")
-            else:
-                print_error(f"Failed to save CSV")
+    formats = list(EXPORTERS) if export_choice == "all" else [export_choice]
 
-        if export_choice in ("html", "all"):
-            html_path = f"{base_name}.html"
-            if export_to_html(report, html_path):
-                print_success(f"Saved: {html_path}")
+    try:
+        for path, saved in export_report(report, base_name, formats).items():
+            if saved:
+                print_success(f"Saved: {path}")
             else:
-                print_error(f"Failed to save HTML")
+                print_error(f"Failed to save {path}")
 
     except Exception as e:
         print_error(f"Export error: {e}")
@@ -623,23 +613,7 @@ def show_dependency_menu():
 
     # Get current status
     status = get_dependency_status()
-
-    from rich.table import Table
-    table = Table(title="Dependency Status", show_header=True)
-    table.add_column("Package", style="cyan")
-    table.add_column("Status", style="white")
-
-    for import_name, pip_name in status['installed_list']:
-        table.add_row(pip_name, "[green][Installed][/green]")
-
-    for import_name, pip_name in status['missing_list']:
-        table.add_row(pip_name, "[red][Missing][/red]")
-
-    console.print(table)
-    console.print()
-    console.print(f"Installed: [green]{status['installed']}[/green] / {status['total']}")
-    console.print(f"Missing: [red]{status['missing']}[/red]")
-    console.print()
+    print_dependency_status(status)
 
     if status['missing'] == 0:
         print_success("All dependencies are installed!")
@@ -657,7 +631,7 @@ def show_dependency_menu():
         choices.append({"name": f"Install {pip_name} only", "value": pip_name})
 
     if QUESTIONARY_AVAILABLE:
-        choices.append(questionary.Separator("-" * 50))
+        choices.append(MENU_SEPARATOR)
     choices.append({"name": "Back to Main Menu", "value": "back"})
 
     choice = questionary.select(
@@ -698,6 +672,19 @@ def show_dependency_menu():
     wait_for_key()
 
 
+# Main menu choices that run a scan in that mode
+SCAN_MODES = frozenset({"quick", "full", "hardware", "security"})
+
+# Other main menu choices -> handler(admin_status)
+_MAIN_DISPATCH = {
+    "info": show_system_info,
+    "stress_menu": lambda admin_status: show_stress_menu(),
+    "network_menu": show_network_menu,
+    "export_menu": lambda admin_status: show_export_menu(),
+    "install_deps": lambda admin_status: show_dependency_menu(),
+}
+
+
 def check_questionary():
     """Check if questionary is available, show fallback message if not."""
     if not QUESTIONARY_AVAILABLE:
@@ -733,8 +720,6 @@ def run_interactive_mode():
             print_warning("Continuing without admin - some checks will be limited")
             wait_for_key()
 
-    admin_status = is_admin()
-
     # Main loop
     while True:
         try:
@@ -758,24 +743,14 @@ def run_interactive_mode():
                 console.print()
                 break
 
-            elif choice == "info":
-                show_system_info(admin_status)
-
-            elif choice == "stress_menu":
-                show_stress_menu()
-
-            elif choice == "network_menu":
-                show_network_menu(admin_status)
-
-            elif choice == "export_menu":
-                show_export_menu()
-
-            elif choice == "install_deps":
-                show_dependency_menu()
-
-            elif choice in ("quick", "full", "hardware", "security"):
+            elif choice in SCAN_MODES:
                 run_scan(choice, admin_status)
 
+            else:
+                handler = _MAIN_DISPATCH.get(choice)
+                if handler:
+                    handler(admin_status)
+
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully
             clear_screen()
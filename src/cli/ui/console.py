@@ -1,17 +1,27 @@
 """Rich console wrapper and display utilities."""
+import functools
+import os
+import sys
+from collections import defaultdict
+
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.text import Text
+from rich.segment import Segments
 from rich.style import Style
-from typing import List
+from typing import TYPE_CHECKING, Callable, List
+
+# Tables and progress bars are imported where they are used, so commands
+# that only print messages (errors, --help, version) skip loading them
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 from ...core.result import DiagnosticsReport, ScanResult, Finding, Severity
 
 
-# Global console instance
-console = Console()
+# Global console instance, shared by every module that prints.
+# Highlighting is off: the regex pass on every printed line is wasted on
+# our already-styled output and slows large reports.
+console = Console(highlight=False)
 
 # Severity styles
 SEVERITY_STYLES = {
@@ -30,95 +40,222 @@ SEVERITY_ICONS = {
     Severity.UNKNOWN: "[dim][????][/dim]",
 }
 
+# Findings and results are built as styled Text rather than markup, so
+# printing them skips markup parsing (and scanner output containing
+# square brackets is printed as-is). The icons are parsed once here.
+_SEVERITY_PREFIXES = {
+    severity: Text.from_markup(icon) for severity, icon in SEVERITY_ICONS.items()
+}
+_UNKNOWN_PREFIX = _SEVERITY_PREFIXES[Severity.UNKNOWN]
 
-def print_banner():
-    """Print the application banner."""
-    banner = """
+_RESULT_STATUS = {
+    True: Text("[OK]", style="green"),
+    False: Text("[X]", style="red"),
+}
+
+# Severities whose findings are printed with their description
+DESCRIBED_SEVERITIES = frozenset({Severity.WARNING, Severity.CRITICAL})
+
+
+# Banner and admin status lines are printed by most commands and menus,
+# so build them once instead of re-parsing markup on every call
+_BANNER = Text("""
 +==============================================================+
 |                          TCPD v1.0                           |
 |          Tester's Comprehensive PC Diagnostics               |
 +==============================================================+
-"""
-    console.print(banner, style="bold cyan")
+""", style="bold cyan")
+
+_ADMIN_STATUS = {
+    True: Text("[OK] Running with Administrator privileges", style="green"),
+    False: Text("[!] Running without Administrator privileges (some checks limited)", style="yellow"),
+}
+
+
+_MENU_HEADER = Text("""
++==============================================================+
+|                          TCPD v1.0                           |
+|          Use UP/DOWN arrows to navigate, Enter to select     |
++==============================================================+
+""", style="bold cyan")
+
+# Rendered segments of the static text above, keyed by name and console width
+_rendered = {}
+
+
+def _print_static(key: str, text: Text):
+    """
+    Print static text, rendering it once per console width.
+
+    Later calls at the same width replay the rendered segments, skipping
+    Rich's layout pipeline. Output still goes through the console, so
+    buffering, progress displays and non-terminal output behave as usual.
+    Keying on width means a resized terminal gets freshly wrapped text.
+    """
+    cache_key = (key, console.width)
+    segments = _rendered.get(cache_key)
+    if segments is None:
+        segments = _rendered[cache_key] = Segments(list(console.render(text)))
+    console.print(segments)
+
+
+def print_banner():
+    """Print the application banner."""
+    _print_static("banner", _BANNER)
 
 
 def print_admin_status(is_admin: bool):
     """Print admin status indicator."""
-    if is_admin:
-        console.print("[green][OK] Running with Administrator privileges[/green]")
-    else:
-        console.print("[yellow][!] Running without Administrator privileges (some checks limited)[/yellow]")
+    is_admin = bool(is_admin)
+    _print_static(f"admin_{is_admin}", _ADMIN_STATUS[is_admin])
     console.print()
 
 
-def create_progress() -> Progress:
-    """Create a progress bar for scanning."""
+def create_progress(transient: bool = False) -> "Progress":
+    """
+    Create a progress bar for scanning.
+
+    Args:
+        transient: Remove the bar when finished (use when printing output above it)
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
-        console=console
+        console=console,
+        transient=transient,
+        refresh_per_second=4
     )
 
 
-def print_finding(finding: Finding):
-    """Print a single finding."""
-    icon = SEVERITY_ICONS.get(finding.severity, "[dim][????][/dim]")
-    console.print(f"  {icon} {finding.title}")
-    if finding.description and finding.severity in (Severity.WARNING, Severity.CRITICAL):
-        console.print(f"      [dim]{finding.description}[/dim]")
+def scan_progress_callback(progress: "Progress", task, label: str = "Scanning") -> Callable[[int, int, str], None]:
+    """
+    Build a ScanEngine progress callback that drives a progress bar task.
+
+    ScanEngine calls it on the thread running the scan, never from scanner
+    worker threads, and Rich redraws on its own refresh thread. Each call
+    therefore only records the new state and never waits for rendering.
+
+    Args:
+        progress: Progress bar from create_progress()
+        task: Task ID returned by progress.add_task()
+        label: Description prefix shown before the scanner name
+    """
+    def update(current: int, total: int, name: str):
+        if total > 0:
+            progress.update(task, completed=(current / total) * 100, description=f"{label}: {name}")
+    return update
+
+
+def stress_progress_updater(progress: "Progress", task) -> Callable[[int, str], None]:
+    """
+    Build an updater(completed, description) for a stress-test progress bar.
+
+    The description is only re-applied when its text changes, which is the
+    common case once readings settle.
+    """
+    last_description = [None]
+
+    def update(completed: int, description: str):
+        if description == last_description[0]:
+            progress.update(task, completed=completed)
+        else:
+            last_description[0] = description
+            progress.update(task, completed=completed, description=description)
+    return update
+
+
+def _append_finding(text: Text, finding: Finding):
+    """Append a single finding (one to three lines) to text."""
+    text.append("\n  ")
+    text.append_text(_SEVERITY_PREFIXES.get(finding.severity, _UNKNOWN_PREFIX))
+    text.append(f" {finding.title}")
+    if finding.description and finding.severity in DESCRIBED_SEVERITIES:
+        text.append(f"\n      {finding.description}", style="dim")
     if finding.recommendation:
-        console.print(f"      [cyan]-> {finding.recommendation}[/cyan]")
+        text.append(f"\n      -> {finding.recommendation}", style="cyan")
 
 
-def print_scan_result(result: ScanResult):
-    """Print results from a single scanner."""
-    status = "[green][OK][/green]" if result.success else "[red][X][/red]"
-    console.print(f"\n{status} [bold]{result.scanner_name}[/bold] ({result.duration_ms:.0f}ms)")
+def _append_scan_result(text: Text, result: ScanResult):
+    """Append a scanner's result, including its findings, to text."""
+    timing = "cached" if result.cached else f"{result.duration_ms:.0f}ms"
+    text.append("\n\n")
+    text.append_text(_RESULT_STATUS[result.success])
+    text.append(" ")
+    text.append(result.scanner_name, style="bold")
+    text.append(f" ({timing})")
 
     if result.error:
-        console.print(f"  [red]Error: {result.error}[/red]")
+        text.append(f"\n  Error: {result.error}", style="red")
     else:
         for finding in result.findings:
-            print_finding(finding)
+            _append_finding(text, finding)
+
+
+def _category_header(category: str) -> Text:
+    """Build a category section header."""
+    return Text(f"\n=== {category.upper()} ===", style="bold cyan")
+
+
+def print_finding(finding: Finding):
+    """Print a single finding."""
+    text = Text()
+    _append_finding(text, finding)
+    # Drop the leading newline added for joining findings
+    console.print(text[1:])
+
+
+def print_scan_result(result: ScanResult):
+    """
+    Print results from a single scanner.
+
+    The whole block is built as one Text and printed once, so Rich lays out
+    text once per scanner rather than once per line.
+    """
+    text = Text()
+    _append_scan_result(text, result)
+    console.print(text[1:])
 
 
 def print_category_header(category: str):
     """Print a category section header."""
-    console.print(f"\n[bold cyan]=== {category.upper()} ===[/bold cyan]")
+    console.print(_category_header(category))
 
 
 def print_report(report: DiagnosticsReport):
     """Print the full diagnostics report."""
-    console.print()
-    print_banner()
+    # Buffer the whole report and write it to the terminal in one go
+    with console:
+        console.print()
+        print_banner()
 
-    # Group results by category
-    categories = {}
-    for result in report.results:
-        cat = result.category.upper()
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(result)
+        # Group results by category
+        categories = defaultdict(list)
+        for result in report.results:
+            categories[result.category.upper()].append(result)
 
-    # Print each category
-    for category, results in categories.items():
-        print_category_header(category)
-        for result in results:
-            print_scan_result(result)
+        # Print each category as a single block
+        for category, results in categories.items():
+            text = _category_header(category)
+            for result in results:
+                _append_scan_result(text, result)
+            console.print(text)
 
-    # Print summary
-    print_summary(report)
+        # Print summary
+        print_summary(report)
 
 
 def print_summary(report: DiagnosticsReport):
     """Print summary statistics."""
-    console.print("\n" + "=" * 60)
-    console.print("[bold]SUMMARY[/bold]")
-    console.print("=" * 60)
+    rule = "=" * 60
+    console.print(f"\n{rule}\n[bold]SUMMARY[/bold]\n{rule}")
 
     # Stats table
+    from rich.table import Table
+
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Metric", style="dim")
     table.add_column("Value", justify="right")
@@ -144,6 +281,8 @@ def print_summary(report: DiagnosticsReport):
 
 def print_system_info(info: dict):
     """Print system information table."""
+    from rich.table import Table
+
     table = Table(title="System Information", show_header=True)
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="white")
@@ -154,6 +293,37 @@ def print_system_info(info: dict):
     console.print(table)
 
 
+# Dependency status cells; prebuilt Text is rendered without markup parsing
+INSTALLED_CELL = Text("[Installed]", style="green")
+MISSING_CELL = Text("[Missing]", style="red")
+
+
+def print_dependency_status(status: dict):
+    """
+    Print the dependency status table and totals.
+
+    Args:
+        status: Result of dependency_installer.get_dependency_status()
+    """
+    from rich.table import Table
+
+    table = Table(title="Dependency Status", show_header=True)
+    table.add_column("Package", style="cyan")
+    table.add_column("Status", style="white")
+
+    for _, pip_name in status['installed_list']:
+        table.add_row(pip_name, INSTALLED_CELL)
+
+    for _, pip_name in status['missing_list']:
+        table.add_row(pip_name, MISSING_CELL)
+
+    console.print(table)
+    console.print(
+        f"\nInstalled: [green]{status['installed']}[/green] / {status['total']}\n"
+        f"Missing: [red]{status['missing']}[/red]\n"
+    )
+
+
 def print_error(message: str):
     """Print an error message."""
     console.print(f"[red bold]Error:[/red bold] {message}")
@@ -174,10 +344,37 @@ def print_info(message: str):
     console.print(f"[blue][i][/blue] {message}")
 
 
+@functools.lru_cache(maxsize=1)
+def _ansi_enabled() -> bool:
+    """
+    Check once whether stdout accepts ANSI escape sequences.
+
+    On Windows 10+ this enables virtual terminal processing on the console.
+    """
+    if not sys.stdout.isatty():
+        return False
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
 def clear_screen():
-    """Clear the terminal screen."""
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen, keeping the scrollback."""
+    if _ansi_enabled():
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 
 def wait_for_key(message: str = "Press Enter to continue..."):
@@ -207,10 +404,4 @@ def prompt_filename(default: str = None) -> str:
 
 def print_menu_header():
     """Print the interactive menu header."""
-    banner = """
-+==============================================================+
-|                          TCPD v1.0                           |
-|          Use UP/DOWN arrows to navigate, Enter to select     |
-+==============================================================+
-"""
-    console.print(banner, style="bold cyan")
+    _print_static("menu_header", _MENU_HEADER)
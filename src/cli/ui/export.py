@@ -2,10 +2,52 @@
 import csv
 import json
 from pathlib import Path
-from typing import Optional
+from string import Template
+from typing import Dict, Optional
 from datetime import datetime
 
 from ...core.result import DiagnosticsReport, Severity
+from ...utils.subprocess_pool import map_concurrent
+
+# Write buffer for exports - large enough that a typical report is flushed
+# in a single write (reports are often saved to slow USB drives)
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def export_to_json(report: DiagnosticsReport, filepath: str) -> bool:
+    """
+    Export diagnostics report to JSON format.
+
+    Args:
+        report: The diagnostics report to export
+        filepath: Path to save the JSON file
+
+    Returns:
+        True if export successful, False otherwise
+    """
+    try:
+        report.save_json(filepath)
+        return True
+    except Exception:
+        return False
+
+
+def _csv_rows(report: DiagnosticsReport):
+    """Yield one CSV row per finding."""
+    for result in report.results:
+        scanner_name = result.scanner_name
+        timestamp = result.timestamp.isoformat() if result.timestamp else ''
+        for finding in result.findings:
+            yield (
+                scanner_name,
+                finding.category,
+                finding.severity.value,
+                finding.title,
+                finding.description,
+                finding.recommendation or '',
+                finding.component or '',
+                timestamp
+            )
 
 
 def export_to_csv(report: DiagnosticsReport, filepath: str) -> bool:
@@ -20,7 +62,7 @@ def export_to_csv(report: DiagnosticsReport, filepath: str) -> bool:
         True if export successful, False otherwise
     """
     try:
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # Write header
@@ -36,18 +78,7 @@ def export_to_csv(report: DiagnosticsReport, filepath: str) -> bool:
             ])
 
             # Write findings
-            for result in report.results:
-                for finding in result.findings:
-                    writer.writerow([
-                        result.scanner_name,
-                        finding.category,
-                        finding.severity.value,
-                        finding.title,
-                        finding.description,
-                        finding.recommendation or '',
-                        finding.component or '',
-                        result.timestamp.isoformat() if result.timestamp else ''
-                    ])
+            writer.writerows(_csv_rows(report))
 
         return True
 
@@ -68,115 +99,87 @@ def export_to_html(report: DiagnosticsReport, filepath: str) -> bool:
     """
     try:
         html = generate_html_report(report)
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             f.write(html)
         return True
     except Exception:
         return False
 
 
-def generate_html_report(report: DiagnosticsReport) -> str:
-    """Generate HTML report string."""
-
-    # Count by severity
-    critical = report.critical_count
-    warnings = report.warning_count
-    passed = report.pass_count
-
-    # Generate findings rows
-    findings_html = ""
-    for result in report.results:
-        for finding in result.findings:
-            severity_class = {
-                Severity.CRITICAL: "critical",
-                Severity.WARNING: "warning",
-                Severity.PASS: "pass",
-                Severity.INFO: "info",
-            }.get(finding.severity, "info")
-
-            rec_html = f"<br><small><em>{finding.recommendation}</em></small>" if finding.recommendation else ""
-
-            findings_html += f"""
-            <tr class="{severity_class}">
-                <td>{result.scanner_name}</td>
-                <td><span class="badge {severity_class}">{finding.severity.value.upper()}</span></td>
-                <td>{finding.title}</td>
-                <td>{finding.description}{rec_html}</td>
-            </tr>
-            """
-
-    html = f"""<!DOCTYPE html>
+# Page layout for HTML reports; the styles never change, so the template is
+# parsed once and only the counts, rows and timestamp are filled in per export
+_HTML_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>TCPD Report</title>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
             background: #1a1a2e;
             color: #eee;
             padding: 20px;
-        }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        h1 {{
+        }
+        .container { max-width: 1200px; margin: 0 auto; }
+        h1 {
             text-align: center;
             padding: 20px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             border-radius: 10px;
             margin-bottom: 20px;
-        }}
-        .summary {{
+        }
+        .summary {
             display: flex;
             gap: 20px;
             margin-bottom: 20px;
-        }}
-        .stat {{
+        }
+        .stat {
             flex: 1;
             padding: 20px;
             border-radius: 10px;
             text-align: center;
-        }}
-        .stat.critical {{ background: #e74c3c; }}
-        .stat.warning {{ background: #f39c12; }}
-        .stat.pass {{ background: #27ae60; }}
-        .stat h2 {{ font-size: 2.5em; }}
-        .stat p {{ opacity: 0.8; }}
-        table {{
+        }
+        .stat.critical { background: #e74c3c; }
+        .stat.warning { background: #f39c12; }
+        .stat.pass { background: #27ae60; }
+        .stat h2 { font-size: 2.5em; }
+        .stat p { opacity: 0.8; }
+        table {
             width: 100%;
             border-collapse: collapse;
             background: #16213e;
             border-radius: 10px;
             overflow: hidden;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px 15px;
             text-align: left;
             border-bottom: 1px solid #0f3460;
-        }}
-        th {{ background: #0f3460; }}
-        tr:hover {{ background: #1a1a4e; }}
-        tr.critical {{ border-left: 4px solid #e74c3c; }}
-        tr.warning {{ border-left: 4px solid #f39c12; }}
-        tr.pass {{ border-left: 4px solid #27ae60; }}
-        tr.info {{ border-left: 4px solid #3498db; }}
-        .badge {{
+        }
+        th { background: #0f3460; }
+        tr:hover { background: #1a1a4e; }
+        tr.critical { border-left: 4px solid #e74c3c; }
+        tr.warning { border-left: 4px solid #f39c12; }
+        tr.pass { border-left: 4px solid #27ae60; }
+        tr.info { border-left: 4px solid #3498db; }
+        .badge {
             padding: 3px 8px;
             border-radius: 4px;
             font-size: 0.8em;
             font-weight: bold;
-        }}
-        .badge.critical {{ background: #e74c3c; }}
-        .badge.warning {{ background: #f39c12; color: #000; }}
-        .badge.pass {{ background: #27ae60; }}
-        .badge.info {{ background: #3498db; }}
-        .footer {{
+        }
+        .badge.critical { background: #e74c3c; }
+        .badge.warning { background: #f39c12; color: #000; }
+        .badge.pass { background: #27ae60; }
+        .badge.info { background: #3498db; }
+        .footer {
             text-align: center;
             padding: 20px;
             opacity: 0.6;
             margin-top: 20px;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -185,15 +188,15 @@ def generate_html_report(report: DiagnosticsReport) -> str:
 
         <div class="summary">
             <div class="stat critical">
-                <h2>{critical}</h2>
+                <h2>$critical</h2>
                 <p>Critical Issues</p>
             </div>
             <div class="stat warning">
-                <h2>{warnings}</h2>
+                <h2>$warnings</h2>
                 <p>Warnings</p>
             </div>
             <div class="stat pass">
-                <h2>{passed}</h2>
+                <h2>$passed</h2>
                 <p>Passed Checks</p>
             </div>
         </div>
@@ -208,19 +211,89 @@ def generate_html_report(report: DiagnosticsReport) -> str:
                 </tr>
             </thead>
             <tbody>
-                {findings_html}
+                $findings_html
             </tbody>
         </table>
 
         <div class="footer">
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>Generated: $generated</p>
             <p>TCPD - Tester's Comprehensive PC Diagnostics</p>
         </div>
     </div>
 </body>
 </html>
-"""
-    return html
+""")
+
+
+# Severity -> (CSS class, badge label) used for HTML report rows
+SEVERITY_HTML = {
+    Severity.CRITICAL: ("critical", "CRITICAL"),
+    Severity.WARNING: ("warning", "WARNING"),
+    Severity.PASS: ("pass", "PASS"),
+    Severity.INFO: ("info", "INFO"),
+    Severity.UNKNOWN: ("info", "UNKNOWN"),
+}
+
+
+def generate_html_report(report: DiagnosticsReport) -> str:
+    """Generate HTML report string."""
+
+    # Generate findings rows
+    rows = []
+    for result in report.results:
+        scanner_name = result.scanner_name
+        for finding in result.findings:
+            severity_class, severity_label = SEVERITY_HTML[finding.severity]
+            rec_html = f"<br><small><em>{finding.recommendation}</em></small>" if finding.recommendation else ""
+
+            rows.append(f"""
+            <tr class="{severity_class}">
+                <td>{scanner_name}</td>
+                <td><span class="badge {severity_class}">{severity_label}</span></td>
+                <td>{finding.title}</td>
+                <td>{finding.description}{rec_html}</td>
+            </tr>
+            """)
+    findings_html = "".join(rows)
+
+    return _HTML_TEMPLATE.substitute(
+        critical=report.critical_count,
+        warnings=report.warning_count,
+        passed=report.pass_count,
+        findings_html=findings_html,
+        generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    )
+
+
+# Export format (file extension) -> export function
+EXPORTERS = {
+    "json": export_to_json,
+    "csv": export_to_csv,
+    "html": export_to_html,
+}
+
+
+def export_report(report: DiagnosticsReport, base_path: str, formats) -> Dict[str, bool]:
+    """
+    Export a report in several formats at once.
+
+    The formats are written concurrently, since each export only reads
+    the report.
+
+    Args:
+        report: The diagnostics report to export
+        base_path: Output path without extension
+        formats: Format names (keys of EXPORTERS)
+
+    Returns:
+        Dict of written file path -> success
+    """
+    paths = [f"{base_path}.{fmt}" for fmt in formats]
+    results = map_concurrent(
+        lambda item: EXPORTERS[item[0]](report, item[1]),
+        list(zip(formats, paths))
+    )
+    return dict(zip(paths, results))
 
 
 def get_default_export_path(extension: str = "json") -> str:
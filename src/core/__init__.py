@@ -2,5 +2,6 @@
 from .scanner import BaseScanner
 from .result import Finding, ScanResult, Severity
 from .engine import ScanEngine
+from .cache import CachingScanner, ResultCache
 
-__all__ = ["BaseScanner", "Finding", "ScanResult", "Severity", "ScanEngine"]
+__all__ = ["BaseScanner", "Finding", "ScanResult", "Severity", "ScanEngine", "CachingScanner", "ResultCache"]
@@ -0,0 +1,192 @@
+"""Disk-backed cache for results of slowly-changing scanners."""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+from .result import ScanResult, json_dumps, json_loads
+
+
+def _boot_time() -> Optional[float]:
+    """Get system boot time, or None if psutil is unavailable."""
+    try:
+        import psutil
+        return psutil.boot_time()
+    except Exception:
+        return None
+
+
+def file_mtime(path: str) -> Optional[float]:
+    """Get a file's modification time, or None if it cannot be read."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+# Directory holding all cached data
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "tcpd_cache"
+
+# Default maximum age of snapshots, in seconds
+SNAPSHOT_TTL = 24 * 3600
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write a file via a temporary file, so readers never see partial data."""
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_snapshot(name: str, ttl: int) -> Optional[Any]:
+    """
+    Load data saved with save_snapshot().
+
+    Args:
+        name: Snapshot name
+        ttl: Maximum age in seconds
+
+    Returns:
+        The saved data, or None if missing, too old or saved before the
+        last reboot
+    """
+    path = DEFAULT_CACHE_DIR / f"{name}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        entry = json_loads(path.read_bytes())
+    except Exception:
+        return None
+
+    if entry.get("boot_time") != _boot_time():
+        return None
+    return entry.get("data")
+
+
+def save_snapshot(name: str, data: Any):
+    """Save JSON-serializable data for reuse by later runs until the next reboot."""
+    entry = {"boot_time": _boot_time(), "data": data}
+    _atomic_write(DEFAULT_CACHE_DIR / f"{name}.json", json_dumps(entry, indent=False))
+
+
+def get_snapshot(name: str, loader: Callable[[], Any], ttl: int = SNAPSHOT_TTL) -> Any:
+    """
+    Get data that only changes across reboots, loading it on a snapshot miss.
+
+    Args:
+        name: Snapshot name
+        loader: Called to get the data when no valid snapshot exists
+        ttl: Maximum age of a reused snapshot in seconds
+
+    Returns:
+        The snapshot data, or the loader's result. Empty results aren't
+        saved, so a failed load is retried next time.
+    """
+    data = load_snapshot(name, ttl)
+    if data is None:
+        data = loader()
+        if data:
+            save_snapshot(name, data)
+    return data
+
+
+class CachingScanner:
+    """
+    Mixin for scanners whose results may be reused between runs.
+
+    Place before BaseScanner in the class bases. A cached result is reused
+    while it is younger than ``cache_ttl`` seconds and every value returned
+    by ``cache_invalidators()`` is unchanged.
+    """
+
+    # Maximum age of a cached result in seconds
+    cache_ttl: int = 3600
+
+    def cache_invalidators(self) -> Tuple[Any, ...]:
+        """
+        Values that invalidate the cached result when they change.
+
+        Defaults to the system boot time. Override to add e.g. log file mtimes.
+        """
+        return (_boot_time(),)
+
+
+class ResultCache:
+    """
+    Stores successful scan results as JSON files in the temp directory.
+
+    Each scanner has a single file holding its latest result and the key it
+    was stored under, so stale entries are replaced rather than piling up.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        # Results live in their own directory, apart from the boot-scoped
+        # snapshots in DEFAULT_CACHE_DIR, so clear() only removes results
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR / "results"
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _key(self, scanner, is_admin: bool) -> str:
+        """Build the cache key for a scanner and its current invalidators."""
+        parts = [scanner.name, is_admin, list(scanner.cache_invalidators())]
+        return hashlib.sha1(json.dumps(parts, default=str).encode("utf-8")).hexdigest()
+
+    def _path(self, scanner) -> Path:
+        """Get the file holding a scanner's cached result."""
+        return self.cache_dir / f"{scanner.name.lower().replace(' ', '_')}.json"
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, scanner, is_admin: bool) -> Optional[ScanResult]:
+        """Get a cached result for the scanner, or None on a miss."""
+        path = self._path(scanner)
+        try:
+            if time.time() - path.stat().st_mtime > scanner.cache_ttl:
+                self._count(hit=False)
+                return None
+            entry = json_loads(path.read_bytes())
+            if entry.get("key") != self._key(scanner, is_admin):
+                self._count(hit=False)
+                return None
+            result = ScanResult.from_dict(entry["result"])
+        except Exception:
+            self._count(hit=False)
+            return None
+
+        result.cached = True
+        self._count(hit=True)
+        return result
+
+    def put(self, scanner, is_admin: bool, result: ScanResult):
+        """Store a successful result, replacing the scanner's previous entry atomically."""
+        if not result.success:
+            return
+
+        entry = {"key": self._key(scanner, is_admin), "result": result.to_dict()}
+        _atomic_write(self._path(scanner), json_dumps(entry, indent=False))
+
+    def clear(self):
+        """Delete all cached results."""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
@@ -1,27 +1,65 @@
 """Scan engine - Orchestrates all diagnostic scanners."""
-from typing import List, Dict, Type, Optional, Callable
+from typing import List, Dict, Type, Optional, Callable, Iterable, Iterator
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 
 from .scanner import BaseScanner
 from .result import DiagnosticsReport, ScanResult
+from .cache import CachingScanner, ResultCache
+from ..utils.wmi_helper import init_com_thread
+
+
+# Worker pools shared by all engines, keyed by size. Interactive mode creates
+# an engine per scan; sharing keeps the worker threads, and with them their
+# COM apartments and WMI connections, alive from one scan to the next.
+_executors: Dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_shared_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Get the shared worker pool of the given size, creating it on first use."""
+    with _executors_lock:
+        executor = _executors.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="tcpd-scan",
+                initializer=init_com_thread
+            )
+            _executors[max_workers] = executor
+        return executor
 
 
 class ScanEngine:
     """Orchestrates diagnostic scans across all registered scanners."""
 
-    # Scan mode definitions
+    # Scan mode definitions (scanner keys and categories)
     MODES = {
-        "quick": ["cpu", "memory", "disk_usage", "antivirus", "firewall"],
+        "quick": frozenset({"cpu", "memory", "disk_usage", "antivirus", "firewall"}),
         "full": None,  # None means all scanners
-        "hardware": ["cpu", "gpu", "memory", "storage", "battery", "motherboard", "network_adapters", "peripherals"],
-        "security": ["antivirus", "firewall", "windows_update", "ports", "processes", "startup", "services", "registry", "users", "bitlocker", "secure_boot", "uac", "password_policy", "event_log"],
-        "network": ["network_adapters", "connectivity", "wifi", "dns", "speed_test"]
+        "hardware": frozenset({"cpu", "gpu", "memory", "storage", "battery", "motherboard", "network_adapters", "peripherals"}),
+        "security": frozenset({"antivirus", "firewall", "windows_update", "ports", "processes", "startup", "services", "registry", "users", "bitlocker", "secure_boot", "uac", "password_policy", "event_log"}),
+        "network": frozenset({"network_adapters", "connectivity", "wifi", "dns", "speed_test"})
     }
 
-    def __init__(self, is_admin: bool = False):
+    # Upper bound on scanners running at once (most are I/O-bound)
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        is_admin: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: Optional[ResultCache] = None
+    ):
         self.is_admin = is_admin
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
         self._scanners: Dict[str, BaseScanner] = {}
+        # Scanners per mode, resolved on first use; reset when scanners change
+        self._mode_scanners: Dict[str, List[BaseScanner]] = {}
         self._report: Optional[DiagnosticsReport] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def register_scanner(self, scanner: BaseScanner):
         """Register a scanner instance."""
@@ -29,27 +67,55 @@ class ScanEngine:
         # Use a normalized key based on scanner name
         key = scanner.name.lower().replace(" ", "_")
         self._scanners[key] = scanner
+        self._mode_scanners.clear()
 
-    def register_scanners(self, scanners: List[BaseScanner]):
+    def register_scanners(self, scanners: Iterable[BaseScanner]):
         """Register multiple scanners."""
         for scanner in scanners:
             self.register_scanner(scanner)
 
+    def clear_scanners(self):
+        """Unregister all scanners, e.g. to reuse the engine for a different set."""
+        self._scanners.clear()
+        self._mode_scanners.clear()
+
     def get_scanners_for_mode(self, mode: str) -> List[BaseScanner]:
-        """Get list of scanners for a given mode."""
-        allowed = self.MODES.get(mode)
+        """Get list of scanners for a given mode, in registration order."""
+        scanners = self._mode_scanners.get(mode)
+        if scanners is None:
+            scanners = self._mode_scanners[mode] = [
+                scanner for key, scanner in self._scanners.items()
+                if self.mode_includes(mode, key, scanner.category)
+            ]
+        return list(scanners)
+
+    @classmethod
+    def mode_includes(cls, mode: str, key: str, category: str) -> bool:
+        """Check whether a scanner (by normalized key and category) runs in a mode."""
+        allowed = cls.MODES.get(mode)
 
         if allowed is None:
-            # Full mode - return all scanners
-            return list(self._scanners.values())
+            # Full mode - all scanners
+            return True
 
-        # Filter scanners by mode
-        result = []
-        for key, scanner in self._scanners.items():
-            # Match by key or category
-            if key in allowed or scanner.category in allowed:
-                result.append(scanner)
+        # Match by key or category
+        return key in allowed or category in allowed
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, shared with other engines of the same size."""
+        if self._executor is None:
+            self._executor = _get_shared_executor(self.max_workers)
+        return self._executor
+
+    def _run_scanner(self, scanner: BaseScanner) -> ScanResult:
+        """Run a scanner, reusing a cached result when the scanner allows it."""
+        if self.cache is None or not isinstance(scanner, CachingScanner):
+            return scanner.run()
+
+        result = self.cache.get(scanner, self.is_admin)
+        if result is None:
+            result = scanner.run()
+            self.cache.put(scanner, self.is_admin, result)
         return result
 
     def run_scan(
@@ -60,22 +126,72 @@ class ScanEngine:
         """
         Run diagnostics scan.
 
+        Parallel-safe scanners run concurrently on the engine's worker pool;
+        scanners with ``parallel_safe = False`` run afterwards, one at a time.
+        Results are reported in registration order regardless of completion order.
+
         Args:
             mode: Scan mode (quick, full, hardware, security, network)
-            progress_callback: Optional callback(current, total, scanner_name)
+            progress_callback: Optional callback(current, total, scanner_name),
+                always called on the thread running the scan
 
         Returns:
             DiagnosticsReport with all results
         """
+        for _ in self.iter_scan(mode, progress_callback):
+            pass
+        return self._report
+
+    def iter_scan(
+        self,
+        mode: str = "quick",
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> Iterator[ScanResult]:
+        """
+        Run diagnostics scan, yielding each result as soon as its scanner finishes.
+
+        Results are yielded in completion order. Once the generator is
+        exhausted, ``report`` holds the finalized report with results in
+        registration order, as returned by run_scan().
+
+        Args:
+            mode: Scan mode (quick, full, hardware, security, network)
+            progress_callback: Optional callback(current, total, scanner_name),
+                always called on the thread iterating the generator
+
+        Yields:
+            ScanResult for each scanner
+        """
         self._report = DiagnosticsReport()
         scanners = self.get_scanners_for_mode(mode)
         total = len(scanners)
-
-        for i, scanner in enumerate(scanners):
+        results: List[Optional[ScanResult]] = [None] * total
+        done = 0
+
+        parallel = [i for i, s in enumerate(scanners) if s.parallel_safe]
+        serial = [i for i, s in enumerate(scanners) if not s.parallel_safe]
+
+        if self.max_workers > 1 and len(parallel) > 1:
+            executor = self._get_executor()
+            futures = {executor.submit(self._run_scanner, scanners[i]): i for i in parallel}
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, scanners[i].name)
+                yield results[i]
+        else:
+            serial = parallel + serial
+
+        for i in serial:
             if progress_callback:
-                progress_callback(i, total, scanner.name)
+                progress_callback(done, total, scanners[i].name)
+            results[i] = self._run_scanner(scanners[i])
+            done += 1
+            yield results[i]
 
-            result = scanner.run()
+        for result in results:
             self._report.add_result(result)
 
         self._report.finalize()
@@ -83,17 +199,29 @@ class ScanEngine:
         if progress_callback:
             progress_callback(total, total, "Complete")
 
-        return self._report
-
     def run_single_scanner(self, scanner_name: str) -> Optional[ScanResult]:
         """Run a single scanner by name."""
         key = scanner_name.lower().replace(" ", "_")
         scanner = self._scanners.get(key)
 
         if scanner:
-            return scanner.run()
+            return self._run_scanner(scanner)
         return None
 
+    def shutdown(self):
+        """Stop the worker pool (it is recreated if another scan runs)."""
+        if self._executor is not None:
+            with _executors_lock:
+                if _executors.get(self.max_workers) is self._executor:
+                    del _executors[self.max_workers]
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def report(self) -> Optional[DiagnosticsReport]:
+        """Report from the most recent scan."""
+        return self._report
+
     @property
     def available_scanners(self) -> List[str]:
         """List all registered scanner names."""
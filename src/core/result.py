@@ -1,13 +1,54 @@
 """Result models for diagnostic findings."""
-from enum import Enum
+from collections import Counter
+from enum import StrEnum
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import json
+import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
-class Severity(Enum):
-    """Severity levels for findings."""
+# Write buffer used when streaming reports with the stdlib encoder
+JSON_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def json_dumps(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, using orjson when it is installed.
+
+    Values JSON can't represent are converted with str(). Falls back to the
+    stdlib encoder when orjson is missing or rejects the data (e.g. integers
+    wider than 64 bits).
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class Severity(StrEnum):
+    """
+    Severity levels for findings.
+
+    A StrEnum, so members hash and compare as plain strings (fast dict and
+    set lookups while rendering) and the values stay the report's labels.
+    """
     PASS = "pass"
     INFO = "info"
     WARNING = "warning"
@@ -15,7 +56,7 @@ class Severity(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A single diagnostic finding."""
     title: str
@@ -27,19 +68,40 @@ class Finding:
     details: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert finding to dictionary."""
-        return {
+        """
+        Convert finding to dictionary.
+
+        Optional fields are left out when unset; from_dict() restores them.
+        """
+        data = {
             "title": self.title,
             "description": self.description,
             "severity": self.severity.value,
-            "category": self.category,
-            "component": self.component,
-            "recommendation": self.recommendation,
-            "details": self.details
+            "category": self.category
         }
+        if self.component is not None:
+            data["component"] = self.component
+        if self.recommendation is not None:
+            data["recommendation"] = self.recommendation
+        if self.details:
+            data["details"] = self.details
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Finding":
+        """Create a finding from a dictionary produced by to_dict()."""
+        return cls(
+            title=data["title"],
+            description=data["description"],
+            severity=Severity(data["severity"]),
+            category=data["category"],
+            component=data.get("component"),
+            recommendation=data.get("recommendation"),
+            details=data.get("details") or {}
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Result from a single scanner."""
     scanner_name: str
@@ -50,47 +112,91 @@ class ScanResult:
     raw_data: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
+    cached: bool = False
+    _severity_counts: Optional[Counter] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert result to dictionary."""
-        return {
+        """
+        Convert result to dictionary.
+
+        Empty raw data is left out; from_dict() restores it.
+        """
+        data = {
             "scanner_name": self.scanner_name,
             "category": self.category,
             "success": self.success,
             "findings": [f.to_dict() for f in self.findings],
             "duration_ms": self.duration_ms,
-            "raw_data": self.raw_data,
             "error": self.error,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self.timestamp.isoformat(),
+            "cached": self.cached
         }
+        if self.raw_data:
+            data["raw_data"] = self.raw_data
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanResult":
+        """Create a result from a dictionary produced by to_dict()."""
+        return cls(
+            scanner_name=data["scanner_name"],
+            category=data["category"],
+            success=data["success"],
+            findings=[Finding.from_dict(f) for f in data.get("findings", [])],
+            duration_ms=data.get("duration_ms", 0.0),
+            raw_data=data.get("raw_data") or {},
+            error=data.get("error"),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            cached=data.get("cached", False)
+        )
+
+    @property
+    def severity_counts(self) -> Counter:
+        """
+        Number of findings per severity.
+
+        Counted on first access and then reused, since findings are not
+        changed once the scanner has returned its result.
+        """
+        if self._severity_counts is None:
+            self._severity_counts = Counter(f.severity for f in self.findings)
+        return self._severity_counts
 
     @property
     def critical_count(self) -> int:
         """Count critical findings."""
-        return sum(1 for f in self.findings if f.severity == Severity.CRITICAL)
+        return self.severity_counts[Severity.CRITICAL]
 
     @property
     def warning_count(self) -> int:
         """Count warning findings."""
-        return sum(1 for f in self.findings if f.severity == Severity.WARNING)
+        return self.severity_counts[Severity.WARNING]
 
     @property
     def pass_count(self) -> int:
         """Count passed findings."""
-        return sum(1 for f in self.findings if f.severity == Severity.PASS)
+        return self.severity_counts[Severity.PASS]
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticsReport:
     """Complete diagnostics report."""
     results: List[ScanResult] = field(default_factory=list)
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
     system_info: Dict[str, Any] = field(default_factory=dict)
+    # Findings per severity over all results, kept up to date by add_result()
+    _severity_counts: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Count findings of results passed to the constructor."""
+        for result in self.results:
+            self._severity_counts.update(result.severity_counts)
 
     def add_result(self, result: ScanResult):
         """Add a scan result."""
         self.results.append(result)
+        self._severity_counts.update(result.severity_counts)
 
     def finalize(self):
         """Mark report as complete."""
@@ -106,36 +212,34 @@ class DiagnosticsReport:
     @property
     def all_findings(self) -> List[Finding]:
         """Get all findings from all results."""
-        findings = []
-        for result in self.results:
-            findings.extend(result.findings)
-        return findings
+        return [finding for result in self.results for finding in result.findings]
 
     @property
     def critical_count(self) -> int:
         """Total critical findings."""
-        return sum(r.critical_count for r in self.results)
+        return self._severity_counts[Severity.CRITICAL]
 
     @property
     def warning_count(self) -> int:
         """Total warning findings."""
-        return sum(r.warning_count for r in self.results)
+        return self._severity_counts[Severity.WARNING]
 
     @property
     def pass_count(self) -> int:
         """Total passed findings."""
-        return sum(r.pass_count for r in self.results)
+        return self._severity_counts[Severity.PASS]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert report to dictionary."""
+        successful = sum(1 for r in self.results if r.success)
         return {
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "total_duration_ms": self.total_duration_ms,
             "summary": {
                 "total_scanners": len(self.results),
-                "successful_scans": sum(1 for r in self.results if r.success),
-                "failed_scans": sum(1 for r in self.results if not r.success),
+                "successful_scans": successful,
+                "failed_scans": len(self.results) - successful,
                 "critical_issues": self.critical_count,
                 "warnings": self.warning_count,
                 "passed": self.pass_count
@@ -144,11 +248,37 @@ class DiagnosticsReport:
             "results": [r.to_dict() for r in self.results]
         }
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: Optional[int] = 2) -> str:
         """Export report as JSON string."""
+        if indent in (None, 2):
+            # The layouts json_dumps() produces (with orjson when installed)
+            return json_dumps(self.to_dict(), indent=indent is not None).decode('utf-8')
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
     def save_json(self, filepath: str):
-        """Save report to JSON file."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(self.to_json())
+        """
+        Save report to JSON file.
+
+        With orjson the report is serialized up front (orjson is fast and
+        compact) and written with unbuffered os.write calls, which keeps the
+        number of writes to slow media (e.g. USB sticks) to a minimum.
+        Without it, the stdlib encoder streams into a large write buffer
+        instead of building the whole document as one string first.
+        """
+        data = self.to_dict()
+
+        if not ORJSON_AVAILABLE:
+            with open(filepath, 'w', encoding='utf-8', buffering=JSON_WRITE_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=2, default=str)
+            return
+
+        payload = json_dumps(data)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(filepath, flags, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
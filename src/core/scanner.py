@@ -1,5 +1,6 @@
 """Base scanner interface."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional, Callable
 import time
 
@@ -15,10 +16,14 @@ class BaseScanner(ABC):
     description: str = "Base scanner"
     requires_admin: bool = False
     dependencies: List[str] = []
+    # Set False for scanners that must not overlap with others (e.g. bandwidth tests)
+    parallel_safe: bool = True
 
     def __init__(self):
-        self._start_time: float = 0
+        self._start_time: int = 0  # perf_counter_ns() at the start of run()
+        self._start_datetime: Optional[datetime] = None
         self._is_admin: bool = False
+        self._dependencies_ok: bool = False
 
     def set_admin_status(self, is_admin: bool):
         """Set whether running with admin privileges."""
@@ -44,12 +49,21 @@ class BaseScanner(ABC):
         return self._check_dependencies()
 
     def _check_dependencies(self) -> bool:
-        """Check if all required dependencies are available."""
+        """
+        Check if all required dependencies are available.
+
+        A successful check is remembered for the life of the instance.
+        Failures are checked again next time, since missing packages can be
+        installed from the dependency menu without restarting.
+        """
+        if self._dependencies_ok:
+            return True
         for dep in self.dependencies:
             try:
                 __import__(dep)
             except ImportError:
                 return False
+        self._dependencies_ok = True
         return True
 
     def run(self) -> ScanResult:
@@ -58,7 +72,9 @@ class BaseScanner(ABC):
 
         This is the main entry point for running a scanner.
         """
-        self._start_time = time.perf_counter()
+        self._start_time = time.perf_counter_ns()
+        # Wall-clock start, used as the timestamp of the result
+        self._start_datetime = datetime.now()
 
         try:
             if not self.is_available():
@@ -67,7 +83,8 @@ class BaseScanner(ABC):
                     category=self.category,
                     success=False,
                     error="Scanner not available (missing dependencies or admin rights)",
-                    duration_ms=self._elapsed_ms()
+                    duration_ms=self._elapsed_ms(),
+                    timestamp=self._start_datetime
                 )
 
             result = self.scan()
@@ -80,12 +97,13 @@ class BaseScanner(ABC):
                 category=self.category,
                 success=False,
                 error=str(e),
-                duration_ms=self._elapsed_ms()
+                duration_ms=self._elapsed_ms(),
+                timestamp=self._start_datetime
             )
 
     def _elapsed_ms(self) -> float:
         """Get elapsed time in milliseconds."""
-        return (time.perf_counter() - self._start_time) * 1000
+        return (time.perf_counter_ns() - self._start_time) / 1_000_000
 
     def _create_result(
         self,
@@ -102,7 +120,8 @@ class BaseScanner(ABC):
             findings=findings or [],
             raw_data=raw_data or {},
             error=error,
-            duration_ms=self._elapsed_ms()
+            duration_ms=self._elapsed_ms(),
+            timestamp=self._start_datetime or datetime.now()
         )
 
     def _finding(
@@ -5,15 +5,158 @@ Displays detailed hardware specifications like GPU-Z/CPU-Z.
 Shows CPU, GPU, RAM, Storage, and Motherboard info.
 """
 
+import functools
 import psutil
-from typing import Dict, Any, Optional
-from rich.console import Console
+from typing import Any, Callable, Dict, List, Optional
 from rich.table import Table
 from rich.panel import Panel
 
+from ..cli.ui.console import console
+
+try:
+    import pynvml
+    NVML_AVAILABLE = True
+except ImportError:
+    pynvml = None
+    NVML_AVAILABLE = False
+
+
+# WMI queries select only the properties read below; SELECT * makes WMI
+# gather every property, some of which are slow to compute (notably
+# Win32_Processor.LoadPercentage, which samples each core)
+_CPU_QUERY = (
+    "SELECT Name, Manufacturer, NumberOfCores, NumberOfLogicalProcessors, MaxClockSpeed, "
+    "L2CacheSize, L3CacheSize, Architecture, SocketDesignation "
+    "FROM Win32_Processor"
+)
+_GPU_QUERY = (
+    "SELECT Name, AdapterCompatibility, AdapterRAM, DriverVersion, DriverDate, Status "
+    "FROM Win32_VideoController"
+)
+_MEMORY_QUERY = (
+    "SELECT DeviceLocator, Manufacturer, Capacity, Speed, MemoryType, SerialNumber, PartNumber "
+    "FROM Win32_PhysicalMemory"
+)
+_BOARD_QUERY = "SELECT Manufacturer, Product, SerialNumber FROM Win32_BaseBoard"
+_BIOS_QUERY = "SELECT Manufacturer, SMBIOSBIOSVersion, ReleaseDate FROM Win32_BIOS"
+
+
+def _read_cpu(w) -> Dict[str, Any]:
+    """Read processor details from a WMI connection."""
+    for cpu in w.query(_CPU_QUERY):
+        return {
+            'name': cpu.Name.strip() if cpu.Name else 'Unknown',
+            'manufacturer': cpu.Manufacturer or 'Unknown',
+            'cores': cpu.NumberOfCores or 0,
+            'threads': cpu.NumberOfLogicalProcessors or 0,
+            'max_clock': cpu.MaxClockSpeed or 0,
+            'l2_cache': (cpu.L2CacheSize or 0),
+            'l3_cache': (cpu.L3CacheSize or 0),
+            'architecture': cpu.Architecture or 0,
+            'socket': cpu.SocketDesignation or 'Unknown'
+        }
+    return {}
+
+
+def _read_gpus(w) -> List[Dict[str, Any]]:
+    """Read video controller details from a WMI connection."""
+    gpus = []
+    for gpu in w.query(_GPU_QUERY):
+        adapter_ram = gpu.AdapterRAM or 0
+        if adapter_ram < 0:  # Handle int32 overflow
+            adapter_ram = 4 * 1024 * 1024 * 1024
+
+        gpus.append({
+            'name': gpu.Name or 'Unknown',
+            'manufacturer': gpu.AdapterCompatibility or 'Unknown',
+            'vram_bytes': adapter_ram,
+            'driver_version': gpu.DriverVersion or 'Unknown',
+            'driver_date': gpu.DriverDate[:8] if gpu.DriverDate else 'Unknown',
+            'status': gpu.Status or 'Unknown'
+        })
+    return gpus
+
+
+def _read_memory(w) -> List[Dict[str, Any]]:
+    """Read installed memory modules from a WMI connection."""
+    modules = []
+    for mem in w.query(_MEMORY_QUERY):
+        capacity = int(mem.Capacity or 0)
+        modules.append({
+            'slot': mem.DeviceLocator or 'Unknown',
+            'manufacturer': mem.Manufacturer or 'Unknown',
+            'capacity_gb': capacity / (1024**3),
+            'speed': mem.Speed or 0,
+            'type': mem.MemoryType or 0,
+            'serial': mem.SerialNumber or 'Unknown',
+            'part_number': (mem.PartNumber or '').strip()
+        })
+    return modules
+
+
+def _read_motherboard(w) -> Dict[str, Any]:
+    """Read baseboard details from a WMI connection."""
+    for board in w.query(_BOARD_QUERY):
+        return {
+            'manufacturer': board.Manufacturer or 'Unknown',
+            'model': board.Product or 'Unknown',
+            'serial': board.SerialNumber or 'Unknown'
+        }
+    return {}
+
+
+def _read_bios(w) -> Dict[str, Any]:
+    """Read BIOS details from a WMI connection."""
+    for bios in w.query(_BIOS_QUERY):
+        return {
+            'vendor': bios.Manufacturer or 'Unknown',
+            'version': bios.SMBIOSBIOSVersion or 'Unknown',
+            'date': bios.ReleaseDate[:8] if bios.ReleaseDate else 'Unknown'
+        }
+    return {}
+
+
+# Section of the hardware data -> reader filling it from WMI
+_WMI_READERS = {
+    'cpu': _read_cpu,
+    'gpu': _read_gpus,
+    'memory': _read_memory,
+    'motherboard': _read_motherboard,
+    'bios': _read_bios,
+}
+
+
+def _read_section(reader: Callable) -> Optional[Any]:
+    """Run one reader on this thread's WMI connection; None if it fails."""
+    try:
+        from ..utils.wmi_helper import wmi_connection
+        return reader(wmi_connection())
+    except Exception:
+        return None
+
 
+# Saved WMI data is reused by later runs for this long (or until reboot)
+WMI_SNAPSHOT_TTL = 24 * 3600
+
+
+@functools.lru_cache(maxsize=1)
 def _get_wmi_data() -> Dict[str, Any]:
-    """Get hardware data via WMI."""
+    """
+    Get hardware data via WMI.
+
+    Each WMI query is a slow round-trip to the WMI service, so the sections
+    are queried concurrently, and the result is kept for the life of the
+    process since installed hardware doesn't change while we run. It is
+    also saved to disk and reused by later runs until the next reboot.
+    """
+    from ..core.cache import load_snapshot, save_snapshot
+    from ..utils.subprocess_pool import map_concurrent
+    from ..utils.wmi_helper import init_com_thread
+
+    cached = load_snapshot("hardware_info", WMI_SNAPSHOT_TTL)
+    if cached is not None:
+        return cached
+
     data = {
         'cpu': {},
         'gpu': [],
@@ -22,131 +165,103 @@ def _get_wmi_data() -> Dict[str, Any]:
         'bios': {}
     }
 
-    try:
-        import wmi
-        w = wmi.WMI()
-
-        # CPU Info
-        for cpu in w.Win32_Processor():
-            data['cpu'] = {
-                'name': cpu.Name.strip() if cpu.Name else 'Unknown',
-                'manufacturer': cpu.Manufacturer or 'Unknown',
-                'cores': cpu.NumberOfCores or 0,
-                'threads': cpu.NumberOfLogicalProcessors or 0,
-                'max_clock': cpu.MaxClockSpeed or 0,
-                'current_clock': cpu.CurrentClockSpeed or 0,
-                'l2_cache': (cpu.L2CacheSize or 0),
-                'l3_cache': (cpu.L3CacheSize or 0),
-                'architecture': cpu.Architecture or 0,
-                'socket': cpu.SocketDesignation or 'Unknown'
-            }
-            break
-
-        # GPU Info
-        for gpu in w.Win32_VideoController():
-            adapter_ram = gpu.AdapterRAM or 0
-            if adapter_ram < 0:  # Handle int32 overflow
-                adapter_ram = 4 * 1024 * 1024 * 1024
-
-            data['gpu'].append({
-                'name': gpu.Name or 'Unknown',
-                'manufacturer': gpu.AdapterCompatibility or 'Unknown',
-                'vram_bytes': adapter_ram,
-                'driver_version': gpu.DriverVersion or 'Unknown',
-                'driver_date': gpu.DriverDate[:8] if gpu.DriverDate else 'Unknown',
-                'status': gpu.Status or 'Unknown'
-            })
-
-        # Memory Info
-        for mem in w.Win32_PhysicalMemory():
-            capacity = int(mem.Capacity or 0)
-            data['memory'].append({
-                'slot': mem.DeviceLocator or 'Unknown',
-                'manufacturer': mem.Manufacturer or 'Unknown',
-                'capacity_gb': capacity / (1024**3),
-                'speed': mem.Speed or 0,
-                'type': mem.MemoryType or 0,
-                'serial': mem.SerialNumber or 'Unknown',
-                'part_number': (mem.PartNumber or '').strip()
-            })
-
-        # Motherboard Info
-        for board in w.Win32_BaseBoard():
-            data['motherboard'] = {
-                'manufacturer': board.Manufacturer or 'Unknown',
-                'model': board.Product or 'Unknown',
-                'serial': board.SerialNumber or 'Unknown'
-            }
-            break
-
-        # BIOS Info
-        for bios in w.Win32_BIOS():
-            data['bios'] = {
-                'vendor': bios.Manufacturer or 'Unknown',
-                'version': bios.SMBIOSBIOSVersion or 'Unknown',
-                'date': bios.ReleaseDate[:8] if bios.ReleaseDate else 'Unknown'
-            }
-            break
+    sections = map_concurrent(
+        _read_section,
+        _WMI_READERS.values(),
+        max_workers=len(_WMI_READERS),
+        initializer=init_com_thread
+    )
+    for key, value in zip(_WMI_READERS, sections):
+        if value is not None:
+            data[key] = value
 
-    except Exception:
-        pass
+    # Don't keep an empty result (e.g. WMI unavailable) beyond this run
+    if any(data.values()):
+        save_snapshot("hardware_info", data)
 
     return data
 
 
-def _get_nvidia_info() -> Optional[Dict]:
-    """Get detailed NVIDIA GPU info."""
+def _read_nvidia_gpu(handle, driver: str) -> Dict[str, Any]:
+    """Read details of one NVIDIA GPU."""
+    name = pynvml.nvmlDeviceGetName(handle)
+    if isinstance(name, bytes):
+        name = name.decode('utf-8')
+
+    mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+    temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+    util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+
+    # Try to get clocks
     try:
-        import pynvml
-        pynvml.nvmlInit()
+        graphics_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS)
+        mem_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM)
+    except Exception:
+        graphics_clock = 0
+        mem_clock = 0
 
-        if pynvml.nvmlDeviceGetCount() == 0:
-            pynvml.nvmlShutdown()
-            return None
+    # Try to get power
+    try:
+        power = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000  # Convert to watts
+    except Exception:
+        power = 0
+
+    return {
+        'name': name,
+        'driver': driver,
+        'vram_total_gb': mem.total / (1024**3),
+        'vram_used_gb': mem.used / (1024**3),
+        'temperature': temp,
+        'utilization': util.gpu,
+        'mem_utilization': util.memory,
+        'graphics_clock': graphics_clock,
+        'memory_clock': mem_clock,
+        'power_watts': power
+    }
 
-        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
 
-        name = pynvml.nvmlDeviceGetName(handle)
-        if isinstance(name, bytes):
-            name = name.decode('utf-8')
+def _get_nvidia_info() -> List[Dict]:
+    """
+    Get detailed info for every NVIDIA GPU.
 
-        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+    Returns:
+        One dict per GPU that could be read, empty without an NVIDIA GPU
+        or pynvml
+    """
+    if not NVML_AVAILABLE:
+        return []
+    try:
+        pynvml.nvmlInit()
+    except Exception:
+        return []
+
+    gpus = []
+    try:
         driver = pynvml.nvmlSystemGetDriverVersion()
         if isinstance(driver, bytes):
             driver = driver.decode('utf-8')
 
-        temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-
-        # Try to get clocks
+        for index in range(pynvml.nvmlDeviceGetCount()):
+            try:
+                gpus.append(_read_nvidia_gpu(pynvml.nvmlDeviceGetHandleByIndex(index), driver))
+            except Exception:
+                continue
+    except Exception:
+        pass
+    finally:
         try:
-            graphics_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS)
-            mem_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM)
+            pynvml.nvmlShutdown()
         except Exception:
-            graphics_clock = 0
-            mem_clock = 0
+            pass
 
-        # Try to get power
-        try:
-            power = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000  # Convert to watts
-        except Exception:
-            power = 0
+    return gpus
 
-        pynvml.nvmlShutdown()
 
-        return {
-            'name': name,
-            'driver': driver,
-            'vram_total_gb': mem.total / (1024**3),
-            'vram_used_gb': mem.used / (1024**3),
-            'temperature': temp,
-            'utilization': util.gpu,
-            'mem_utilization': util.memory,
-            'graphics_clock': graphics_clock,
-            'memory_clock': mem_clock,
-            'power_watts': power
-        }
-    except Exception:
+def _get_disk_usage(mountpoint: str):
+    """Get disk usage for a mountpoint, or None if it cannot be read."""
+    try:
+        return psutil.disk_usage(mountpoint)
+    except (PermissionError, OSError):
         return None
 
 
@@ -165,12 +280,25 @@ def _get_ddr_type(type_code: int) -> str:
 
 
 class HardwareInfo:
-    """Hardware information display."""
+    """
+    Hardware information display.
+
+    WMI and NVML data are collected on first use, so creating an instance
+    is cheap and displays that don't need NVIDIA details never load NVML.
+    """
 
     def __init__(self):
-        self.console = Console()
-        self.wmi_data = _get_wmi_data()
-        self.nvidia_info = _get_nvidia_info()
+        self.console = console
+
+    @functools.cached_property
+    def wmi_data(self) -> Dict[str, Any]:
+        """Hardware data from WMI (see _get_wmi_data)."""
+        return _get_wmi_data()
+
+    @functools.cached_property
+    def nvidia_info(self) -> List[Dict]:
+        """NVIDIA GPU details, one dict per GPU (empty without an NVIDIA GPU or pynvml)."""
+        return _get_nvidia_info()
 
     def display_all(self):
         """Display all hardware information."""
@@ -227,28 +355,31 @@ class HardwareInfo:
         """Display GPU information."""
         # First show NVIDIA info if available (more detailed)
         if self.nvidia_info:
-            table = Table(title="GPU Information (NVIDIA)", title_style="bold green", show_header=False)
-            table.add_column("Property", style="dim", width=20)
-            table.add_column("Value", style="white")
-
-            info = self.nvidia_info
-            table.add_row("GPU", info['name'])
-            table.add_row("Driver Version", info['driver'])
-            table.add_row("VRAM Total", f"{info['vram_total_gb']:.1f} GB")
-            table.add_row("VRAM Used", f"{info['vram_used_gb']:.1f} GB")
-            table.add_row("VRAM Free", f"{info['vram_total_gb'] - info['vram_used_gb']:.1f} GB")
-            table.add_row("Temperature", f"{info['temperature']}C")
-            table.add_row("GPU Utilization", f"{info['utilization']}%")
-            table.add_row("Memory Utilization", f"{info['mem_utilization']}%")
-
-            if info['graphics_clock']:
-                table.add_row("Graphics Clock", f"{info['graphics_clock']} MHz")
-            if info['memory_clock']:
-                table.add_row("Memory Clock", f"{info['memory_clock']} MHz")
-            if info['power_watts']:
-                table.add_row("Power Usage", f"{info['power_watts']:.0f} W")
-
-            self.console.print(table)
+            for i, info in enumerate(self.nvidia_info):
+                title = "GPU Information (NVIDIA)"
+                if len(self.nvidia_info) > 1:
+                    title = f"GPU {i} Information (NVIDIA)"
+                table = Table(title=title, title_style="bold green", show_header=False)
+                table.add_column("Property", style="dim", width=20)
+                table.add_column("Value", style="white")
+
+                table.add_row("GPU", info['name'])
+                table.add_row("Driver Version", info['driver'])
+                table.add_row("VRAM Total", f"{info['vram_total_gb']:.1f} GB")
+                table.add_row("VRAM Used", f"{info['vram_used_gb']:.1f} GB")
+                table.add_row("VRAM Free", f"{info['vram_total_gb'] - info['vram_used_gb']:.1f} GB")
+                table.add_row("Temperature", f"{info['temperature']}C")
+                table.add_row("GPU Utilization", f"{info['utilization']}%")
+                table.add_row("Memory Utilization", f"{info['mem_utilization']}%")
+
+                if info['graphics_clock']:
+                    table.add_row("Graphics Clock", f"{info['graphics_clock']} MHz")
+                if info['memory_clock']:
+                    table.add_row("Memory Clock", f"{info['memory_clock']} MHz")
+                if info['power_watts']:
+                    table.add_row("Power Usage", f"{info['power_watts']:.0f} W")
+
+                self.console.print(table)
             return
 
         # Fall back to WMI data
@@ -315,6 +446,8 @@ class HardwareInfo:
 
     def display_storage(self):
         """Display storage information."""
+        from ..utils.subprocess_pool import map_concurrent
+
         table = Table(title="Storage Devices", title_style="bold yellow")
         table.add_column("Drive", style="dim")
         table.add_column("Type")
@@ -323,29 +456,36 @@ class HardwareInfo:
         table.add_column("Free")
         table.add_column("Usage")
 
-        for part in psutil.disk_partitions():
-            try:
-                if 'cdrom' in part.opts.lower() or part.fstype == '':
-                    continue
-
-                usage = psutil.disk_usage(part.mountpoint)
-
-                # Determine drive type
-                drive_type = "HDD"
-                if 'ssd' in part.device.lower():
-                    drive_type = "SSD"
-
-                table.add_row(
-                    part.device,
-                    drive_type,
-                    f"{usage.total / (1024**3):.0f} GB",
-                    f"{usage.used / (1024**3):.0f} GB",
-                    f"{usage.free / (1024**3):.0f} GB",
-                    f"{usage.percent:.1f}%"
-                )
-            except (PermissionError, OSError):
+        partitions = [
+            part for part in psutil.disk_partitions()
+            if 'cdrom' not in part.opts.lower() and part.fstype != ''
+        ]
+
+        # Read all drives at once, so a slow (e.g. network) drive doesn't
+        # hold up the others
+        usages = map_concurrent(
+            _get_disk_usage, [part.mountpoint for part in partitions],
+            max_workers=len(partitions) or 1
+        )
+
+        for part, usage in zip(partitions, usages):
+            if usage is None:
                 continue
 
+            # Determine drive type
+            drive_type = "HDD"
+            if 'ssd' in part.device.lower():
+                drive_type = "SSD"
+
+            table.add_row(
+                part.device,
+                drive_type,
+                f"{usage.total / (1024**3):.0f} GB",
+                f"{usage.used / (1024**3):.0f} GB",
+                f"{usage.free / (1024**3):.0f} GB",
+                f"{usage.percent:.1f}%"
+            )
+
         self.console.print(table)
 
     def display_motherboard(self):
@@ -5,40 +5,73 @@ Real-time dashboard showing CPU, GPU, RAM, and other system stats.
 Uses Rich Live display for terminal UI.
 """
 
+import functools
 import time
 import psutil
 import threading
-from typing import Optional, Dict, Any
-from rich.console import Console
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from rich.table import Table
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.live import Live
 from rich.text import Text
 
+from ..cli.ui.console import console
 
-def _get_nvidia_stats() -> Optional[Dict]:
-    """Get NVIDIA GPU stats."""
+try:
+    import pynvml
+    NVML_AVAILABLE = True
+except ImportError:
+    pynvml = None
+    NVML_AVAILABLE = False
+
+
+def _open_nvidia_gpus() -> List[Tuple[Any, str]]:
+    """
+    Initialize NVML and get every NVIDIA GPU.
+
+    Returns:
+        List of (device handle, name), empty without an NVIDIA GPU or
+        pynvml. Call _close_nvidia() when done if this returned any GPUs.
+    """
+    if not NVML_AVAILABLE:
+        return []
     try:
-        import pynvml
         pynvml.nvmlInit()
+    except Exception:
+        return []
+
+    gpus = []
+    try:
+        for index in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):
+                name = name.decode('utf-8')
+            gpus.append((handle, name))
+    except Exception:
+        gpus = []
+
+    if not gpus:
+        _close_nvidia()
+    return gpus
 
-        if pynvml.nvmlDeviceGetCount() == 0:
-            pynvml.nvmlShutdown()
-            return None
 
-        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+def _close_nvidia():
+    """Shut down NVML after _open_nvidia_gpus()."""
+    try:
+        pynvml.nvmlShutdown()
+    except Exception:
+        pass
 
-        name = pynvml.nvmlDeviceGetName(handle)
-        if isinstance(name, bytes):
-            name = name.decode('utf-8')
 
+def _get_nvidia_stats(handle, name: str) -> Optional[Dict]:
+    """Get NVIDIA GPU stats for a device opened with _open_nvidia_gpus()."""
+    try:
         temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
         util = pynvml.nvmlDeviceGetUtilizationRates(handle)
         mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
 
-        pynvml.nvmlShutdown()
-
         return {
             'name': name,
             'temp': temp,
@@ -67,8 +100,8 @@ def _get_cpu_temp() -> Optional[float]:
         pass
 
     try:
-        import wmi
-        w = wmi.WMI(namespace="root\\WMI")
+        from ..utils.wmi_helper import wmi_connection
+        w = wmi_connection("root\\WMI")
         temp_info = w.MSAcpi_ThermalZoneTemperature()
         if temp_info:
             kelvin = temp_info[0].CurrentTemperature / 10.0
@@ -79,11 +112,24 @@ def _get_cpu_temp() -> Optional[float]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _progress_bars(width: int, filled: str, empty: str) -> Tuple[str, ...]:
+    """Get every bar of the given style, indexed by filled cell count."""
+    return tuple(f"[{filled * i}{empty * (width - i)}]" for i in range(width + 1))
+
+
+def _get_disk_usage(mountpoint: str):
+    """Get disk usage for a mountpoint, or None if it cannot be read."""
+    try:
+        return psutil.disk_usage(mountpoint)
+    except (PermissionError, OSError):
+        return None
+
+
 def _create_progress_bar(percent: float, width: int = 20, filled: str = "#", empty: str = "-") -> str:
     """Create ASCII progress bar."""
-    filled_count = int(percent / 100 * width)
-    empty_count = width - filled_count
-    return f"[{filled * filled_count}{empty * empty_count}]"
+    filled_count = min(max(int(percent / 100 * width), 0), width)
+    return _progress_bars(width, filled, empty)[filled_count]
 
 
 def _get_status_color(value: float, warn: float = 70, crit: float = 90) -> str:
@@ -95,25 +141,268 @@ def _get_status_color(value: float, warn: float = 70, crit: float = 90) -> str:
     return "green"
 
 
+def _shown_percent(value: float, warn: float, crit: float, width: int = 20) -> Tuple[str, str, str]:
+    """Get a percentage as displayed: its text, status color and progress bar."""
+    return f"{value:5.1f}", _get_status_color(value, warn, crit), _create_progress_bar(value, width)
+
+
+def _build_gpu_table(gpu_stats: Dict) -> Table:
+    """Build the GPU section from a _get_nvidia_stats() reading."""
+    gpu_table = Table(title=f"GPU - {gpu_stats['name']}", title_style="bold green", box=None)
+    gpu_table.add_column("Metric", style="dim")
+    gpu_table.add_column("Value", justify="right")
+    gpu_table.add_column("Bar", justify="left")
+
+    gpu_color = _get_status_color(gpu_stats['util'])
+    gpu_table.add_row(
+        "GPU Usage",
+        f"[{gpu_color}]{gpu_stats['util']:5.1f}%[/{gpu_color}]",
+        _create_progress_bar(gpu_stats['util'])
+    )
+
+    vram_percent = (gpu_stats['mem_used'] / gpu_stats['mem_total']) * 100 if gpu_stats['mem_total'] > 0 else 0
+    vram_color = _get_status_color(vram_percent, 80, 95)
+    gpu_table.add_row(
+        "VRAM Usage",
+        f"[{vram_color}]{vram_percent:5.1f}%[/{vram_color}]",
+        _create_progress_bar(vram_percent)
+    )
+    gpu_table.add_row(
+        "VRAM Used",
+        f"{gpu_stats['mem_used']:.1f} / {gpu_stats['mem_total']:.1f} GB",
+        ""
+    )
+
+    temp_color = _get_status_color(gpu_stats['temp'], 75, 90)
+    gpu_table.add_row(
+        "Temperature",
+        f"[{temp_color}]{gpu_stats['temp']}C[/{temp_color}]",
+        ""
+    )
+
+    return gpu_table
+
+
+def _build_disk_table(disk_usage: List[Tuple[str, Any]]) -> Table:
+    """Build the storage section from (device, usage) readings."""
+    disk_table = Table(title="Storage", title_style="bold yellow", box=None)
+    disk_table.add_column("Drive", style="dim")
+    disk_table.add_column("Used", justify="right")
+    disk_table.add_column("Bar", justify="left")
+
+    for device, usage in disk_usage:
+        disk_color = _get_status_color(usage.percent, 80, 95)
+        disk_table.add_row(
+            device[:10],
+            f"[{disk_color}]{usage.percent:5.1f}%[/{disk_color}] ({usage.used / (1024**3):.0f}/{usage.total / (1024**3):.0f}GB)",
+            _create_progress_bar(usage.percent, width=15)
+        )
+
+    return disk_table
+
+
+class _Frame(NamedTuple):
+    """Readings shown in one monitor frame."""
+    per_cpu: List[float]
+    cpu_freq: Any
+    mem: Any
+    cpu_temp: Optional[float]
+    gpu_stats: List[Dict]
+    disk_usage: List[Tuple[str, Any]]
+
+    def shown(self) -> Tuple:
+        """
+        The readings as the display renders them (text, color and bar).
+
+        Frames that would look the same compare equal, so sampling noise
+        below display precision doesn't cause a redraw. Thresholds and bar
+        widths match _build_display() and the section table builders.
+        """
+        gb = 1024**3
+        cpu_percent = sum(self.per_cpu) / len(self.per_cpu) if self.per_cpu else 0.0
+        gpus = tuple(
+            (
+                gpu['name'],
+                _shown_percent(gpu['util'], 70, 90),
+                _shown_percent(
+                    (gpu['mem_used'] / gpu['mem_total']) * 100 if gpu['mem_total'] > 0 else 0, 80, 95
+                ),
+                f"{gpu['mem_used']:.1f} / {gpu['mem_total']:.1f}",
+                gpu['temp'],
+                _get_status_color(gpu['temp'], 75, 90),
+            )
+            for gpu in self.gpu_stats
+        )
+        disks = tuple(
+            (
+                device[:10],
+                _shown_percent(usage.percent, 80, 95, width=15),
+                f"{usage.used / gb:.0f}/{usage.total / gb:.0f}",
+            )
+            for device, usage in self.disk_usage
+        )
+        return (
+            _shown_percent(cpu_percent, 70, 90),
+            tuple(f"{p:3.0f}" for p in self.per_cpu[:8]),
+            len(self.per_cpu) > 8,
+            f"{self.cpu_freq.current:,.0f}/{self.cpu_freq.max:,.0f}" if self.cpu_freq else None,
+            (f"{self.cpu_temp:.1f}", _get_status_color(self.cpu_temp, 70, 85))
+            if self.cpu_temp is not None else None,
+            _shown_percent(self.mem.percent, 80, 95),
+            f"{self.mem.used / gb:.1f} / {self.mem.total / gb:.1f} / {self.mem.available / gb:.1f}",
+            gpus,
+            disks,
+        )
+
+
 class LiveMonitor:
     """Live system monitor with real-time stats display."""
 
+    # Seconds between sensor readings (CPU temperature and GPU stats).
+    # They are read on a background thread, since the WMI temperature
+    # fallback, NVML queries and slow (e.g. network) drives can take long
+    # enough to stall redraws.
+    SENSOR_INTERVAL = 2.0
+
+    # Seconds between re-enumerating disk partitions (drives rarely come and go)
+    PARTITION_REFRESH = 30.0
+
+    # Seconds to wait for drive usage; drives that take longer (e.g. an
+    # unreachable network share) are left out until their read returns
+    DISK_READ_TIMEOUT = 1.0
+
     def __init__(self):
-        self.console = Console()
+        self.console = console
         self.running = False
         self._stop_flag = False
+        self._cpu_temp: Optional[float] = None
+        self._gpu_stats: List[Dict] = []
+        self._disk_usage: List[Tuple[str, Any]] = []
+        self._sensor_lock = threading.Lock()
+        self._sensor_stop = threading.Event()
+        self._partitions: List = []
+        self._partitions_time: Optional[float] = None
+        self._sensor_tables: Optional[Tuple[Any, Any, List[Table], Table]] = None
+        # Mountpoints with a disk_usage() call still running
+        self._pending_mounts: set = set()
+
+    def _get_partitions(self) -> List:
+        """Get the partitions to show, re-enumerating them every PARTITION_REFRESH seconds."""
+        now = time.monotonic()
+        if self._partitions_time is None or now - self._partitions_time >= self.PARTITION_REFRESH:
+            self._partitions = [
+                part for part in psutil.disk_partitions()
+                if 'cdrom' not in part.opts.lower() and part.fstype != ''
+            ]
+            self._partitions_time = now
+        return self._partitions
+
+    def _read_disk(self, mountpoint: str, usages: Dict[str, Any]):
+        """Disk reader thread - store one mountpoint's usage in usages."""
+        usages[mountpoint] = _get_disk_usage(mountpoint)
+        self._pending_mounts.discard(mountpoint)
+
+    def _read_disks(self) -> List[Tuple[str, Any]]:
+        """
+        Read usage of every partition concurrently, waiting at most
+        DISK_READ_TIMEOUT seconds.
+
+        Each drive is read on its own daemon thread, so a hung drive neither
+        holds up the others nor keeps the process from exiting. A drive whose
+        previous read is still running is skipped rather than read again.
+
+        Returns:
+            List of (device, usage) for the partitions that could be read in time
+        """
+        partitions = self._get_partitions()
+        usages: Dict[str, Any] = {}
+        readers = []
+        for part in partitions:
+            if part.mountpoint in self._pending_mounts:
+                continue
+            self._pending_mounts.add(part.mountpoint)
+            reader = threading.Thread(
+                target=self._read_disk, args=(part.mountpoint, usages),
+                name="tcpd-monitor-disk", daemon=True
+            )
+            reader.start()
+            readers.append(reader)
+
+        deadline = time.monotonic() + self.DISK_READ_TIMEOUT
+        for reader in readers:
+            reader.join(max(0.0, deadline - time.monotonic()))
+
+        return [
+            (part.device, usages[part.mountpoint])
+            for part in partitions
+            if usages.get(part.mountpoint) is not None
+        ]
 
-    def _build_display(self) -> Table:
+    def _read_sensors(self, gpus: List[Tuple[Any, str]], read_disks: bool = True):
+        """Read CPU temperature, GPU stats and (optionally) disk usage and publish them for the display."""
+        cpu_temp = _get_cpu_temp()
+        gpu_stats = [stats for stats in (_get_nvidia_stats(*gpu) for gpu in gpus) if stats]
+        disk_usage = self._read_disks() if read_disks else None
+        with self._sensor_lock:
+            self._cpu_temp = cpu_temp
+            self._gpu_stats = gpu_stats
+            if disk_usage is not None:
+                self._disk_usage = disk_usage
+
+    def _poll_sensors(self, gpus: List[Tuple[Any, str]]):
+        """Sensor thread - refresh readings every SENSOR_INTERVAL until stopped."""
+        from ..utils.wmi_helper import init_com_thread
+        init_com_thread()
+
+        # Drives are first read here rather than in run(), so a slow drive
+        # can't delay the first frame
+        disk_usage = self._read_disks()
+        with self._sensor_lock:
+            self._disk_usage = disk_usage
+
+        while not self._sensor_stop.wait(self.SENSOR_INTERVAL):
+            self._read_sensors(gpus)
+
+    def _get_sensor_tables(
+        self, gpu_stats: List[Dict], disk_usage: List[Tuple[str, Any]]
+    ) -> Tuple[List[Table], Table]:
+        """
+        Get the GPU and storage tables for the given readings.
+
+        The tables are rebuilt only when the readings are new objects, i.e.
+        after the sensor thread has published a new reading.
+
+        Returns:
+            Tuple of (one table per GPU, storage table)
+        """
+        cached = self._sensor_tables
+        if cached is None or cached[0] is not gpu_stats or cached[1] is not disk_usage:
+            gpu_tables = [_build_gpu_table(stats) for stats in gpu_stats]
+            cached = (gpu_stats, disk_usage, gpu_tables, _build_disk_table(disk_usage))
+            self._sensor_tables = cached
+        return cached[2], cached[3]
+
+    def _read_frame(self) -> _Frame:
+        """Take this frame's psutil readings along with the latest sensor readings."""
+        # One per-core sample; the overall CPU figure is its average
+        per_cpu = psutil.cpu_percent(percpu=True)
+        cpu_freq = psutil.cpu_freq()
+        mem = psutil.virtual_memory()
+        with self._sensor_lock:
+            return _Frame(
+                per_cpu, cpu_freq, mem, self._cpu_temp, self._gpu_stats, self._disk_usage
+            )
+
+    def _build_display(self, frame: _Frame) -> Table:
         """Build the monitor display table."""
+        per_cpu, cpu_freq, mem, cpu_temp, gpu_stats, disk_usage = frame
+
         # Main table
         main_table = Table(show_header=False, box=None, padding=(0, 1))
         main_table.add_column("Content", justify="left")
 
         # CPU Section
-        cpu_percent = psutil.cpu_percent(interval=0)
-        cpu_freq = psutil.cpu_freq()
-        cpu_temp = _get_cpu_temp()
-        per_cpu = psutil.cpu_percent(percpu=True)
+        cpu_percent = sum(per_cpu) / len(per_cpu) if per_cpu else 0.0
 
         cpu_table = Table(title="CPU", title_style="bold cyan", box=None)
         cpu_table.add_column("Metric", style="dim")
@@ -152,7 +441,6 @@ class LiveMonitor:
         main_table.add_row("")
 
         # Memory Section
-        mem = psutil.virtual_memory()
         mem_table = Table(title="Memory", title_style="bold magenta", box=None)
         mem_table.add_column("Metric", style="dim")
         mem_table.add_column("Value", justify="right")
@@ -178,64 +466,14 @@ class LiveMonitor:
         main_table.add_row(mem_table)
         main_table.add_row("")
 
-        # GPU Section
-        gpu_stats = _get_nvidia_stats()
-        if gpu_stats:
-            gpu_table = Table(title=f"GPU - {gpu_stats['name']}", title_style="bold green", box=None)
-            gpu_table.add_column("Metric", style="dim")
-            gpu_table.add_column("Value", justify="right")
-            gpu_table.add_column("Bar", justify="left")
-
-            gpu_color = _get_status_color(gpu_stats['util'])
-            gpu_table.add_row(
-                "GPU Usage",
-                f"[{gpu_color}]{gpu_stats['util']:5.1f}%[/{gpu_color}]",
-                _create_progress_bar(gpu_stats['util'])
-            )
-
-            vram_percent = (gpu_stats['mem_used'] / gpu_stats['mem_total']) * 100 if gpu_stats['mem_total'] > 0 else 0
-            vram_color = _get_status_color(vram_percent, 80, 95)
-            gpu_table.add_row(
-                "VRAM Usage",
-                f"[{vram_color}]{vram_percent:5.1f}%[/{vram_color}]",
-                _create_progress_bar(vram_percent)
-            )
-            gpu_table.add_row(
-                "VRAM Used",
-                f"{gpu_stats['mem_used']:.1f} / {gpu_stats['mem_total']:.1f} GB",
-                ""
-            )
-
-            temp_color = _get_status_color(gpu_stats['temp'], 75, 90)
-            gpu_table.add_row(
-                "Temperature",
-                f"[{temp_color}]{gpu_stats['temp']}C[/{temp_color}]",
-                ""
-            )
+        # GPU and storage readings change only when the sensor thread
+        # publishes new ones, so their tables are reused until then
+        gpu_tables, disk_table = self._get_sensor_tables(gpu_stats, disk_usage)
 
+        for gpu_table in gpu_tables:
             main_table.add_row(gpu_table)
             main_table.add_row("")
 
-        # Disk Section
-        disk_table = Table(title="Storage", title_style="bold yellow", box=None)
-        disk_table.add_column("Drive", style="dim")
-        disk_table.add_column("Used", justify="right")
-        disk_table.add_column("Bar", justify="left")
-
-        for part in psutil.disk_partitions():
-            try:
-                if 'cdrom' in part.opts.lower() or part.fstype == '':
-                    continue
-                usage = psutil.disk_usage(part.mountpoint)
-                disk_color = _get_status_color(usage.percent, 80, 95)
-                disk_table.add_row(
-                    part.device[:10],
-                    f"[{disk_color}]{usage.percent:5.1f}%[/{disk_color}] ({usage.used / (1024**3):.0f}/{usage.total / (1024**3):.0f}GB)",
-                    _create_progress_bar(usage.percent, width=15)
-                )
-            except (PermissionError, OSError):
-                continue
-
         main_table.add_row(disk_table)
 
         return main_table
@@ -255,17 +493,45 @@ class LiveMonitor:
 
         start_time = time.time()
 
+        # NVML stays initialized while the monitor runs; the first reading
+        # is taken here so the first frame already shows the sensors (drives
+        # follow from the sensor thread)
+        gpus = _open_nvidia_gpus()
+        self._read_sensors(gpus, read_disks=False)
+        self._sensor_stop.clear()
+        sensor_thread = threading.Thread(
+            target=self._poll_sensors, args=(gpus,), name="tcpd-monitor-sensors", daemon=True
+        )
+        sensor_thread.start()
+
         try:
-            with Live(self._build_display(), console=self.console, refresh_per_second=1) as live:
+            # Redraw only when a new frame is built, instead of also running
+            # Live's refresh thread, which re-renders on its own timer
+            frame = self._read_frame()
+            with Live(self._build_display(frame), console=self.console, auto_refresh=False) as live:
+                shown = frame.shown()
                 while not self._stop_flag:
+                    time.sleep(1)
                     if duration and (time.time() - start_time) >= duration:
                         break
 
-                    live.update(self._build_display())
-                    time.sleep(1)
+                    # Skip the redraw when every value would look the same
+                    # (e.g. on an idle machine)
+                    frame = self._read_frame()
+                    current = frame.shown()
+                    if current != shown:
+                        shown = current
+                        live.update(self._build_display(frame), refresh=True)
 
         except KeyboardInterrupt:
             pass
+        finally:
+            self._sensor_stop.set()
+            # The sensor thread is a daemon, so don't wait on it indefinitely
+            # if a sensor read is stuck
+            sensor_thread.join(self.SENSOR_INTERVAL)
+            if gpus:
+                _close_nvidia()
 
         self.running = False
         self.console.print("\n[dim]Monitor stopped.[/dim]")
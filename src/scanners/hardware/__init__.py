@@ -1,12 +1,17 @@
 """Hardware scanners - CPU, GPU, RAM, Storage, etc."""
-from .cpu import CPUScanner
-from .gpu import GPUScanner
-from .memory import MemoryScanner
-from .storage import StorageScanner
-from .battery import BatteryScanner
-from .motherboard import MotherboardScanner
-from .network_adapters import NetworkAdaptersScanner
-from .peripherals import PeripheralsScanner
+import importlib
+
+# Scanner class -> submodule; imported on first attribute access
+_EXPORTS = {
+    "CPUScanner": ".cpu",
+    "GPUScanner": ".gpu",
+    "MemoryScanner": ".memory",
+    "StorageScanner": ".storage",
+    "BatteryScanner": ".battery",
+    "MotherboardScanner": ".motherboard",
+    "NetworkAdaptersScanner": ".network_adapters",
+    "PeripheralsScanner": ".peripherals",
+}
 
 __all__ = [
     "CPUScanner",
@@ -18,3 +23,10 @@ __all__ = [
     "NetworkAdaptersScanner",
     "PeripheralsScanner",
 ]
+
+
+def __getattr__(name):
+    """Import scanner modules lazily so one scanner doesn't load its siblings."""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
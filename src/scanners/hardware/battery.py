@@ -4,7 +4,7 @@ from typing import List, Optional
 
 from ...core.scanner import BaseScanner
 from ...core.result import ScanResult, Finding, Severity
-from ...utils.wmi_helper import wmi_query
+from ...utils.wmi_helper import wmi_multi_query
 
 
 class BatteryScanner(BaseScanner):
@@ -43,20 +43,22 @@ class BatteryScanner(BaseScanner):
             cycle_count = None
 
             try:
+                static, full_charge, cycles = wmi_multi_query(
+                    ["BatteryStaticData", "BatteryFullChargedCapacity", "BatteryCycleCount"],
+                    "root\\WMI"
+                )
+
                 # Static battery data
-                static = wmi_query("BatteryStaticData", "root\\WMI")
                 if static:
                     design_capacity = static[0].get("DesignedCapacity")
                     raw_data["design_capacity_mwh"] = design_capacity
 
                 # Full charge capacity
-                full_charge = wmi_query("BatteryFullChargedCapacity", "root\\WMI")
                 if full_charge:
                     full_charge_capacity = full_charge[0].get("FullChargedCapacity")
                     raw_data["full_charge_capacity_mwh"] = full_charge_capacity
 
                 # Cycle count
-                cycles = wmi_query("BatteryCycleCount", "root\\WMI")
                 if cycles:
                     cycle_count = cycles[0].get("CycleCount")
                     raw_data["cycle_count"] = cycle_count
@@ -1,11 +1,36 @@
 """CPU Scanner - Processor information and health."""
+import time
 import psutil
-from typing import List
+from typing import List, Optional
 
 from ...core.scanner import BaseScanner
+from ...core.cache import get_snapshot
 from ...core.result import ScanResult, Finding, Severity
 from ...utils.wmi_helper import wmi_query
 
+# Win32_Processor properties read below. SELECT * would also compute
+# LoadPercentage, which samples every core. All of these are fixed until
+# the next reboot, so they are kept in a snapshot.
+_PROCESSOR_PROPERTIES = [
+    "Name", "Manufacturer", "NumberOfCores", "NumberOfLogicalProcessors",
+    "MaxClockSpeed", "L2CacheSize", "L3CacheSize", "AddressWidth"
+]
+
+# Shortest window a CPU load sample is taken over
+MIN_LOAD_SAMPLE_SECONDS = 0.5
+
+# Oldest sample or baseline that still counts as current load
+MAX_LOAD_SAMPLE_AGE = 1.0
+
+
+def _busy_percent(before, after) -> float:
+    """Get the busy percentage of one core between two psutil.cpu_times() samples."""
+    total = sum(after) - sum(before)
+    if total <= 0:
+        return 0.0
+    idle = (after.idle - before.idle) + (getattr(after, "iowait", 0) - getattr(before, "iowait", 0))
+    return round(min(max(100 * (1 - idle / total), 0.0), 100.0), 1)
+
 
 class CPUScanner(BaseScanner):
     """Scan CPU information and health status."""
@@ -16,13 +41,57 @@ class CPUScanner(BaseScanner):
     requires_admin = False
     dependencies = ["psutil"]
 
+    def __init__(self):
+        super().__init__()
+        # Start the load sample now, so that by the time scan() runs some or
+        # all of the sample window has already passed
+        self._cpu_times = psutil.cpu_times(percpu=True)
+        self._cpu_times_at = time.monotonic()
+        self._load: Optional[List[float]] = None
+
+    def _sample_load(self) -> List[float]:
+        """
+        Get current per-core load.
+
+        A sample under MAX_LOAD_SAMPLE_AGE old is reused. Otherwise load is
+        measured since the baseline (taken at construction or by the previous
+        sample), waiting until it is MIN_LOAD_SAMPLE_SECONDS old. A baseline
+        older than MAX_LOAD_SAMPLE_AGE is replaced first, since registry
+        scanners live for the whole session and a rescan would otherwise
+        report the average load since the previous scan.
+        psutil.cpu_percent(interval=None) isn't used for this because it
+        keeps its baseline per thread, and scans run on pool threads.
+
+        Returns:
+            Busy percentage of each logical core
+        """
+        age = time.monotonic() - self._cpu_times_at
+        if age < MAX_LOAD_SAMPLE_AGE:
+            if self._load is not None:
+                return self._load
+        else:
+            self._cpu_times = psutil.cpu_times(percpu=True)
+            self._cpu_times_at = time.monotonic()
+            age = 0.0
+        if age < MIN_LOAD_SAMPLE_SECONDS:
+            time.sleep(MIN_LOAD_SAMPLE_SECONDS - age)
+
+        before = self._cpu_times
+        self._cpu_times = psutil.cpu_times(percpu=True)
+        self._cpu_times_at = time.monotonic()
+        self._load = [_busy_percent(b, a) for b, a in zip(before, self._cpu_times)]
+        return self._load
+
     def scan(self) -> ScanResult:
         findings: List[Finding] = []
         raw_data = {}
 
         try:
             # Get CPU info from WMI
-            cpu_info = wmi_query("Win32_Processor")
+            cpu_info = get_snapshot(
+                "cpu_processor",
+                lambda: wmi_query("Win32_Processor", properties=_PROCESSOR_PROPERTIES)
+            )
             if cpu_info:
                 cpu = cpu_info[0]
                 raw_data["name"] = cpu.get("Name", "Unknown")
@@ -30,20 +99,19 @@ class CPUScanner(BaseScanner):
                 raw_data["cores"] = cpu.get("NumberOfCores", 0)
                 raw_data["threads"] = cpu.get("NumberOfLogicalProcessors", 0)
                 raw_data["max_clock_mhz"] = cpu.get("MaxClockSpeed", 0)
-                raw_data["current_clock_mhz"] = cpu.get("CurrentClockSpeed", 0)
                 raw_data["l2_cache_kb"] = cpu.get("L2CacheSize", 0)
                 raw_data["l3_cache_kb"] = cpu.get("L3CacheSize", 0)
                 raw_data["architecture"] = self._get_arch(cpu.get("AddressWidth", 64))
 
-            # Get CPU utilization
-            raw_data["utilization_percent"] = psutil.cpu_percent(interval=0.5)
-
-            # Get per-core utilization
-            raw_data["per_core_utilization"] = psutil.cpu_percent(interval=0.1, percpu=True)
+            # Get per-core utilization; the overall figure is its average
+            per_core = self._sample_load()
+            raw_data["per_core_utilization"] = per_core
+            raw_data["utilization_percent"] = sum(per_core) / len(per_core) if per_core else 0.0
 
             # Get CPU frequency
             freq = psutil.cpu_freq()
             if freq:
+                raw_data["current_clock_mhz"] = freq.current
                 raw_data["current_freq_mhz"] = freq.current
                 raw_data["min_freq_mhz"] = freq.min
                 raw_data["max_freq_mhz"] = freq.max
@@ -107,20 +175,24 @@ class CPUScanner(BaseScanner):
 
     def _get_temperature(self) -> float:
         """Try to get CPU temperature."""
-        # Try psutil first (works on some systems)
-        try:
-            temps = psutil.sensors_temperatures()
-            if temps:
-                for name, entries in temps.items():
-                    for entry in entries:
-                        if 'cpu' in name.lower() or 'core' in entry.label.lower():
-                            return entry.current
-        except Exception:
-            pass
+        # psutil only has sensors_temperatures() on Linux/FreeBSD; on Windows
+        # go straight to WMI
+        if hasattr(psutil, "sensors_temperatures"):
+            try:
+                temps = psutil.sensors_temperatures()
+                if temps:
+                    for name, entries in temps.items():
+                        for entry in entries:
+                            if 'cpu' in name.lower() or 'core' in entry.label.lower():
+                                return entry.current
+            except Exception:
+                pass
 
         # Try WMI thermal zone
         try:
-            thermal = wmi_query("MSAcpi_ThermalZoneTemperature", "root\\WMI")
+            thermal = wmi_query(
+                "MSAcpi_ThermalZoneTemperature", "root\\WMI", properties=["CurrentTemperature"]
+            )
             if thermal:
                 # Convert from deciKelvin to Celsius
                 kelvin = thermal[0].get("CurrentTemperature", 0) / 10
@@ -1,10 +1,83 @@
 """GPU Scanner - Graphics card information and health."""
-from typing import List, Optional
+import atexit
+import threading
+from typing import Any, List, Optional, Tuple
 
 from ...core.scanner import BaseScanner
 from ...core.result import ScanResult, Finding, Severity
 from ...utils.wmi_helper import wmi_query
 
+try:
+    import pynvml
+    NVML_AVAILABLE = True
+except ImportError:
+    pynvml = None
+    NVML_AVAILABLE = False
+
+# Win32_VideoController properties read in _get_wmi_gpus()
+_VIDEO_CONTROLLER_PROPERTIES = [
+    "Name", "AdapterCompatibility", "AdapterRAM", "DriverVersion", "DriverDate", "Status"
+]
+
+# NVML stays initialized for the life of the process once a GPU is found;
+# (handle, name) of each NVIDIA GPU and the driver version, set on first use
+_nvml_devices: Optional[Tuple[List[Tuple[Any, str]], str]] = None
+_nvml_lock = threading.Lock()
+
+
+def _open_nvml() -> Tuple[List[Tuple[Any, str]], str]:
+    """Initialize NVML and enumerate NVIDIA GPUs (see _get_nvml_devices)."""
+    if not NVML_AVAILABLE:
+        return [], "Unknown"
+    try:
+        pynvml.nvmlInit()
+    except Exception:
+        return [], "Unknown"
+
+    devices = []
+    try:
+        for i in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):
+                name = name.decode('utf-8')
+            devices.append((handle, name))
+    except Exception:
+        devices = []
+
+    if not devices:
+        try:
+            pynvml.nvmlShutdown()
+        except Exception:
+            pass
+        return [], "Unknown"
+
+    # The driver version only changes when the driver is reloaded
+    try:
+        driver = pynvml.nvmlSystemGetDriverVersion()
+        if isinstance(driver, bytes):
+            driver = driver.decode('utf-8')
+    except Exception:
+        driver = "Unknown"
+
+    atexit.register(pynvml.nvmlShutdown)
+    return devices, driver
+
+
+def _get_nvml_devices() -> Tuple[List[Tuple[Any, str]], str]:
+    """
+    Get the NVIDIA GPUs, initializing NVML on first use.
+
+    Returns:
+        Tuple of ((device handle, name) per GPU, driver version). The list is
+        empty without an NVIDIA GPU or pynvml.
+    """
+    global _nvml_devices
+    with _nvml_lock:
+        if _nvml_devices is None:
+            _nvml_devices = _open_nvml()
+        return _nvml_devices
+
 
 class GPUScanner(BaseScanner):
     """Scan GPU information and health status."""
@@ -28,7 +101,7 @@ class GPUScanner(BaseScanner):
             wmi_gpus = self._get_wmi_gpus()
 
             # Add non-NVIDIA GPUs from WMI
-            nvidia_names = [g["name"].lower() for g in nvidia_gpus]
+            nvidia_names = {g["name"].lower() for g in nvidia_gpus}
             for gpu in wmi_gpus:
                 if gpu["name"].lower() not in nvidia_names:
                     raw_data["gpus"].append(gpu)
@@ -84,58 +157,38 @@ class GPUScanner(BaseScanner):
     def _get_nvidia_gpus(self) -> List[dict]:
         """Get NVIDIA GPU info using pynvml."""
         gpus = []
-        try:
-            import pynvml
-            pynvml.nvmlInit()
-
-            device_count = pynvml.nvmlDeviceGetCount()
-            for i in range(device_count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-
-                name = pynvml.nvmlDeviceGetName(handle)
-                if isinstance(name, bytes):
-                    name = name.decode('utf-8')
-
+        devices, driver = _get_nvml_devices()
+        for handle, name in devices:
+            try:
                 memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
-
-                try:
-                    temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-                except Exception:
-                    temp = None
-
-                try:
-                    driver = pynvml.nvmlSystemGetDriverVersion()
-                    if isinstance(driver, bytes):
-                        driver = driver.decode('utf-8')
-                except Exception:
-                    driver = "Unknown"
-
-                try:
-                    utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                    gpu_util = utilization.gpu
-                    mem_util = utilization.memory
-                except Exception:
-                    gpu_util = None
-                    mem_util = None
-
-                gpus.append({
-                    "name": name,
-                    "manufacturer": "NVIDIA",
-                    "vram_mb": memory.total // (1024 * 1024),
-                    "vram_used_mb": memory.used // (1024 * 1024),
-                    "vram_free_mb": memory.free // (1024 * 1024),
-                    "driver_version": driver,
-                    "temperature_celsius": temp,
-                    "gpu_utilization": gpu_util,
-                    "memory_utilization": mem_util,
-                    "is_nvidia": True
-                })
-
-            pynvml.nvmlShutdown()
-        except ImportError:
-            pass
-        except Exception:
-            pass
+            except Exception:
+                continue
+
+            try:
+                temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+            except Exception:
+                temp = None
+
+            try:
+                utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                gpu_util = utilization.gpu
+                mem_util = utilization.memory
+            except Exception:
+                gpu_util = None
+                mem_util = None
+
+            gpus.append({
+                "name": name,
+                "manufacturer": "NVIDIA",
+                "vram_mb": memory.total // (1024 * 1024),
+                "vram_used_mb": memory.used // (1024 * 1024),
+                "vram_free_mb": memory.free // (1024 * 1024),
+                "driver_version": driver,
+                "temperature_celsius": temp,
+                "gpu_utilization": gpu_util,
+                "memory_utilization": mem_util,
+                "is_nvidia": True
+            })
 
         return gpus
 
@@ -143,7 +196,7 @@ class GPUScanner(BaseScanner):
         """Get GPU info from WMI."""
         gpus = []
         try:
-            gpu_info = wmi_query("Win32_VideoController")
+            gpu_info = wmi_query("Win32_VideoController", properties=_VIDEO_CONTROLLER_PROPERTIES)
             for gpu in gpu_info:
                 name = gpu.get("Name", "Unknown")
                 adapter_ram = gpu.get("AdapterRAM", 0)
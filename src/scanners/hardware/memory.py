@@ -3,9 +3,17 @@ import psutil
 from typing import List
 
 from ...core.scanner import BaseScanner
+from ...core.cache import get_snapshot
 from ...core.result import ScanResult, Finding, Severity
 from ...utils.wmi_helper import wmi_query
 
+# Win32_PhysicalMemory properties read for each stick. Installed memory
+# can't change without a reboot, so the WMI results are kept in snapshots.
+_PHYSICAL_MEMORY_PROPERTIES = [
+    "DeviceLocator", "Manufacturer", "Capacity", "SMBIOSMemoryType",
+    "ConfiguredClockSpeed", "Speed", "PartNumber", "SerialNumber"
+]
+
 
 # Memory type mapping (SMBIOS)
 MEMORY_TYPE_MAP = {
@@ -65,7 +73,10 @@ class MemoryScanner(BaseScanner):
 
             # Get memory stick details from WMI
             sticks = []
-            memory_info = wmi_query("Win32_PhysicalMemory")
+            memory_info = get_snapshot(
+                "memory_sticks",
+                lambda: wmi_query("Win32_PhysicalMemory", properties=_PHYSICAL_MEMORY_PROPERTIES)
+            )
             for stick in memory_info:
                 capacity = stick.get("Capacity", 0)
                 if capacity:
@@ -89,7 +100,10 @@ class MemoryScanner(BaseScanner):
             raw_data["sticks"] = sticks
 
             # Get total slots
-            array_info = wmi_query("Win32_PhysicalMemoryArray")
+            array_info = get_snapshot(
+                "memory_array",
+                lambda: wmi_query("Win32_PhysicalMemoryArray", properties=["MemoryDevices"])
+            )
             if array_info:
                 raw_data["total_slots"] = array_info[0].get("MemoryDevices", 0)
             else:
@@ -2,17 +2,24 @@
 from typing import List
 
 from ...core.scanner import BaseScanner
+from ...core.cache import CachingScanner
 from ...core.result import ScanResult, Finding, Severity
 from ...utils.wmi_helper import wmi_query
 
+# Win32_BIOS properties read below
+_BIOS_PROPERTIES = [
+    "Manufacturer", "SMBIOSBIOSVersion", "ReleaseDate", "SMBIOSMajorVersion", "SMBIOSMinorVersion"
+]
 
-class MotherboardScanner(BaseScanner):
+
+class MotherboardScanner(CachingScanner, BaseScanner):
     """Scan motherboard and BIOS information."""
 
     name = "Motherboard"
     category = "hardware"
     description = "Motherboard and BIOS details"
     requires_admin = False
+    cache_ttl = 86400  # Board/BIOS details only change across reboots
 
     def scan(self) -> ScanResult:
         findings: List[Finding] = []
@@ -20,7 +27,9 @@ class MotherboardScanner(BaseScanner):
 
         try:
             # Get motherboard info
-            board_info = wmi_query("Win32_BaseBoard")
+            board_info = wmi_query(
+                "Win32_BaseBoard", properties=["Manufacturer", "Product", "SerialNumber", "Version"]
+            )
             if board_info:
                 board = board_info[0]
                 raw_data["manufacturer"] = board.get("Manufacturer", "Unknown")
@@ -35,7 +44,7 @@ class MotherboardScanner(BaseScanner):
                 ))
 
             # Get BIOS info
-            bios_info = wmi_query("Win32_BIOS")
+            bios_info = wmi_query("Win32_BIOS", properties=_BIOS_PROPERTIES)
             if bios_info:
                 bios = bios_info[0]
                 raw_data["bios_vendor"] = bios.get("Manufacturer", "Unknown")
@@ -61,7 +70,10 @@ class MotherboardScanner(BaseScanner):
                 ))
 
             # Get system info
-            system_info = wmi_query("Win32_ComputerSystem")
+            system_info = wmi_query(
+                "Win32_ComputerSystem",
+                properties=["Manufacturer", "Model", "SystemType", "TotalPhysicalMemory"]
+            )
             if system_info:
                 system = system_info[0]
                 raw_data["system_manufacturer"] = system.get("Manufacturer", "Unknown")
@@ -76,7 +88,9 @@ class MotherboardScanner(BaseScanner):
                 ))
 
             # Get computer system product (for laptops/OEM systems)
-            product_info = wmi_query("Win32_ComputerSystemProduct")
+            product_info = wmi_query(
+                "Win32_ComputerSystemProduct", properties=["Name", "UUID", "Vendor"]
+            )
             if product_info:
                 product = product_info[0]
                 raw_data["product_name"] = product.get("Name", "")
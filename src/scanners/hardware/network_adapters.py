@@ -6,6 +6,41 @@ from ...core.scanner import BaseScanner
 from ...core.result import ScanResult, Finding, Severity
 from ...utils.wmi_helper import wmi_query
 
+# Only the properties read below; the full adapter configuration class is large
+_ADAPTER_PROPERTIES = [
+    "Index", "PhysicalAdapter", "Name", "Description", "MACAddress", "Speed", "NetConnectionStatus"
+]
+_ADAPTER_CONFIG_PROPERTIES = [
+    "Index", "IPAddress", "DefaultIPGateway", "DNSServerSearchOrder", "DHCPEnabled"
+]
+
+# Connection status mapping (Win32_NetworkAdapter.NetConnectionStatus)
+CONNECTION_STATUS_MAP = {
+    0: "Disconnected",
+    1: "Connecting",
+    2: "Connected",
+    3: "Disconnecting",
+    4: "Hardware not present",
+    5: "Hardware disabled",
+    6: "Hardware malfunction",
+    7: "Media disconnected",
+    8: "Authenticating",
+    9: "Authentication succeeded",
+    10: "Authentication failed",
+    11: "Invalid address",
+    12: "Credentials required"
+}
+
+# Adapter type by name keyword, checked in order ("wlan" before "lan")
+ADAPTER_KINDS = (
+    ("wi-fi", "WiFi"),
+    ("wireless", "WiFi"),
+    ("wlan", "WiFi"),
+    ("ethernet", "Ethernet"),
+    ("lan", "Ethernet"),
+    ("bluetooth", "Bluetooth"),
+)
+
 
 class NetworkAdaptersScanner(BaseScanner):
     """Scan network adapter information."""
@@ -22,15 +57,16 @@ class NetworkAdaptersScanner(BaseScanner):
 
         try:
             # Get adapter configurations from WMI
-            configs = {}
-            config_info = wmi_query("Win32_NetworkAdapterConfiguration")
-            for cfg in config_info:
-                index = cfg.get("Index")
-                if index is not None:
-                    configs[index] = cfg
+            configs = {
+                cfg["Index"]: cfg
+                for cfg in wmi_query(
+                    "Win32_NetworkAdapterConfiguration", properties=_ADAPTER_CONFIG_PROPERTIES
+                )
+                if cfg.get("Index") is not None
+            }
 
             # Get physical adapters from WMI
-            adapters = wmi_query("Win32_NetworkAdapter")
+            adapters = wmi_query("Win32_NetworkAdapter", properties=_ADAPTER_PROPERTIES)
             for adapter in adapters:
                 # Only physical adapters
                 if not adapter.get("PhysicalAdapter"):
@@ -40,9 +76,10 @@ class NetworkAdaptersScanner(BaseScanner):
                 config = configs.get(index, {})
 
                 # Get IP addresses
-                ip_addresses = config.get("IPAddress", []) or []
-                ipv4 = [ip for ip in ip_addresses if ip and ":" not in ip]
-                ipv6 = [ip for ip in ip_addresses if ip and ":" in ip]
+                ipv4, ipv6 = [], []
+                for ip in config.get("IPAddress") or []:
+                    if ip:
+                        (ipv6 if ":" in ip else ipv4).append(ip)
 
                 # Get speed in Mbps
                 speed = adapter.get("Speed")
@@ -64,33 +101,13 @@ class NetworkAdaptersScanner(BaseScanner):
                 raw_data["adapters"].append(adapter_info)
 
                 # Determine connection status
-                status_map = {
-                    0: "Disconnected",
-                    1: "Connecting",
-                    2: "Connected",
-                    3: "Disconnecting",
-                    4: "Hardware not present",
-                    5: "Hardware disabled",
-                    6: "Hardware malfunction",
-                    7: "Media disconnected",
-                    8: "Authenticating",
-                    9: "Authentication succeeded",
-                    10: "Authentication failed",
-                    11: "Invalid address",
-                    12: "Credentials required"
-                }
-                status_text = status_map.get(adapter_info["status"], "Unknown")
+                status_text = CONNECTION_STATUS_MAP.get(adapter_info["status"], "Unknown")
 
                 # Determine adapter type
                 name_lower = adapter_info["name"].lower()
-                if "wi-fi" in name_lower or "wireless" in name_lower or "wlan" in name_lower:
-                    adapter_type = "WiFi"
-                elif "ethernet" in name_lower or "lan" in name_lower:
-                    adapter_type = "Ethernet"
-                elif "bluetooth" in name_lower:
-                    adapter_type = "Bluetooth"
-                else:
-                    adapter_type = "Network"
+                adapter_type = next(
+                    (kind for keyword, kind in ADAPTER_KINDS if keyword in name_lower), "Network"
+                )
 
                 # Connection status severity
                 severity = Severity.PASS if adapter_info["status"] == 2 else Severity.INFO
@@ -1,9 +1,13 @@
 """Network diagnostic scanners."""
+import importlib
 
-from .connectivity import ConnectivityScanner
-from .wifi import WiFiScanner
-from .dns import DNSScanner
-from .speed_test import SpeedTestScanner
+# Scanner class -> submodule; imported on first attribute access
+_EXPORTS = {
+    'ConnectivityScanner': '.connectivity',
+    'WiFiScanner': '.wifi',
+    'DNSScanner': '.dns',
+    'SpeedTestScanner': '.speed_test',
+}
 
 __all__ = [
     'ConnectivityScanner',
@@ -11,3 +15,10 @@ __all__ = [
     'DNSScanner',
     'SpeedTestScanner'
 ]
+
+
+def __getattr__(name):
+    """Import scanner modules lazily so one scanner doesn't load its siblings."""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,6 +19,7 @@ class SpeedTestScanner(BaseScanner):
     description = "Network speed and latency estimation"
     requires_admin = False
     dependencies = []
+    parallel_safe = False  # Saturates the link; run alone after other scanners
 
     # Test files for download speed estimation (small files for quick test)
     DOWNLOAD_URLS = [
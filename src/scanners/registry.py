@@ -0,0 +1,133 @@
+"""Scanner registry - Scanner metadata available without importing scanner modules."""
+import functools
+import importlib
+from typing import List, NamedTuple, Tuple
+
+from ..core.engine import ScanEngine
+from ..core.scanner import BaseScanner
+
+
+class ScannerSpec(NamedTuple):
+    """Where to find a scanner class, plus the metadata shown before it is loaded."""
+    module: str
+    class_name: str
+    name: str
+    category: str
+    requires_admin: bool
+
+    @property
+    def key(self) -> str:
+        """Normalized key, as used by ScanEngine."""
+        return self.name.lower().replace(" ", "_")
+
+    def load(self) -> BaseScanner:
+        """Import the scanner module and instantiate the scanner."""
+        module = importlib.import_module(f"{__package__}.{self.module}")
+        return getattr(module, self.class_name)()
+
+
+# All scanners, in report order. Keep in sync with the scanner class attributes
+# (build/build.py checks this before building). The PyInstaller spec also takes
+# its scanner hidden imports from this list.
+SCANNERS = (
+    # Hardware
+    ScannerSpec("hardware.cpu", "CPUScanner", "CPU", "hardware", False),
+    ScannerSpec("hardware.gpu", "GPUScanner", "GPU", "hardware", False),
+    ScannerSpec("hardware.memory", "MemoryScanner", "Memory", "hardware", False),
+    ScannerSpec("hardware.storage", "StorageScanner", "Storage", "hardware", False),
+    ScannerSpec("hardware.battery", "BatteryScanner", "Battery", "hardware", False),
+    ScannerSpec("hardware.motherboard", "MotherboardScanner", "Motherboard", "hardware", False),
+    ScannerSpec("hardware.network_adapters", "NetworkAdaptersScanner", "Network Adapters", "hardware", False),
+    ScannerSpec("hardware.peripherals", "PeripheralsScanner", "Peripherals", "hardware", False),
+    # Security
+    ScannerSpec("security.antivirus", "AntivirusScanner", "Antivirus", "security", False),
+    ScannerSpec("security.firewall", "FirewallScanner", "Firewall", "security", False),
+    ScannerSpec("security.windows_update", "WindowsUpdateScanner", "Windows Update", "security", False),
+    ScannerSpec("security.ports", "PortsScanner", "Open Ports", "security", False),
+    ScannerSpec("security.processes", "ProcessesScanner", "Processes", "security", False),
+    ScannerSpec("security.startup", "StartupScanner", "Startup Programs", "security", False),
+    ScannerSpec("security.services", "ServicesScanner", "Services", "security", False),
+    ScannerSpec("security.users", "UsersScanner", "User Accounts", "security", False),
+    ScannerSpec("security.bitlocker", "BitLockerScanner", "BitLocker", "security", True),
+    ScannerSpec("security.secure_boot", "SecureBootScanner", "Secure Boot", "security", False),
+    ScannerSpec("security.uac", "UACScanner", "UAC", "security", False),
+    ScannerSpec("security.password_policy", "PasswordPolicyScanner", "Password Policy", "security", False),
+    ScannerSpec("security.event_log", "EventLogScanner", "Event Log", "security", True),
+    # Network
+    ScannerSpec("network.connectivity", "ConnectivityScanner", "Connectivity", "network", False),
+    ScannerSpec("network.wifi", "WiFiScanner", "WiFi", "network", False),
+    ScannerSpec("network.dns", "DNSScanner", "DNS", "network", False),
+    ScannerSpec("network.speed_test", "SpeedTestScanner", "Speed Test", "network", False),
+    # System
+    ScannerSpec("system.os_info", "OSInfoScanner", "OS Info", "system", False),
+)
+
+
+def module_names() -> List[str]:
+    """Get the fully qualified module names of all scanners."""
+    return [f"{__package__}.{spec.module}" for spec in SCANNERS]
+
+
+def check_registry() -> List[str]:
+    """
+    Compare the registry against the scanner classes it points to.
+
+    Imports every scanner module, so only run this where all scanner
+    dependencies are installed (e.g. before a build).
+
+    Returns:
+        List of mismatch descriptions (empty if the registry is in sync)
+    """
+    problems = []
+    for spec in SCANNERS:
+        try:
+            module = importlib.import_module(f"{__package__}.{spec.module}")
+            cls = getattr(module, spec.class_name)
+        except (ImportError, AttributeError) as e:
+            problems.append(f"{spec.module}.{spec.class_name}: {e}")
+            continue
+
+        for field in ("name", "category", "requires_admin"):
+            expected = getattr(spec, field)
+            actual = getattr(cls, field)
+            if actual != expected:
+                problems.append(
+                    f"{spec.class_name}.{field} is {actual!r}, registry has {expected!r}"
+                )
+    return problems
+
+
+def specs_for_mode(mode: str) -> List[ScannerSpec]:
+    """Get the specs of scanners that run in the given scan mode."""
+    return [spec for spec in SCANNERS if ScanEngine.mode_includes(mode, spec.key, spec.category)]
+
+
+@functools.lru_cache(maxsize=None)
+def _instance(spec: ScannerSpec) -> BaseScanner:
+    """Load a scanner once per process and share the instance."""
+    return spec.load()
+
+
+def get_scanner(key: str) -> BaseScanner:
+    """
+    Get the shared instance of a scanner by its normalized key.
+
+    Raises:
+        KeyError: If no scanner has the given key
+    """
+    for spec in SCANNERS:
+        if spec.key == key:
+            return _instance(spec)
+    raise KeyError(key)
+
+
+@functools.lru_cache(maxsize=None)
+def load_scanners(mode: str = "full") -> Tuple[BaseScanner, ...]:
+    """
+    Get the scanners needed for the given scan mode.
+
+    Only the required modules are imported. Instances are created once and
+    shared between modes, so repeated scans (e.g. from the interactive menu)
+    skip scanner construction.
+    """
+    return tuple(_instance(spec) for spec in specs_for_mode(mode))
@@ -1,17 +1,22 @@
 """Security scanners - AV, Firewall, Registry, etc."""
-from .antivirus import AntivirusScanner
-from .firewall import FirewallScanner
-from .windows_update import WindowsUpdateScanner
-from .ports import PortsScanner
-from .processes import ProcessesScanner
-from .startup import StartupScanner
-from .services import ServicesScanner
-from .users import UsersScanner
-from .bitlocker import BitLockerScanner
-from .secure_boot import SecureBootScanner
-from .uac import UACScanner
-from .password_policy import PasswordPolicyScanner
-from .event_log import EventLogScanner
+import importlib
+
+# Scanner class -> submodule; imported on first attribute access
+_EXPORTS = {
+    "AntivirusScanner": ".antivirus",
+    "FirewallScanner": ".firewall",
+    "WindowsUpdateScanner": ".windows_update",
+    "PortsScanner": ".ports",
+    "ProcessesScanner": ".processes",
+    "StartupScanner": ".startup",
+    "ServicesScanner": ".services",
+    "UsersScanner": ".users",
+    "BitLockerScanner": ".bitlocker",
+    "SecureBootScanner": ".secure_boot",
+    "UACScanner": ".uac",
+    "PasswordPolicyScanner": ".password_policy",
+    "EventLogScanner": ".event_log",
+}
 
 __all__ = [
     "AntivirusScanner",
@@ -28,3 +33,10 @@ __all__ = [
     "PasswordPolicyScanner",
     "EventLogScanner",
 ]
+
+
+def __getattr__(name):
+    """Import scanner modules lazily so one scanner doesn't load its siblings."""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,10 +3,12 @@ import subprocess
 from typing import List, Dict
 
 from ...core.scanner import BaseScanner
+from ...core.cache import CachingScanner
 from ...core.result import ScanResult, Finding, Severity
+from ...utils.subprocess_pool import map_concurrent
 
 
-class BitLockerScanner(BaseScanner):
+class BitLockerScanner(CachingScanner, BaseScanner):
     """Check BitLocker encryption status on all drives."""
 
     name = "BitLocker"
@@ -14,6 +16,7 @@ class BitLockerScanner(BaseScanner):
     description = "Disk encryption status"
     requires_admin = True  # BitLocker status requires admin
     dependencies = []
+    cache_ttl = 3600
 
     def scan(self) -> ScanResult:
         findings: List[Finding] = []
@@ -124,9 +127,8 @@ class BitLockerScanner(BaseScanner):
                 if line and ':' in line and 'DeviceID' not in line:
                     drive_letters.append(line)
 
-            # Check BitLocker status for each drive
-            for drive in drive_letters:
-                status_info = self._get_drive_bitlocker_status(drive)
+            # Check BitLocker status for all drives at once
+            for status_info in map_concurrent(self._get_drive_bitlocker_status, drive_letters):
                 if status_info:
                     drives.append(status_info)
 
@@ -4,6 +4,7 @@ import subprocess
 
 from ...core.scanner import BaseScanner
 from ...core.result import ScanResult, Finding, Severity
+from ...utils.subprocess_pool import map_concurrent
 
 
 class FirewallScanner(BaseScanner):
@@ -21,10 +22,10 @@ class FirewallScanner(BaseScanner):
         try:
             # Get firewall status using netsh
             profiles = ["Domain", "Private", "Public"]
+            statuses = map_concurrent(self._get_profile_status, profiles)
 
             all_enabled = True
-            for profile in profiles:
-                status = self._get_profile_status(profile)
+            for profile, status in zip(profiles, statuses):
                 raw_data["profiles"][profile] = status
 
                 if status.get("enabled"):
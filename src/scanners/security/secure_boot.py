@@ -4,10 +4,12 @@ import winreg
 from typing import List, Dict, Optional
 
 from ...core.scanner import BaseScanner
+from ...core.cache import CachingScanner
 from ...core.result import ScanResult, Finding, Severity
+from ...utils.subprocess_pool import call_concurrent
 
 
-class SecureBootScanner(BaseScanner):
+class SecureBootScanner(CachingScanner, BaseScanner):
     """Check Secure Boot, UEFI mode, and TPM status."""
 
     name = "Secure Boot"
@@ -15,6 +17,7 @@ class SecureBootScanner(BaseScanner):
     description = "Secure Boot, UEFI, and TPM status"
     requires_admin = False
     dependencies = []
+    cache_ttl = 86400  # Firmware state only changes across reboots
 
     def scan(self) -> ScanResult:
         findings: List[Finding] = []
@@ -26,8 +29,14 @@ class SecureBootScanner(BaseScanner):
             "tpm_ready": None,
         }
 
+        # The three checks shell out independently; run them together
+        secure_boot, uefi_mode, tpm_info = call_concurrent(
+            self._check_secure_boot,
+            self._check_uefi_mode,
+            self._check_tpm
+        )
+
         # Check Secure Boot status
-        secure_boot = self._check_secure_boot()
         raw_data["secure_boot_enabled"] = secure_boot
 
         if secure_boot is True:
@@ -51,7 +60,6 @@ class SecureBootScanner(BaseScanner):
             ))
 
         # Check UEFI vs Legacy BIOS
-        uefi_mode = self._check_uefi_mode()
         raw_data["uefi_mode"] = uefi_mode
 
         if uefi_mode == "UEFI":
@@ -75,7 +83,6 @@ class SecureBootScanner(BaseScanner):
             ))
 
         # Check TPM status
-        tpm_info = self._check_tpm()
         raw_data["tpm_present"] = tpm_info.get("present")
         raw_data["tpm_version"] = tpm_info.get("version")
         raw_data["tpm_ready"] = tpm_info.get("ready")
@@ -6,6 +6,7 @@ from ...core.scanner import BaseScanner
 from ...core.result import ScanResult, Finding, Severity
 from ...utils.registry import get_startup_entries, list_subkeys, read_all_values
 from ...utils.wmi_helper import wmi_query
+from ...utils.subprocess_pool import call_concurrent, map_concurrent
 
 
 class StartupScanner(BaseScanner):
@@ -25,16 +26,15 @@ class StartupScanner(BaseScanner):
         }
 
         try:
-            # Get registry startup entries
-            registry_entries = get_startup_entries()
+            # Registry entries, startup folder items and scheduled tasks
+            # (startup/login triggers) are independent; collect them together
+            registry_entries, startup_folder, scheduled_tasks = call_concurrent(
+                get_startup_entries,
+                self._get_startup_folder_items,
+                self._get_startup_tasks
+            )
             raw_data["registry_entries"] = registry_entries
-
-            # Get startup folder items
-            startup_folder = self._get_startup_folder_items()
             raw_data["startup_folder"] = startup_folder
-
-            # Get scheduled tasks that run at startup/login
-            scheduled_tasks = self._get_startup_tasks()
             raw_data["scheduled_tasks"] = scheduled_tasks
 
             total_entries = len(registry_entries) + len(startup_folder) + len(scheduled_tasks)
@@ -113,11 +113,17 @@ class StartupScanner(BaseScanner):
                         items.append({
                             "name": item,
                             "path": full_path,
-                            "target": self._get_shortcut_target(full_path) if item.endswith('.lnk') else full_path
+                            "target": full_path
                         })
                 except Exception:
                     pass
 
+        # Resolve shortcut targets (one PowerShell call each) concurrently
+        shortcuts = [item for item in items if item["name"].endswith('.lnk')]
+        targets = map_concurrent(self._get_shortcut_target, [item["path"] for item in shortcuts])
+        for item, target in zip(shortcuts, targets):
+            item["target"] = target
+
         return items
 
     def _get_shortcut_target(self, lnk_path: str) -> str:
@@ -3,24 +3,37 @@ from typing import List
 import subprocess
 
 from ...core.scanner import BaseScanner
+from ...core.cache import CachingScanner, file_mtime
 from ...core.result import ScanResult, Finding, Severity
+from ...utils.subprocess_pool import call_concurrent
 
 
-class WindowsUpdateScanner(BaseScanner):
+class WindowsUpdateScanner(CachingScanner, BaseScanner):
     """Scan Windows Update status."""
 
     name = "Windows Update"
     category = "security"
     description = "Pending updates and update history"
     requires_admin = False
+    cache_ttl = 3600
+
+    # Update datastore log; rewritten whenever Windows Update runs
+    UPDATE_LOG = r"C:\Windows\SoftwareDistribution\DataStore\Logs\edb.log"
+
+    def cache_invalidators(self):
+        """Invalidate on reboot or when Windows Update touches its datastore."""
+        return super().cache_invalidators() + (file_mtime(self.UPDATE_LOG),)
 
     def scan(self) -> ScanResult:
         findings: List[Finding] = []
         raw_data = {}
 
         try:
-            # Get pending updates
-            pending = self._get_pending_updates()
+            # The pending-update search is slow; fetch the last update date alongside it
+            pending, last_update = call_concurrent(
+                self._get_pending_updates,
+                self._get_last_update_date
+            )
             raw_data["pending_updates"] = pending
 
             if pending:
@@ -58,8 +71,7 @@ class WindowsUpdateScanner(BaseScanner):
                     severity=Severity.PASS
                 ))
 
-            # Get last update date
-            last_update = self._get_last_update_date()
+            # Last update date
             raw_data["last_update"] = last_update
 
             if last_update:
@@ -1,6 +1,18 @@
 """System scanners - OS info, services, drivers."""
-from .os_info import OSInfoScanner
+import importlib
+
+# Scanner class -> submodule; imported on first attribute access
+_EXPORTS = {
+    "OSInfoScanner": ".os_info",
+}
 
 __all__ = [
     "OSInfoScanner",
 ]
+
+
+def __getattr__(name):
+    """Import scanner modules lazily so one scanner doesn't load its siblings."""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,18 +3,20 @@ import platform
 from typing import List
 
 from ...core.scanner import BaseScanner
+from ...core.cache import CachingScanner
 from ...core.result import ScanResult, Finding, Severity
 from ...utils.wmi_helper import wmi_query
 from ...utils.registry import read_value, RegistryPaths
 
 
-class OSInfoScanner(BaseScanner):
+class OSInfoScanner(CachingScanner, BaseScanner):
     """Scan operating system information."""
 
     name = "OS Info"
     category = "system"
     description = "Windows version and system details"
     requires_admin = False
+    cache_ttl = 3600
 
     def scan(self) -> ScanResult:
         findings: List[Finding] = []
@@ -1,7 +1,18 @@
 """Stress testing modules for CPU, GPU, and Memory."""
+import importlib
 
-from .cpu_stress import CPUStressTest
-from .gpu_stress import GPUStressTest
-from .memory_stress import MemoryStressTest
+# Test class -> submodule; imported on first attribute access
+_EXPORTS = {
+    "CPUStressTest": ".cpu_stress",
+    "GPUStressTest": ".gpu_stress",
+    "MemoryStressTest": ".memory_stress",
+}
 
 __all__ = ['CPUStressTest', 'GPUStressTest', 'MemoryStressTest']
+
+
+def __getattr__(name):
+    """Import test modules lazily, e.g. so CPU stress workers don't load numpy."""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,13 +5,15 @@ Performs intensive CPU workload to stress test all cores.
 Monitors temperature and utilization during the test.
 """
 
-import multiprocessing
 import time
 import math
 import psutil
+from multiprocessing.pool import AsyncResult
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass, field
 
+from . import pool
+
 
 @dataclass
 class CPUStressResult:
@@ -31,11 +33,12 @@ class CPUStressResult:
     error: Optional[str] = None
 
 
-def _stress_worker(stop_event: multiprocessing.Event):
+def _stress_worker():
     """
     Worker function that performs CPU-intensive calculations.
-    Runs until stop_event is set.
+    Runs in a pool process until the pool's stop event is set.
     """
+    stop_event = pool.worker_stop_event
     while not stop_event.is_set():
         # Heavy math operations to stress CPU
         for _ in range(10000):
@@ -70,8 +73,8 @@ def _get_cpu_temp() -> Optional[float]:
 
     # WMI fallback for Windows
     try:
-        import wmi
-        w = wmi.WMI(namespace="root\\WMI")
+        from ..utils.wmi_helper import wmi_connection
+        w = wmi_connection("root\\WMI")
         temp_info = w.MSAcpi_ThermalZoneTemperature()
         if temp_info:
             # Convert from deciKelvin to Celsius
@@ -83,15 +86,93 @@ def _get_cpu_temp() -> Optional[float]:
     return None
 
 
+def _core_efficiency_classes() -> List[int]:
+    """
+    Get the EfficiencyClass of each physical core via GetLogicalProcessorInformationEx.
+
+    Higher classes are faster cores (P-cores on hybrid Intel CPUs). Returns an
+    empty list where the API is unavailable (non-Windows, Windows 7).
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        relation_processor_core = 0
+        get_info = ctypes.windll.kernel32.GetLogicalProcessorInformationEx
+
+        length = wintypes.DWORD(0)
+        get_info(relation_processor_core, None, ctypes.byref(length))
+        buffer = ctypes.create_string_buffer(length.value)
+        if not get_info(relation_processor_core, buffer, ctypes.byref(length)):
+            return []
+
+        # Variable-size records: Relationship (DWORD), Size (DWORD), then
+        # PROCESSOR_RELATIONSHIP starting with Flags (BYTE), EfficiencyClass (BYTE)
+        raw = buffer.raw
+        classes = []
+        offset = 0
+        while offset + 10 <= length.value:
+            size = int.from_bytes(raw[offset + 4:offset + 8], 'little')
+            if size <= 0:
+                break
+            classes.append(raw[offset + 9])
+            offset += size
+        return classes
+    except Exception:
+        return []
+
+
+def get_core_topology() -> Dict[str, int]:
+    """
+    Get CPU core counts.
+
+    Returns:
+        Dict with 'logical' CPUs, 'physical' cores, and the physical cores split
+        into 'performance' and 'efficiency' (all performance on non-hybrid CPUs)
+    """
+    logical = psutil.cpu_count(logical=True) or 4
+    classes = _core_efficiency_classes()
+    if classes:
+        physical = len(classes)
+        performance = sum(1 for c in classes if c == max(classes))
+    else:
+        physical = psutil.cpu_count(logical=False) or logical
+        performance = physical
+
+    return {
+        'logical': logical,
+        'physical': physical,
+        'performance': performance,
+        'efficiency': physical - performance,
+    }
+
+
 class CPUStressTest:
     """CPU Stress Test that loads all cores with intensive calculations."""
 
     def __init__(self):
-        self.cpu_count = psutil.cpu_count(logical=True) or 4
-        self.processes: List[multiprocessing.Process] = []
-        self.stop_event: Optional[multiprocessing.Event] = None
+        self.topology = get_core_topology()
+        self.cpu_count = self.topology['logical']
+        # One worker per physical core: a second worker on an SMT sibling
+        # competes for the same core and skews the readings
+        self.default_workers = self.topology['physical']
+        self.tasks: List[AsyncResult] = []
         self.running = False
 
+    def describe_workers(self, workers: Optional[int] = None) -> str:
+        """Describe the worker count for display, e.g. '16 workers (8P + 8E cores, 24 logical CPUs)'."""
+        count = self.worker_count(workers)
+        topo = self.topology
+        if topo['efficiency']:
+            cores = f"{topo['performance']}P + {topo['efficiency']}E cores"
+        else:
+            cores = f"{topo['physical']} cores"
+        return f"{count} workers ({cores}, {topo['logical']} logical CPUs)"
+
+    def worker_count(self, workers: Optional[int] = None) -> int:
+        """Get the number of workers a run will use (capped at the logical CPU count)."""
+        return max(1, min(workers or self.default_workers, self.cpu_count))
+
     def run(
         self,
         duration: int = 60,
@@ -103,13 +184,13 @@ class CPUStressTest:
 
         Args:
             duration: Test duration in seconds (default 60)
-            cores: Number of cores to stress (default: all)
+            cores: Number of worker processes (default: one per physical core)
             progress_callback: Called each second with (elapsed_seconds, current_stats)
 
         Returns:
             CPUStressResult with test results
         """
-        cores_to_use = cores or self.cpu_count
+        cores_to_use = self.worker_count(cores)
         result = CPUStressResult(
             duration_seconds=duration,
             cores_tested=cores_to_use
@@ -120,15 +201,9 @@ class CPUStressTest:
         frequencies: List[float] = []
 
         try:
-            # Create stop event and worker processes
-            self.stop_event = multiprocessing.Event()
-            self.processes = []
-
-            # Start worker processes for each core
-            for _ in range(cores_to_use):
-                p = multiprocessing.Process(target=_stress_worker, args=(self.stop_event,))
-                p.start()
-                self.processes.append(p)
+            # Load the cores from the persistent worker pool (grown if
+            # this run needs more workers than it has)
+            self.tasks = pool.submit(_stress_worker, cores_to_use)
 
             self.running = True
             start_time = time.time()
@@ -169,12 +244,9 @@ class CPUStressTest:
                 if frequencies and current_freq < frequencies[0] * 0.9:
                     result.throttling_detected = True
 
-            # Stop workers
-            self.stop_event.set()
-            for p in self.processes:
-                p.join(timeout=2)
-                if p.is_alive():
-                    p.terminate()
+            # Stop workers (the pool processes stay alive for the next run)
+            pool.stop(self.tasks)
+            self.tasks = []
 
             self.running = False
 
@@ -207,11 +279,5 @@ class CPUStressTest:
     def stop(self):
         """Stop the stress test."""
         self.running = False
-        if self.stop_event:
-            self.stop_event.set()
-
-        for p in self.processes:
-            if p.is_alive():
-                p.terminate()
-
-        self.processes = []
+        pool.stop(self.tasks)
+        self.tasks = []
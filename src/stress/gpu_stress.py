@@ -91,8 +91,8 @@ def _get_nvidia_gpu_stats() -> Optional[Dict]:
 def _get_gpu_stats_wmi() -> Optional[Dict]:
     """Get GPU stats using WMI (fallback for non-NVIDIA)."""
     try:
-        import wmi
-        w = wmi.WMI()
+        from ..utils.wmi_helper import wmi_connection
+        w = wmi_connection()
         gpus = w.Win32_VideoController()
         if gpus:
             gpu = gpus[0]
@@ -0,0 +1,116 @@
+"""
+Persistent Worker Pool
+
+Keeps stress-test worker processes alive between runs so repeated tests
+don't pay process spawn cost (significant on Windows, where every worker
+re-imports the application).
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from typing import Callable, Optional
+
+_pool = None
+_pool_size = 0
+_stop_event = None
+_pool_lock = threading.Lock()
+
+# Set in each worker by _init_worker; signals long-running tasks to return
+worker_stop_event = None
+
+
+def _init_worker(stop_event):
+    """Pool initializer - store the shared stop event in the worker."""
+    global worker_stop_event
+    worker_stop_event = stop_event
+
+
+def _noop():
+    """Task used to wait for workers to finish starting."""
+    return None
+
+
+def _terminate():
+    """Kill the pool's workers and forget it; the next get_pool() starts fresh ones."""
+    global _pool, _pool_size, _stop_event
+    if _pool is not None:
+        _pool.terminate()
+    _pool = None
+    _pool_size = 0
+    _stop_event = None
+
+
+def _shutdown():
+    """Terminate the pool at interpreter exit."""
+    with _pool_lock:
+        _terminate()
+
+
+atexit.register(_shutdown)
+
+
+def get_pool(processes: Optional[int] = None):
+    """
+    Get the shared worker pool, creating it on first use.
+
+    Args:
+        processes: Worker count needed (default: logical CPU count). A pool
+            with fewer workers is replaced by a larger one.
+
+    Returns:
+        Tuple of (pool, stop_event). Set stop_event to make running tasks
+        return; clear it before submitting new ones.
+    """
+    global _pool, _pool_size, _stop_event
+    processes = processes or os.cpu_count() or 4
+    with _pool_lock:
+        if _pool is not None and _pool_size < processes:
+            _terminate()
+        if _pool is None:
+            _stop_event = multiprocessing.Event()
+            _pool = multiprocessing.Pool(
+                processes=processes,
+                initializer=_init_worker,
+                initargs=(_stop_event,)
+            )
+            _pool_size = processes
+        return _pool, _stop_event
+
+
+def prewarm(processes: Optional[int] = None):
+    """Start the pool in the background so the first stress test starts immediately."""
+    pool, _ = get_pool(processes)
+    pool.apply_async(_noop)
+
+
+def submit(func: Callable, count: int):
+    """
+    Submit count copies of func to the pool.
+
+    func must be a module-level function that returns once
+    worker_stop_event is set.
+
+    Returns:
+        List of AsyncResult objects
+    """
+    pool, stop_event = get_pool(count)
+    stop_event.clear()
+    return [pool.apply_async(func) for _ in range(count)]
+
+
+def stop(tasks, timeout: float = 2.0):
+    """
+    Signal running tasks to return and wait for them to finish.
+
+    Workers still busy after the timeout are terminated, so they don't keep
+    loading a core after the test ends or hold up the next run's tasks.
+    """
+    if _stop_event is not None:
+        _stop_event.set()
+    for task in tasks:
+        task.wait(timeout)
+    if not all(task.ready() for task in tasks):
+        with _pool_lock:
+            _terminate()
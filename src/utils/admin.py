@@ -1,11 +1,18 @@
 """Admin privilege detection and elevation utilities."""
 import ctypes
+import functools
 import sys
 import os
 
 
+@functools.lru_cache(maxsize=None)
 def is_admin() -> bool:
-    """Check if the current process has administrator privileges."""
+    """
+    Check if the current process has administrator privileges.
+
+    Cached - a process cannot gain or lose elevation while running
+    (request_elevation restarts the application instead).
+    """
     try:
         return ctypes.windll.shell32.IsUserAnAdmin() != 0
     except Exception:
@@ -1,4 +1,6 @@
 """Dependency installer for PC Diagnostics Tool."""
+import functools
+import importlib
 import subprocess
 import sys
 from pathlib import Path
@@ -14,11 +16,11 @@ REQUIRED_PACKAGES = {
     'cpuinfo': 'py-cpuinfo',
     'pynvml': 'pynvml',
     'GPUtil': 'GPUtil',
-    'typer': 'typer[all]',
     'rich': 'rich',
     'questionary': 'questionary',
     'yaml': 'pyyaml',
     'pydantic': 'pydantic',
+    'orjson': 'orjson',
 }
 
 
@@ -59,6 +61,12 @@ def get_installed_packages() -> List[Tuple[str, str]]:
     return installed
 
 
+def _forget_status():
+    """Drop the cached dependency status so the next read re-probes packages."""
+    importlib.invalidate_caches()
+    _probe_dependencies.cache_clear()
+
+
 def install_package(pip_name: str) -> Tuple[bool, str]:
     """
     Install a single package using pip.
@@ -84,6 +92,8 @@ def install_package(pip_name: str) -> Tuple[bool, str]:
         return False, f"Timeout installing {pip_name}"
     except Exception as e:
         return False, f"Error installing {pip_name}: {str(e)}"
+    finally:
+        _forget_status()
 
 
 def install_packages(packages: List[str]) -> List[Tuple[str, bool, str]]:
@@ -138,6 +148,8 @@ def install_all_requirements() -> Tuple[bool, str]:
         return False, "Timeout installing dependencies"
     except Exception as e:
         return False, f"Error installing dependencies: {str(e)}"
+    finally:
+        _forget_status()
 
 
 def upgrade_pip() -> Tuple[bool, str]:
@@ -157,20 +169,40 @@ def upgrade_pip() -> Tuple[bool, str]:
         return False, f"Error upgrading pip: {str(e)}"
 
 
+@functools.lru_cache(maxsize=1)
+def _probe_dependencies() -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]:
+    """
+    Probe every required package once.
+
+    The result is cached until a package install through this module
+    finishes.
+
+    Returns:
+        Tuple of (installed, missing) (import_name, pip_name) pairs
+    """
+    installed = []
+    missing = []
+    for import_name, pip_name in REQUIRED_PACKAGES.items():
+        if check_package(import_name):
+            installed.append((import_name, pip_name))
+        else:
+            missing.append((import_name, pip_name))
+    return tuple(installed), tuple(missing)
+
+
 def get_dependency_status() -> dict:
     """
     Get complete status of all dependencies.
 
     Returns:
-        Dict with 'installed', 'missing', and 'total' counts
+        Dict with 'installed', 'missing', and 'total' counts. It is built
+        fresh on each call, so callers may modify it.
     """
-    missing = check_missing_dependencies()
-    installed = get_installed_packages()
-
+    installed, missing = _probe_dependencies()
     return {
         'installed': len(installed),
         'missing': len(missing),
         'total': len(REQUIRED_PACKAGES),
-        'installed_list': installed,
-        'missing_list': missing
+        'installed_list': list(installed),
+        'missing_list': list(missing)
     }
@@ -0,0 +1,50 @@
+"""Run independent subprocess-bound calls concurrently."""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Process creation dominates these calls, so a small pool is enough
+DEFAULT_MAX_WORKERS = 4
+
+
+def map_concurrent(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    initializer: Optional[Callable[[], None]] = None
+) -> List[R]:
+    """
+    Call func on each item concurrently.
+
+    Args:
+        func: Function to call on each item
+        items: Items to process
+        max_workers: Upper bound on concurrent calls
+        initializer: Optional per-thread setup (e.g. COM initialization),
+            run in each worker thread before its first call
+
+    Returns:
+        Results in the same order as items
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        initializer=initializer
+    ) as executor:
+        return list(executor.map(func, items))
+
+
+def call_concurrent(
+    *funcs: Callable[[], Any],
+    initializer: Optional[Callable[[], None]] = None
+) -> List[Any]:
+    """Call several no-argument functions concurrently and return their results in order."""
+    return map_concurrent(
+        lambda func: func(), funcs, max_workers=len(funcs) or 1, initializer=initializer
+    )
+
@@ -1,58 +1,113 @@
 """WMI query helper with fallbacks."""
 import subprocess
 import json
-from typing import Any, Dict, List, Optional
-from functools import lru_cache
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class WMIHelper:
     """Helper class for Windows Management Instrumentation queries."""
 
     def __init__(self):
-        self._wmi = None
+        # COM objects are bound to the thread that created them, so each
+        # thread keeps its own connection per namespace.
+        self._local = threading.local()
+        # Non-empty query results, keyed by query arguments. Empty results
+        # aren't kept, as they may come from a failed COM call.
+        self._results: Dict[tuple, Any] = {}
+        self._results_lock = threading.Lock()
         self._wmi_available = self._check_wmi()
 
     def _check_wmi(self) -> bool:
-        """Check if WMI module is available."""
+        """Check if WMI module is available (probed with COM initialized, whatever the thread)."""
         try:
-            import wmi
-            self._wmi = wmi.WMI()
-            return True
+            return self.get_connection() is not None
         except ImportError:
             return False
         except Exception:
             return False
 
-    @lru_cache(maxsize=50)
-    def query(self, wmi_class: str, namespace: str = "root\\cimv2") -> List[Dict[str, Any]]:
+    def get_connection(self, namespace: str = "root\\cimv2"):
+        """
+        Get a WMI connection for a namespace, reused within the current thread.
+
+        Connecting costs a COM round-trip, so callers should use this rather
+        than creating their own wmi.WMI() instances. COM is initialized on a
+        thread's first call, so any thread may connect.
+        """
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            init_com_thread()
+            connections = self._local.connections = {}
+
+        conn = connections.get(namespace)
+        if conn is None:
+            import wmi
+            conn = wmi.WMI(namespace=namespace)
+            connections[namespace] = conn
+        return conn
+
+    def _cached(self, key: tuple, fetch, keep) -> Any:
+        """Get a cached query result, or fetch it and cache it if keep(result) is true."""
+        with self._results_lock:
+            if key in self._results:
+                return self._results[key]
+        result = fetch()
+        if keep(result):
+            with self._results_lock:
+                self._results[key] = result
+        return result
+
+    def query(
+        self,
+        wmi_class: str,
+        namespace: str = "root\\cimv2",
+        properties: Optional[Tuple[str, ...]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Query a WMI class and return results as list of dictionaries.
 
         Args:
             wmi_class: WMI class name (e.g., "Win32_Processor")
             namespace: WMI namespace (default: root\\cimv2)
+            properties: Properties to fetch (default: all). Selecting only
+                the needed properties spares the provider from computing the
+                rest, some of which are slow (e.g. Win32_Processor.LoadPercentage).
 
         Returns:
             List of dictionaries with WMI object properties
         """
+        return self._cached(
+            ("query", wmi_class, namespace, properties),
+            lambda: self._query_uncached(wmi_class, namespace, properties),
+            bool
+        )
+
+    def _query_uncached(
+        self, wmi_class: str, namespace: str, properties: Optional[Tuple[str, ...]]
+    ) -> List[Dict[str, Any]]:
+        """Run a query through WMI, or PowerShell where WMI is unavailable."""
         if self._wmi_available:
-            return self._query_wmi(wmi_class, namespace)
+            return self._query_wmi(wmi_class, namespace, properties)
         else:
-            return self._query_powershell(wmi_class)
+            return self._query_powershell(wmi_class, properties)
 
-    def _query_wmi(self, wmi_class: str, namespace: str) -> List[Dict[str, Any]]:
+    def _query_wmi(
+        self, wmi_class: str, namespace: str, properties: Optional[Tuple[str, ...]] = None
+    ) -> List[Dict[str, Any]]:
         """Query using Python WMI module."""
         try:
-            import wmi
-            if namespace != "root\\cimv2":
-                c = wmi.WMI(namespace=namespace)
+            c = self.get_connection(namespace)
+
+            if properties:
+                items = c.query(f"SELECT {', '.join(properties)} FROM {wmi_class}")
             else:
-                c = self._wmi
+                items = getattr(c, wmi_class)()
 
             results = []
-            for item in getattr(c, wmi_class)():
+            for item in items:
                 obj_dict = {}
-                for prop in item.properties:
+                for prop in properties or item.properties:
                     try:
                         obj_dict[prop] = getattr(item, prop)
                     except Exception:
@@ -62,10 +117,19 @@ class WMIHelper:
         except Exception as e:
             return []
 
-    def _query_powershell(self, wmi_class: str) -> List[Dict[str, Any]]:
+    def _query_powershell(
+        self, wmi_class: str, properties: Optional[Tuple[str, ...]] = None
+    ) -> List[Dict[str, Any]]:
         """Fallback: Query using PowerShell."""
         try:
-            cmd = f'Get-CimInstance -ClassName {wmi_class} | ConvertTo-Json -Depth 3'
+            if properties:
+                prop_list = ",".join(properties)
+                cmd = (
+                    f'Get-CimInstance -ClassName {wmi_class} -Property {prop_list} | '
+                    f'Select-Object {prop_list} | ConvertTo-Json -Depth 3'
+                )
+            else:
+                cmd = f'Get-CimInstance -ClassName {wmi_class} | ConvertTo-Json -Depth 3'
             result = subprocess.run(
                 ['powershell', '-NoProfile', '-Command', cmd],
                 capture_output=True,
@@ -83,6 +147,60 @@ class WMIHelper:
         except Exception:
             return []
 
+    def query_many(self, wmi_classes: Tuple[str, ...], namespace: str = "root\\cimv2") -> List[List[Dict[str, Any]]]:
+        """
+        Query several WMI classes from one namespace.
+
+        With the WMI module this is the same as calling query() for each
+        class (they share the thread's connection). The PowerShell fallback
+        fetches all classes in a single PowerShell process, which saves a
+        process start per extra class.
+
+        Args:
+            wmi_classes: WMI class names
+            namespace: WMI namespace (default: root\\cimv2)
+
+        Returns:
+            One list of result dictionaries per class, in the given order
+        """
+        if self._wmi_available:
+            return [self.query(wmi_class, namespace) for wmi_class in wmi_classes]
+        return self._cached(
+            ("query_many", wmi_classes, namespace),
+            lambda: self._query_powershell_many(wmi_classes, namespace),
+            all
+        )
+
+    def _query_powershell_many(self, wmi_classes: Tuple[str, ...], namespace: str) -> List[List[Dict[str, Any]]]:
+        """Fallback: Query several classes in one PowerShell call."""
+        empty = [[] for _ in wmi_classes]
+        try:
+            class_list = ",".join(f"'{wmi_class}'" for wmi_class in wmi_classes)
+            cmd = (
+                f"$r = @{{}}; foreach ($c in @({class_list})) {{ "
+                f"$r[$c] = @(Get-CimInstance -Namespace '{namespace}' -ClassName $c -ErrorAction SilentlyContinue) }}; "
+                f"$r | ConvertTo-Json -Depth 4"
+            )
+            result = subprocess.run(
+                ['powershell', '-NoProfile', '-Command', cmd],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+
+            if result.returncode != 0 or not result.stdout.strip():
+                return empty
+
+            data = json.loads(result.stdout)
+            results = []
+            for wmi_class in wmi_classes:
+                items = data.get(wmi_class) or []
+                # Ensure it's always a list
+                results.append([items] if isinstance(items, dict) else items)
+            return results
+        except Exception:
+            return empty
+
     def query_single(self, wmi_class: str, namespace: str = "root\\cimv2") -> Optional[Dict[str, Any]]:
         """Query and return first result only."""
         results = self.query(wmi_class, namespace)
@@ -96,21 +214,52 @@ class WMIHelper:
         return default
 
 
+def init_com_thread():
+    """
+    Initialize COM for the calling thread.
+
+    Must run in a new thread before it makes WMI queries; use it as the
+    initializer of thread pools that query WMI.
+    """
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pass
+
+
 # Convenience functions
 _helper = None
+_helper_lock = threading.Lock()
 
 
 def get_wmi_helper() -> WMIHelper:
     """Get singleton WMI helper instance."""
     global _helper
     if _helper is None:
-        _helper = WMIHelper()
+        with _helper_lock:
+            if _helper is None:
+                _helper = WMIHelper()
     return _helper
 
 
-def wmi_query(wmi_class: str, namespace: str = "root\\cimv2") -> List[Dict[str, Any]]:
-    """Convenience function for WMI queries."""
-    return get_wmi_helper().query(wmi_class, namespace)
+def wmi_connection(namespace: str = "root\\cimv2"):
+    """Convenience function to get the shared WMI connection for a namespace."""
+    return get_wmi_helper().get_connection(namespace)
+
+
+def wmi_query(
+    wmi_class: str,
+    namespace: str = "root\\cimv2",
+    properties: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """Convenience function for WMI queries, optionally fetching only the given properties."""
+    return get_wmi_helper().query(wmi_class, namespace, tuple(properties) if properties else None)
+
+
+def wmi_multi_query(wmi_classes: List[str], namespace: str = "root\\cimv2") -> List[List[Dict[str, Any]]]:
+    """Convenience function to query several WMI classes from one namespace."""
+    return get_wmi_helper().query_many(tuple(wmi_classes), namespace)
 
 
 def wmi_get(wmi_class: str, property_name: str, default: Any = None) -> Any: